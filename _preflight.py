@@ -14,11 +14,14 @@ import hondana
 
 TAG_PATH = pathlib.Path("./hondana/extras/tags.json")
 REPORT_PATH = pathlib.Path("./hondana/extras/report_reasons.json")
+# cumulative microseconds `import hondana` may take, as reported by `python -X importtime`
+IMPORT_TIME_BUDGET = 100_000
 
 
 class ProgramNamespace(argparse.Namespace):
     tags: bool
     reports: bool
+    importtime: bool
 
     def _parsed(self, *, _all: bool = False) -> bool:
         """This quick cheat only works if the `dest` of the params matches the annotations.
@@ -36,6 +39,31 @@ parser.add_argument("-t", "--tags", action="store_true", dest="tags", help="Whet
 parser.add_argument(
     "-r", "--reports", action="store_true", dest="reports", help="Whether to run the 'update report reasons' action."
 )
+parser.add_argument(
+    "-i",
+    "--importtime",
+    action="store_true",
+    dest="importtime",
+    help="Whether to run the 'import time' benchmark.",
+)
+
+
+def __import_time() -> int:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import hondana"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    # lines are formatted as `import time: self [us] | cumulative | imported package`
+    for line in proc.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "hondana":
+            return int(cumulative)
+
+    msg = "Could not find `hondana` in the import time output."
+    raise RuntimeError(msg)
 
 
 async def __update_tags(client: hondana.Client, /) -> int:
@@ -62,6 +90,15 @@ async def main(args: ProgramNamespace) -> None:
         msg = "At least one argument must be specified."
         raise RuntimeError(msg)
 
+    if args.importtime:
+        taken = __import_time()
+        print(f"`import hondana` took {taken}us (budget {IMPORT_TIME_BUDGET}us).")  # noqa: T201
+        if taken > IMPORT_TIME_BUDGET:
+            msg = "Import time budget exceeded."
+            raise RuntimeError(msg)
+        if not (args.tags or args.reports):
+            return
+
     client = hondana.Client()
 
     if args.tags:
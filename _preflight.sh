@@ -59,6 +59,10 @@ preflight_reports() {
     python _preflight.py -r
 }
 
+preflight_importtime() {
+    python _preflight.py -i
+}
+
 run_pyright(){
     pyright
     pyright --ignoreexternal --verifytypes "${PROJECT}"
@@ -85,6 +89,7 @@ build_project() {
     api_diff
     preflight_tags
     preflight_reports
+    preflight_importtime
     run_pyright
     build_docs
     run_tests
@@ -29,27 +29,186 @@ __copyright__ = "Copyright 2021-present AbstractUmbra"
 __version__ = "3.7.5"
 
 import logging
-from typing import Literal, NamedTuple
-
-from . import query as query, types_ as types_, utils as utils
-from .artist import *
-from .author import *
-from .chapter import *
-from .client import *
-from .collections import *
-from .cover import *
-from .custom_list import *
-from .enums import *
-from .errors import *
-from .forums import *
-from .legacy import *
-from .manga import *
-from .relationship import *
-from .report import *
-from .scanlator_group import *
-from .tags import *
-from .user import *
-from .utils import MANGA_TAGS as MANGA_TAGS, MANGADEX_URL_REGEX as MANGADEX_URL_REGEX
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+if TYPE_CHECKING:
+    from . import query as query, types_ as types_, utils as utils
+    from .artist import *
+    from .author import *
+    from .chapter import *
+    from .client import *
+    from .collections import *
+    from .cover import *
+    from .custom_list import *
+    from .enums import *
+    from .errors import *
+    from .forums import *
+    from .legacy import *
+    from .manga import *
+    from .pool import *
+    from .relationship import *
+    from .report import *
+    from .scanlator_group import *
+    from .store import *
+    from .tags import *
+    from .transforms import *
+    from .uploads import *
+    from .user import *
+    from .utils import MANGA_TAGS as MANGA_TAGS, MANGADEX_URL_REGEX as MANGADEX_URL_REGEX
+    from .watchdog import *
+
+# Public names are imported from their submodule on first access, so `import hondana` stays cheap.
+# This must be kept in sync with each submodule's `__all__` (tests/test_import.py checks this).
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    "artist": ("Artist",),
+    "author": ("Author",),
+    "chapter": (
+        "Chapter",
+        "ChapterAtHome",
+        "ChapterStatistics",
+        "ChapterUpload",
+        "PreviouslyReadChapter",
+        "UploadData",
+        "UploadImageReport",
+    ),
+    "client": ("Client",),
+    "collections": (
+        "AuthorCollection",
+        "ChapterFeed",
+        "ChapterReadHistoryCollection",
+        "CoverCollection",
+        "CustomListCollection",
+        "LegacyMappingCollection",
+        "MangaCollection",
+        "MangaRelationCollection",
+        "ReportCollection",
+        "ScanlatorGroupCollection",
+        "UserCollection",
+        "UserReportCollection",
+    ),
+    "cover": (
+        "Cover",
+        "CoverCache",
+    ),
+    "custom_list": ("CustomList",),
+    "enums": (
+        "AuthorReportReason",
+        "ChapterReportReason",
+        "ContentRating",
+        "CustomListVisibility",
+        "ForumThreadType",
+        "MangaRelationType",
+        "MangaReportReason",
+        "MangaState",
+        "MangaStatus",
+        "PublicationDemographic",
+        "ReadingStatus",
+        "ReportCategory",
+        "ReportReason",
+        "ReportStatus",
+        "ScanlationGroupReportReason",
+        "UserReportReason",
+    ),
+    "errors": (
+        "APIException",
+        "AuthenticationRequired",
+        "BadRequest",
+        "Forbidden",
+        "MangaDexServerError",
+        "NotFound",
+        "PreviousAPIVersionRequest",
+        "RefreshTokenFailure",
+        "TermsOfServiceNotAccepted",
+        "Unauthorized",
+        "UploadInProgress",
+        "UploadIncomplete",
+        "UploadValidationError",
+    ),
+    "forums": (
+        "ChapterComments",
+        "ForumThread",
+        "MangaComments",
+        "ScanlatorGroupComments",
+    ),
+    "legacy": ("LegacyItem",),
+    "manga": (
+        "Manga",
+        "MangaLibraryState",
+        "MangaRating",
+        "MangaRelation",
+        "MangaStatistics",
+    ),
+    "pool": (
+        "ClientCredentials",
+        "ClientPool",
+    ),
+    "relationship": ("Relationship",),
+    "report": (
+        "Report",
+        "ReportDetails",
+        "UserReport",
+    ),
+    "scanlator_group": (
+        "ScanlatorGroup",
+        "ScanlatorGroupStatistics",
+    ),
+    "store": (
+        "EntityStore",
+        "FeedWatermark",
+        "JSONSyncStorage",
+        "PageStore",
+        "SQLiteSyncStorage",
+        "SyncStorage",
+    ),
+    "tags": (
+        "QueryTags",
+        "Tag",
+        "TagRegistry",
+    ),
+    "transforms": (
+        "ImageTransform",
+        "PillowTransform",
+        "transform_images",
+    ),
+    "uploads": (
+        "ChapterUploadSpec",
+        "UploadQueue",
+    ),
+    "user": ("User",),
+    "utils": (
+        "MANGA_TAGS",
+        "MANGADEX_URL_REGEX",
+    ),
+    "watchdog": (
+        "BlockingReport",
+        "LoopWatchdog",
+        "current_operation",
+        "operation",
+    ),
+}
+_LAZY_SUBMODULES: tuple[str, ...] = ("query", "types_", "utils")
+_LAZY_ATTRIBUTES: dict[str, str] = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+__all__ = ("version_info", *_LAZY_SUBMODULES, *_LAZY_ATTRIBUTES)  # noqa: PLE0604 # pyright: ignore[reportUnsupportedDunderAll] # these are resolved lazily
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        value = _import_module(f"{__name__}.{name}")
+    elif (module := _LAZY_ATTRIBUTES.get(name)) is not None:
+        value = getattr(_import_module(f"{__name__}.{module}"), name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    # cache it as a real module global so subsequent lookups skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
 
 class VersionInfo(NamedTuple):
@@ -64,4 +223,4 @@ version_info: VersionInfo = VersionInfo(major=3, minor=7, micro=5, releaselevel=
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-del logging, NamedTuple, Literal, VersionInfo
+del logging, NamedTuple, Literal, TYPE_CHECKING, VersionInfo
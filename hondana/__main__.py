@@ -22,14 +22,29 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
 import importlib.metadata
+import pathlib
 import platform
+import re
 import sys
+import time
+from typing import TYPE_CHECKING, Literal
 
 import aiohttp
 
 import hondana
+from hondana.enums import Order
+from hondana.query import FeedOrderQuery
+from hondana.utils import MANGADEX_URL_REGEX
+
+if TYPE_CHECKING:
+    from hondana.types_.common import LanguageCode
+
+_UUID_REGEX: re.Pattern[str] = re.compile(r"[a-z0-9]{8}\-[a-z0-9]{4}\-[a-z0-9]{4}\-[a-z0-9]{4}\-[a-z0-9]{12}")
 
 
 def show_version() -> None:
@@ -56,12 +71,237 @@ def show_version() -> None:
     print("\n".join(entries))  # noqa: T201 # this is intended
 
 
+def parse_target(target: str, /) -> tuple[Literal["manga", "chapter"] | None, str]:
+    """Parses a download target into its type (if known) and ID.
+
+    Targets can be MangaDex title or chapter URLs, or bare IDs (which have no known type).
+
+    Raises
+    ------
+    ValueError
+        The target is not a MangaDex ID or a title/chapter URL.
+
+    Returns
+    -------
+    Tuple[Optional[Literal["manga", "chapter"]], :class:`str`]
+    """
+    if match := MANGADEX_URL_REGEX.search(target):
+        if match["type"] == "title":
+            return "manga", match["ID"]
+        if match["type"] == "chapter":
+            return "chapter", match["ID"]
+    elif _UUID_REGEX.fullmatch(target.strip().lower()):
+        return None, target.strip().lower()
+
+    msg = f"{target!r} is not a MangaDex ID, title URL or chapter URL."
+    raise ValueError(msg)
+
+
+class Throughput:
+    """Tracks and renders the live download throughput."""
+
+    __slots__ = (
+        "_last_render",
+        "bytes",
+        "pages",
+        "started",
+    )
+
+    def __init__(self) -> None:
+        self.pages: int = 0
+        self.bytes: int = 0
+        self.started: float = time.perf_counter()
+        self._last_render: float = 0.0
+
+    def __call__(self, _: pathlib.Path, size: int, /) -> None:
+        """Records a downloaded page, for use as the ``on_page`` callback of :meth:`hondana.Chapter.download`."""
+        self.pages += 1
+        self.bytes += size
+
+        now = time.perf_counter()
+        if now - self._last_render >= 0.25:
+            self._last_render = now
+            self.render(end="")
+
+    def format(self) -> str:
+        """Formats the current totals and rates.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return (
+            f"{self.pages} pages, {self.bytes / 1_000_000:.2f} MB in {elapsed:.1f}s "
+            f"({self.pages / elapsed:.2f} pages/s, {self.bytes / 1_000_000 / elapsed:.2f} MB/s)"
+        )
+
+    def render(self, *, end: str = "\n") -> None:
+        """Renders the current totals and rates over the current line of stderr."""
+        sys.stderr.write(f"\r\x1b[2K{self.format()}{end}")
+        sys.stderr.flush()
+
+
+async def _resolve_chapters(
+    client: hondana.Client,
+    targets: list[str],
+    *,
+    languages: list[LanguageCode] | None,
+    groups: set[str],
+) -> list[hondana.Chapter]:
+    chapters: list[hondana.Chapter] = []
+    for target in targets:
+        type_, id_ = parse_target(target)
+
+        if type_ != "manga":
+            try:
+                chapters.append(await client.get_chapter(id_))
+            except hondana.NotFound:
+                if type_ == "chapter":
+                    raise
+            else:
+                continue
+
+        feed = await client.manga_feed(
+            id_,
+            limit=None,
+            translated_language=languages,
+            order=FeedOrderQuery(volume=Order.ascending, chapter=Order.ascending),
+        )
+        chapters.extend(feed.chapters)
+
+    ret: list[hondana.Chapter] = []
+    for chapter in chapters:
+        if languages and chapter.translated_language not in languages:
+            continue
+        if groups and not groups.intersection(group.id for group in chapter.scanlator_groups or []):
+            continue
+        if chapter.external_url or not chapter.pages:
+            continue
+        ret.append(chapter)
+
+    return ret
+
+
+async def _download(args: argparse.Namespace) -> None:
+    output: pathlib.Path = args.output
+    progress = Throughput()
+
+    async with hondana.Client() as client:
+        chapters = await _resolve_chapters(client, args.targets, languages=args.language, groups=set(args.group))
+        sys.stderr.write(f"Downloading {len(chapters)} chapter(s) to {output}\n")
+
+        semaphore = asyncio.Semaphore(max(args.chapter_concurrency, 1))
+
+        async def download(chapter: hondana.Chapter) -> None:
+            path = (
+                output
+                / (chapter.manga_id or "unknown")
+                / chapter.translated_language
+                / f"{chapter.chapter or 0} - {chapter.id}"
+            )
+            async with semaphore:
+                await chapter.download(
+                    path,
+                    data_saver=args.data_saver,
+                    ssl=args.ssl,
+                    concurrency=args.page_concurrency,
+                    resume=args.resume,
+                    on_page=progress,
+                )
+
+        await asyncio.gather(*(download(chapter) for chapter in chapters))
+
+    progress.render()
+
+
 def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
     parser = argparse.ArgumentParser(prog="hondana", description="Tools for helping with Hondana")
     parser.add_argument("-v", "--version", action="store_true", help="shows the wrapper version")
 
     parser.set_defaults(func=core)
 
+    subparsers = parser.add_subparsers(title="commands")
+
+    download_parser = subparsers.add_parser("download", help="bulk download manga or chapters")
+    download_parser.add_argument("targets", nargs="+", help="manga/chapter IDs or MangaDex title/chapter URLs")
+    download_parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        default=pathlib.Path(),
+        help="the directory to download into, defaults to the current directory",
+    )
+    download_parser.add_argument(
+        "-l",
+        "--language",
+        action="append",
+        default=None,
+        help="only download chapters translated into this language, can be given multiple times",
+    )
+    download_parser.add_argument(
+        "-g",
+        "--group",
+        action="append",
+        default=[],
+        help="only download chapters by this scanlator group ID, can be given multiple times",
+    )
+    download_parser.add_argument(
+        "-c",
+        "--chapter-concurrency",
+        type=int,
+        default=2,
+        help="how many chapters to download at once, defaults to 2",
+    )
+    download_parser.add_argument(
+        "-p",
+        "--page-concurrency",
+        type=int,
+        default=4,
+        help="how many pages of each chapter to download at once, defaults to 4",
+    )
+    download_parser.add_argument("--data-saver", action="store_true", help="download the smaller, compressed images")
+    download_parser.add_argument("--ssl", action="store_true", help="only use MD@H nodes on port 443")
+    download_parser.add_argument(
+        "--no-resume",
+        action="store_false",
+        dest="resume",
+        help="download every page, even those already downloaded",
+    )
+    download_parser.set_defaults(func=download)
+
+    bench_parser = subparsers.add_parser("bench", help="benchmark the library against a local stub of the API")
+    bench_parser.add_argument(
+        "scenarios",
+        nargs="*",
+        metavar="scenario",
+        help="the scenarios to run, defaults to all of them (see --list)",
+    )
+    bench_parser.add_argument("--list", action="store_true", help="list the scenarios and exit")
+    bench_parser.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=50,
+        help="how many operations to run per scenario, defaults to 50",
+    )
+    bench_parser.add_argument("--pages", type=int, default=20, help="pages per chapter, defaults to 20")
+    bench_parser.add_argument(
+        "--page-size",
+        type=int,
+        default=256 * 1024,
+        help="the size of each page image in bytes, defaults to 262144",
+    )
+    bench_parser.add_argument(
+        "--json",
+        nargs="?",
+        const="-",
+        default=None,
+        metavar="PATH",
+        help="write the results as JSON to PATH (or stdout if no path is given) for comparing runs",
+    )
+    bench_parser.set_defaults(func=bench)
+
     return parser, parser.parse_args()
 
 
@@ -70,9 +310,41 @@ def core(_: argparse.ArgumentParser, args: argparse.Namespace) -> None:
         show_version()
 
 
+def download(_: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    asyncio.run(_download(args))
+
+
+def bench(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    from hondana import _bench  # noqa: PLC0415 # pulls in `aiohttp.web` and the stub API, so only when benchmarking
+
+    if args.list:
+        print("\n".join(_bench.SCENARIOS))  # noqa: T201 # this is intended
+        return
+
+    scenarios: list[str] = args.scenarios or list(_bench.SCENARIOS)
+    if unknown := [name for name in scenarios if name not in _bench.SCENARIOS]:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    results = asyncio.run(
+        _bench.run(scenarios, iterations=max(args.iterations, 1), pages=args.pages, page_size=args.page_size),
+    )
+
+    if args.json is None:
+        print(_bench.format_results(results))  # noqa: T201 # this is intended
+        return
+
+    output = _bench.results_to_json(results, iterations=args.iterations)
+    if args.json == "-":
+        print(output)  # noqa: T201 # this is intended
+    else:
+        pathlib.Path(args.json).write_text(output, encoding="utf-8")
+        print(_bench.format_results(results))  # noqa: T201 # this is intended
+
+
 def main() -> None:
     parser, args = parse_args()
     args.func(parser, args)
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,646 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import datetime
+import json
+import pathlib
+import statistics
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import BodyPartReader, web
+
+from . import version_info
+from .client import Client
+from .manga import Manga
+from .utils import AuthRoute, Route, decode_json, from_json
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from concurrent.futures import Executor
+
+    from .types_.chapter import ChapterResponse
+    from .types_.manga import MangaResponse
+
+# This module backs `python -m hondana bench` and is not part of the public API.
+__all__ = ()
+
+_NAMESPACE = uuid.UUID("5a1ad6c4-0f3e-4b4c-9d44-2b3f1c8a7e10")
+_TIMESTAMP = "2024-01-01T00:00:00+00:00"
+_PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+def _id(kind: str, index: int, /) -> str:
+    return str(uuid.uuid5(_NAMESPACE, f"{kind}-{index}"))
+
+
+def _token(lifetime: int, /) -> str:
+    now = int(time.time())
+    # `Token._parse` doesn't strip padding, so keep the payload a multiple of 3 bytes
+    claims = json.dumps({"iat": now, "exp": now + lifetime, "pad": ""}).encode()
+    claims += b" " * (-len(claims) % 3)
+    return f"header.{base64.b64encode(claims).decode()}.signature"
+
+
+def _json_response(data: Any, /, *, status: int = 200) -> web.Response:
+    # the library expects exactly `application/json`, without the charset `web.json_response` adds
+    return web.Response(body=json.dumps(data).encode(), status=status, headers={"Content-Type": "application/json"})
+
+
+def manga_payload(index: int, /) -> MangaResponse:
+    """Builds a synthetic manga payload.
+
+    Returns
+    -------
+    :class:`~hondana.types_.manga.MangaResponse`
+    """
+    payload: dict[str, Any] = {
+        "id": _id("manga", index),
+        "type": "manga",
+        "attributes": {
+            "title": {"en": f"Benchmark Manga {index}"},
+            "altTitles": [{"ja": f"ベンチマーク {index}"}, {"en": f"Bench {index}"}],
+            "description": {"en": "A synthetic manga used for benchmarking."},
+            "isLocked": False,
+            "links": {"al": str(index), "mu": str(index)},
+            "originalLanguage": "ja",
+            "lastVolume": None,
+            "lastChapter": None,
+            "publicationDemographic": "shounen",
+            "status": "ongoing",
+            "year": 2020,
+            "contentRating": "safe",
+            "tags": [
+                {
+                    "id": _id("tag", tag),
+                    "type": "tag",
+                    "attributes": {"name": {"en": f"Tag {tag}"}, "description": {}, "group": "genre", "version": 1},
+                    "relationships": [],
+                }
+                for tag in range(index % 5, index % 5 + 4)
+            ],
+            "state": "published",
+            "chapterNumbersResetOnNewVolume": False,
+            "createdAt": _TIMESTAMP,
+            "updatedAt": _TIMESTAMP,
+            "version": 1,
+            "availableTranslatedLanguages": ["en", "ja"],
+            "latestUploadedChapter": _id("chapter", index),
+        },
+        "relationships": [
+            {"id": _id("author", index % 100), "type": "author"},
+            {"id": _id("author", index % 100), "type": "artist"},
+            {"id": _id("cover", index), "type": "cover_art"},
+        ],
+    }
+    return payload  # pyright: ignore[reportReturnType] # this is built to match the type
+
+
+def chapter_payload(chapter_id: str, /, *, pages: int, attributes: dict[str, Any] | None = None) -> ChapterResponse:
+    """Builds a synthetic chapter payload.
+
+    Returns
+    -------
+    :class:`~hondana.types_.chapter.ChapterResponse`
+    """
+    payload: dict[str, Any] = {
+        "id": chapter_id,
+        "type": "chapter",
+        "attributes": {
+            "volume": "1",
+            "chapter": "1",
+            "title": "Benchmark Chapter",
+            "translatedLanguage": "en",
+            "externalUrl": None,
+            "isUnavailable": False,
+            "publishAt": _TIMESTAMP,
+            "readableAt": _TIMESTAMP,
+            "createdAt": _TIMESTAMP,
+            "updatedAt": _TIMESTAMP,
+            "pages": pages,
+            "version": 1,
+            **(attributes or {}),
+        },
+        "relationships": [
+            {"id": _id("manga", 0), "type": "manga", "attributes": manga_payload(0)["attributes"]},
+            {
+                "id": _id("group", 0),
+                "type": "scanlation_group",
+                "attributes": {
+                    "name": "Benchmark Scans",
+                    "altNames": [],
+                    "locked": False,
+                    "website": None,
+                    "ircServer": None,
+                    "ircChannel": None,
+                    "discord": None,
+                    "contactEmail": None,
+                    "description": None,
+                    "twitter": None,
+                    "mangaUpdates": None,
+                    "focusedLanguages": ["en"],
+                    "official": False,
+                    "verified": False,
+                    "inactive": False,
+                    "publishDelay": None,
+                    "exLicensed": False,
+                    "createdAt": _TIMESTAMP,
+                    "updatedAt": _TIMESTAMP,
+                    "version": 1,
+                },
+            },
+            {"id": _id("user", 0), "type": "user", "attributes": {"username": "bench", "roles": [], "version": 1}},
+        ],
+    }
+    return payload  # pyright: ignore[reportReturnType] # this is built to match the type
+
+
+class StubAPI:
+    """An in-process stand-in for the MangaDex API, MD@H nodes and auth server.
+
+    It serves synthetic payloads for pagination, bulk chapter fetches, chapter downloads and chapter uploads,
+    with the rate-limit headers the library reads on every response.
+
+    Parameters
+    ----------
+    manga_total: :class:`int`
+        The total number of manga reported when paginating.
+    pages: :class:`int`
+        The number of pages in each chapter.
+    page_size: :class:`int`
+        The size, in bytes, of each page image.
+    """
+
+    __slots__ = (
+        "_runner",
+        "base_url",
+        "manga_total",
+        "page_image",
+        "pages",
+    )
+
+    def __init__(self, *, manga_total: int = 10_000, pages: int = 20, page_size: int = 256 * 1024) -> None:
+        self.manga_total: int = manga_total
+        self.pages: int = pages
+        self.page_image: bytes = _PNG_HEADER + bytes(max(page_size - len(_PNG_HEADER), 0))
+        self._runner: web.AppRunner | None = None
+        self.base_url: str = ""
+
+    async def __aenter__(self) -> str:
+        return await self.start()
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    def _application(self) -> web.Application:
+        app = web.Application(middlewares=[self._headers], client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/auth/token", self._token)
+        app.router.add_get("/manga", self._manga_list)
+        app.router.add_get("/chapter", self._chapter_list)
+        app.router.add_get("/chapter/{chapter_id}", self._chapter)
+        app.router.add_get("/at-home/server/{chapter_id}", self._at_home)
+        app.router.add_get("/mdah/{quality}/{hash}/{filename}", self._serve_page)
+        app.router.add_get("/upload", self._upload_session)
+        app.router.add_post("/upload/begin", self._upload_begin)
+        app.router.add_post("/upload/{session_id}", self._upload_images)
+        app.router.add_post("/upload/{session_id}/commit", self._upload_commit)
+        return app
+
+    async def start(self) -> str:
+        """|coro|
+
+        Starts the stub on a random local port.
+
+        Returns
+        -------
+        :class:`str`
+            The base URL of the stub.
+        """
+        self._runner = web.AppRunner(self._application(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stops the stub.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _headers(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        response = await handler(request)
+        response.headers["x-request-id"] = str(uuid.uuid4())
+        response.headers["x-ratelimit-limit"] = "100000"
+        response.headers["x-ratelimit-remaining"] = "99999"
+        response.headers["x-ratelimit-retry-after"] = str(int(time.time()) + 60)
+        return response
+
+    @staticmethod
+    def _collection(data: list[Any], *, limit: int, offset: int, total: int) -> web.Response:
+        return _json_response(
+            {"result": "ok", "response": "collection", "data": data, "limit": limit, "offset": offset, "total": total},
+        )
+
+    async def _token(self, _: web.Request) -> web.Response:
+        return _json_response(
+            {
+                "access_token": _token(900),
+                "refresh_token": _token(86400),
+                "expires_in": 900,
+                "refresh_expires_in": 86400,
+                "token_type": "Bearer",
+                "not-before-policy": 0,
+                "session_state": "",
+                "scope": "",
+                "client_type": "personal",
+            },
+        )
+
+    async def _manga_list(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 10))
+        offset = int(request.query.get("offset", 0))
+        end = min(offset + limit, self.manga_total)
+        data = [manga_payload(index) for index in range(offset, end)]
+        return self._collection(data, limit=limit, offset=offset, total=self.manga_total)
+
+    async def _chapter_list(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 10))
+        ids = request.query.getall("ids[]", [])
+        data = [chapter_payload(chapter_id, pages=self.pages) for chapter_id in ids[:limit]]
+        return self._collection(data, limit=limit, offset=0, total=len(ids))
+
+    async def _chapter(self, request: web.Request) -> web.Response:
+        chapter_id = request.match_info["chapter_id"]
+        return _json_response(
+            {"result": "ok", "response": "entity", "data": chapter_payload(chapter_id, pages=self.pages)},
+        )
+
+    async def _at_home(self, request: web.Request) -> web.Response:
+        pages = [f"{number}-{request.match_info['chapter_id']}.png" for number in range(1, self.pages + 1)]
+        return _json_response(
+            {
+                "result": "ok",
+                "baseUrl": f"{self.base_url}/mdah",
+                "chapter": {"hash": "benchmark", "data": pages, "dataSaver": pages},
+            },
+        )
+
+    async def _serve_page(self, _: web.Request) -> web.Response:
+        return web.Response(body=self.page_image, content_type="image/png")
+
+    async def _upload_session(self, _: web.Request) -> web.Response:
+        error = {
+            "id": str(uuid.uuid4()),
+            "status": 404,
+            "title": "not_found",
+            "detail": "No upload session",
+            "context": None,
+        }
+        return _json_response({"result": "error", "errors": [error]}, status=404)
+
+    async def _upload_begin(self, _: web.Request) -> web.Response:
+        attributes: dict[str, Any] = {"isCommitted": False, "isProcessed": False, "isDeleted": False, "version": 1}
+        session: dict[str, Any] = {
+            "id": str(uuid.uuid4()),
+            "type": "upload_session",
+            "attributes": attributes,
+            "relationships": [],
+        }
+        return _json_response({"result": "ok", "response": "entity", "data": session})
+
+    async def _upload_images(self, request: web.Request) -> web.Response:
+        files: list[dict[str, Any]] = []
+        reader = await request.multipart()
+        async for part in reader:
+            if not isinstance(part, BodyPartReader):
+                continue
+            size = len(await part.read())
+            attributes: dict[str, Any] = {
+                "originalFileName": part.name,
+                "fileHash": "",
+                "fileSize": size,
+                "mimeType": "image/png",
+                "source": "local",
+                "version": 1,
+            }
+            files.append({"id": str(uuid.uuid4()), "type": "upload_session_file", "attributes": attributes})
+
+        return _json_response({"result": "ok", "errors": [], "data": files})
+
+    async def _upload_commit(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        draft: dict[str, Any] = body["chapterDraft"]
+        chapter = chapter_payload(str(uuid.uuid4()), pages=len(body["pageOrder"]), attributes=draft)
+        return _json_response({"result": "ok", "response": "entity", "data": chapter})
+
+
+class ScenarioResult:
+    """The timings of a single benchmark scenario.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the scenario.
+    latencies: List[:class:`float`]
+        The latency, in seconds, of each operation.
+    items: :class:`int`
+        The number of items (manga, chapters, pages or images) processed.
+    bytes: :class:`int`
+        The number of bytes transferred, if applicable.
+    """
+
+    __slots__ = (
+        "bytes",
+        "items",
+        "latencies",
+        "max_stall",
+        "name",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.latencies: list[float] = []
+        self.items: int = 0
+        self.bytes: int = 0
+        self.max_stall: float = 0.0
+
+    def percentile(self, percent: int, /) -> float:
+        """Returns the given latency percentile, in seconds.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[percent - 1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the results as a JSON-compatible dictionary.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+        """
+        seconds = sum(self.latencies) or 1e-9
+        return {
+            "name": self.name,
+            "operations": len(self.latencies),
+            "items": self.items,
+            "bytes": self.bytes,
+            "seconds": seconds,
+            "items_per_second": self.items / seconds,
+            "megabytes_per_second": self.bytes / 1_000_000 / seconds,
+            "latency_ms": {
+                "mean": statistics.fmean(self.latencies) * 1000 if self.latencies else 0.0,
+                "p50": self.percentile(50) * 1000,
+                "p95": self.percentile(95) * 1000,
+                "p99": self.percentile(99) * 1000,
+            },
+            "max_loop_stall_ms": self.max_stall * 1000,
+        }
+
+
+_STALL_INTERVAL = 0.001
+
+
+async def _monitor_loop(result: ScenarioResult, /) -> None:
+    # the longest time the event loop went without running this task, past its own sleep
+    last = time.perf_counter()
+    while True:
+        await asyncio.sleep(_STALL_INTERVAL)
+        now = time.perf_counter()
+        result.max_stall = max(result.max_stall, now - last - _STALL_INTERVAL)
+        last = now
+
+
+async def _paginate(client: Client, stub: StubAPI, result: ScenarioResult, iterations: int) -> None:
+    pages = max(min(stub.manga_total, 10_000) // 100, 1)
+    for iteration in range(iterations):
+        start = time.perf_counter()
+        collection = await client.manga_list(limit=100, offset=(iteration % pages) * 100)
+        result.latencies.append(time.perf_counter() - start)
+        result.items += len(collection.manga)
+
+
+async def _bulk_get(client: Client, _: StubAPI, result: ScenarioResult, iterations: int) -> None:
+    for iteration in range(iterations):
+        ids = [_id("chapter", iteration * 100 + index) for index in range(100)]
+        start = time.perf_counter()
+        feed = await client.chapter_list(ids=ids, limit=100)
+        result.latencies.append(time.perf_counter() - start)
+        result.items += len(feed.chapters)
+
+
+async def _chapter_download(client: Client, _: StubAPI, result: ScenarioResult, iterations: int) -> None:
+    for iteration in range(iterations):
+        start = time.perf_counter()
+        chapter = await client.get_chapter(_id("chapter", iteration))
+        async for page in chapter.download_bytes(concurrency=4):
+            result.items += 1
+            result.bytes += len(page)
+        result.latencies.append(time.perf_counter() - start)
+
+
+async def _chapter_upload(client: Client, stub: StubAPI, result: ScenarioResult, iterations: int) -> None:
+    with tempfile.TemporaryDirectory(prefix="hondana-bench-") as directory:
+        images: list[pathlib.Path] = []
+        for number in range(1, stub.pages + 1):
+            path = pathlib.Path(directory) / f"{number}.png"
+            path.write_bytes(stub.page_image)
+            images.append(path)
+
+        for iteration in range(iterations):
+            start = time.perf_counter()
+            await client.upload_chapter(
+                _id("manga", 0),
+                chapter=str(iteration),
+                translated_language="en",
+                scanlator_groups=[],
+                accept_tos=True,
+                images=images,
+            )
+            result.latencies.append(time.perf_counter() - start)
+            result.items += len(images)
+            result.bytes += sum(image.stat().st_size for image in images)
+
+
+async def _model_parse(client: Client, _: StubAPI, result: ScenarioResult, iterations: int) -> None:
+    http = client._http  # pyright: ignore[reportPrivateUsage] # noqa: SLF001 # models are built directly from payloads here
+    for iteration in range(iterations):
+        payloads = [manga_payload(iteration * 100 + index) for index in range(100)]
+        start = time.perf_counter()
+        manga = [Manga(http, payload) for payload in payloads]
+        result.latencies.append(time.perf_counter() - start)
+        result.items += len(manga)
+
+
+def _decode_body() -> bytes:
+    return json.dumps({"result": "ok", "data": [manga_payload(index) for index in range(1000)]}).encode()
+
+
+async def _decode_in(
+    executor: Executor | None,
+    decode: Callable[[bytes], Any],
+    result: ScenarioResult,
+    iterations: int,
+) -> None:
+    body = _decode_body()
+    loop = asyncio.get_running_loop()
+    if executor is not None:
+        # start the workers before timing anything
+        await loop.run_in_executor(executor, decode, b"{}")
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        if executor is None:
+            decode(body)
+        else:
+            await loop.run_in_executor(executor, decode, body)
+        result.latencies.append(time.perf_counter() - start)
+        result.items += 1000
+        result.bytes += len(body)
+        # let the loop monitor see the stall before the next decode starts
+        await asyncio.sleep(_STALL_INTERVAL * 10)
+
+
+async def _decode_inline(_client: Client, _stub: StubAPI, result: ScenarioResult, iterations: int) -> None:
+    await _decode_in(None, from_json, result, iterations)
+
+
+async def _decode_threaded(_client: Client, _stub: StubAPI, result: ScenarioResult, iterations: int) -> None:
+    # this is what `HTTPClient` runs in a thread pool, see `HTTPClient._decode`
+    with ThreadPoolExecutor(1) as executor:
+        await _decode_in(executor, from_json, result, iterations)
+
+
+async def _decode_process(_client: Client, _stub: StubAPI, result: ScenarioResult, iterations: int) -> None:
+    with ProcessPoolExecutor(1) as executor:
+        await _decode_in(executor, decode_json, result, iterations)
+
+
+SCENARIOS: dict[str, Callable[[Client, StubAPI, ScenarioResult, int], Awaitable[None]]] = {
+    "paginate": _paginate,
+    "bulk_get": _bulk_get,
+    "chapter_download": _chapter_download,
+    "chapter_upload": _chapter_upload,
+    "model_parse": _model_parse,
+    "decode_inline": _decode_inline,
+    "decode_threaded": _decode_threaded,
+    "decode_process": _decode_process,
+}
+
+
+async def run(
+    scenarios: list[str],
+    *,
+    iterations: int,
+    pages: int = 20,
+    page_size: int = 256 * 1024,
+) -> list[ScenarioResult]:
+    """|coro|
+
+    Runs the named scenarios against a fresh :class:`StubAPI`.
+
+    Returns
+    -------
+    List[:class:`ScenarioResult`]
+    """
+    results: list[ScenarioResult] = []
+    original_bases = (Route.API_BASE_URL, AuthRoute.API_BASE_URL)
+
+    stub = StubAPI(pages=pages, page_size=page_size)
+    async with stub as base_url:
+        Route.API_BASE_URL = base_url
+        AuthRoute.API_BASE_URL = f"{base_url}/auth"
+        try:
+            async with Client(username="bench", password="bench", client_id="bench", client_secret="bench") as client:  # noqa: S106 # the stub accepts any credentials
+                for name in scenarios:
+                    result = ScenarioResult(name)
+                    monitor = asyncio.create_task(_monitor_loop(result))
+                    try:
+                        await SCENARIOS[name](client, stub, result, iterations)
+                    finally:
+                        monitor.cancel()
+                    results.append(result)
+        finally:
+            Route.API_BASE_URL, AuthRoute.API_BASE_URL = original_bases
+
+    return results
+
+
+def format_results(results: list[ScenarioResult], /) -> str:
+    """Formats results as a plain-text table.
+
+    Returns
+    -------
+    :class:`str`
+    """
+    header = (
+        f"{'scenario':<18}{'ops':>6}{'items/s':>12}{'MB/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'stall ms':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        data = result.to_dict()
+        latency = data["latency_ms"]
+        lines.append(
+            f"{data['name']:<18}{data['operations']:>6}{data['items_per_second']:>12.1f}{data['megabytes_per_second']:>10.2f}"
+            f"{latency['p50']:>10.2f}{latency['p95']:>10.2f}{latency['p99']:>10.2f}{data['max_loop_stall_ms']:>10.2f}",
+        )
+    return "\n".join(lines)
+
+
+def results_to_json(results: list[ScenarioResult], /, *, iterations: int) -> str:
+    """Serialises results for comparing runs.
+
+    Returns
+    -------
+    :class:`str`
+    """
+    payload = {
+        "created_at": datetime.datetime.now(datetime.UTC).isoformat(),
+        "hondana": f"{version_info.major}.{version_info.minor}.{version_info.micro}",
+        "iterations": iterations,
+        "scenarios": [result.to_dict() for result in results],
+    }
+    return json.dumps(payload, indent=4)
@@ -28,30 +28,53 @@ import asyncio
 import datetime
 import logging
 import pathlib
+import sys
 import time
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import aiohttp
 
-from .errors import APIException, NotFound, TermsOfServiceNotAccepted, UploadInProgress
+from .errors import (
+    APIException,
+    MangaDexServerError,
+    NotFound,
+    TermsOfServiceNotAccepted,
+    UploadInProgress,
+    UploadValidationError,
+)
 from .forums import ChapterComments
 from .manga import Manga
 from .query import ChapterIncludes, MangaIncludes, ScanlatorGroupIncludes
 from .scanlator_group import ScanlatorGroup
+from .transforms import transform_images
 from .user import User
 from .utils import (
+    MAX_IMAGE_DIMENSION,
+    MAX_UPLOAD_FILE_SIZE,
+    MAX_UPLOAD_FILES_PER_REQUEST,
+    MAX_UPLOAD_REQUEST_SIZE,
     MISSING,
+    UPLOAD_REQUEST_TARGET_SIZE,
+    InternTable,
     RelationshipResolver,
     Route,
     as_chunks,
+    as_sized_chunks,
     cached_slot_property,
     clean_isoformat,
+    compact_relationships,
+    from_json,
+    get_image_dimensions,
+    get_image_mime_type,
     require_authentication,
+    to_json,
     upload_file_sort,
 )
+from .watchdog import operation
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Callable
+    from collections.abc import AsyncGenerator, Callable, Mapping
+    from concurrent.futures import Executor
     from os import PathLike
     from types import TracebackType
     from typing import Self
@@ -59,7 +82,15 @@ if TYPE_CHECKING:
     from aiohttp import ClientResponse
 
     from .http import HTTPClient
-    from .types_.chapter import ChapterResponse, GetAtHomeChapterResponse, GetAtHomeResponse, GetSingleChapterResponse
+    from .store import PageStore
+    from .transforms import ImageTransform
+    from .types_.chapter import (
+        ChapterAttributesResponse,
+        ChapterResponse,
+        GetAtHomeChapterResponse,
+        GetAtHomeResponse,
+        GetSingleChapterResponse,
+    )
     from .types_.common import LanguageCode
     from .types_.errors import ErrorType
     from .types_.manga import MangaResponse
@@ -78,6 +109,7 @@ __all__ = (
     "ChapterUpload",
     "PreviouslyReadChapter",
     "UploadData",
+    "UploadImageReport",
 )
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -112,6 +144,11 @@ class Chapter:
         with minimal data if this Chapter was requested as part of a feed.
         The reason is that the ``Chapter.relationships["manga"].relationships`` key is null
         the API response during feed requests to avoid potential recursive data.
+
+    .. note::
+        When the client was created with ``compact_models=True`` the raw payload is not retained and relationships
+        are reduced to their IDs, so :attr:`manga`, :attr:`scanlator_groups` and :attr:`uploader` return ``None``
+        unless set or fetched. Use :meth:`to_payload` to rebuild the payload.
     """
 
     __slots__ = (
@@ -144,9 +181,14 @@ class Chapter:
 
     def __init__(self, http: HTTPClient, payload: ChapterResponse) -> None:
         self._http = http
-        self._data = payload
-        self._attributes = self._data["attributes"]
+        self._data: ChapterResponse | None = payload
+        self._attributes: ChapterAttributesResponse | None = self._data["attributes"]
         relationships: list[RelationshipResponse] = self._data.pop("relationships", [])
+        intern_table: InternTable | None = getattr(http, "intern_table", None)
+        if intern_table is not None:
+            # only values which repeat across entities are interned, as the table holds everything it is given
+            intern_table.update(payload, "type")  # pyright: ignore[reportArgumentType] # TypedDicts are mutable mappings
+            intern_table.update(self._attributes, "translatedLanguage", "volume", "chapter")  # pyright: ignore[reportArgumentType] # TypedDicts are mutable mappings
         self.id: str = self._data["id"]
         self.title: str | None = self._attributes["title"]
         self.volume: str | None = self._attributes["volume"]
@@ -161,19 +203,27 @@ class Chapter:
         self._published_at = self._attributes["publishAt"]
         self._readable_at = self._attributes["readableAt"]
         self._stats: ChapterStatistics | None = None
-        self._manga_relationship: MangaResponse = RelationshipResolver(relationships, "manga").pop(
-            with_fallback=False,
-            remove_empty=True,
-        )
+        self._manga_relationship: MangaResponse = RelationshipResolver(
+            relationships,
+            "manga",
+            intern_table=intern_table,
+        ).pop(with_fallback=False, remove_empty=True)
         self._scanlator_group_relationships: list[ScanlationGroupResponse] = RelationshipResolver(
             relationships,
             "scanlation_group",
+            intern_table=intern_table,
         ).resolve(with_fallback=False, remove_empty=True)
-        self._uploader_relationship: UserResponse = RelationshipResolver(relationships, "user").pop(remove_empty=True)
+        self._uploader_relationship: UserResponse = RelationshipResolver(
+            relationships,
+            "user",
+            intern_table=intern_table,
+        ).pop(remove_empty=True)
         self._at_home_url: str | None = None
         self.__uploader: User | None = None
         self.__parent: Manga | None = None
         self.__scanlator_groups: list[ScanlatorGroup] | None = None
+        if getattr(http, "compact_models", False):
+            self._compact()
 
     def __repr__(self) -> str:
         return f"<Chapter id={self.id!r} title={self.title!r}>"
@@ -200,6 +250,55 @@ class Chapter:
         """
         return self._stats
 
+    def _compact(self) -> None:
+        self._data = None
+        self._attributes = None
+        self._scanlator_group_relationships = compact_relationships(self._scanlator_group_relationships)
+        if self._manga_relationship:
+            self._manga_relationship = compact_relationships([self._manga_relationship])[0]
+        if self._uploader_relationship:
+            self._uploader_relationship = compact_relationships([self._uploader_relationship])[0]
+
+    def to_payload(self) -> ChapterResponse:
+        """
+        Rebuilds the API payload of this chapter from its parsed fields.
+
+        Relationships are included as they are currently held, so they will only be
+        ``id`` and ``type`` stubs for compacted models.
+
+        Returns
+        -------
+        :class:`~hondana.types_.chapter.ChapterResponse`
+        """
+        attributes: ChapterAttributesResponse = {
+            "title": self.title,
+            "volume": self.volume,  # pyright: ignore[reportAssignmentType] # the API can send null here
+            "chapter": self.chapter,  # pyright: ignore[reportAssignmentType] # the API can send null here
+            "pages": self.pages,
+            "translatedLanguage": self.translated_language,
+            "externalUrl": self.external_url,
+            "isUnavailable": self.is_unavailable,
+            "version": self.version,
+            "createdAt": self._created_at,
+            "updatedAt": self._updated_at,
+            "publishAt": self._published_at,
+            "readableAt": self._readable_at,
+        }
+        return {
+            "id": self.id,
+            "type": "chapter",
+            "attributes": attributes,
+            "relationships": self._relationship_payloads(),
+        }
+
+    def _relationship_payloads(self) -> list[RelationshipResponse]:
+        relationships: list[RelationshipResponse] = [*self._scanlator_group_relationships]  # pyright: ignore[reportAssignmentType] # these are relationship payloads
+        if self._manga_relationship:
+            relationships.append(self._manga_relationship)  # pyright: ignore[reportArgumentType] # these are relationship payloads
+        if self._uploader_relationship:
+            relationships.append(self._uploader_relationship)  # pyright: ignore[reportArgumentType] # these are relationship payloads
+        return relationships
+
     def to_dict(self) -> dict[str, Any]:
         """
         Method to dump the chapter to a dictionary.
@@ -307,7 +406,7 @@ class Chapter:
         if self.__parent is not None:
             return self.__parent
 
-        if not self._manga_relationship:
+        if not self._manga_relationship or "attributes" not in self._manga_relationship:
             return None
 
         manga = Manga(self._http, self._manga_relationship)
@@ -348,7 +447,9 @@ class Chapter:
         if not self._scanlator_group_relationships:
             return None
 
-        fmt = [ScanlatorGroup(self._http, payload) for payload in self._scanlator_group_relationships]
+        fmt = [
+            ScanlatorGroup(self._http, payload) for payload in self._scanlator_group_relationships if "attributes" in payload
+        ]
 
         if not fmt:
             return None
@@ -372,7 +473,7 @@ class Chapter:
         if self.__uploader is not None:
             return self.__uploader
 
-        if not self._uploader_relationship:
+        if not self._uploader_relationship or "attributes" not in self._uploader_relationship:
             return None
 
         self.__uploader = User(self._http, self._uploader_relationship)
@@ -573,6 +674,47 @@ class Chapter:
         self._stats = stats
         return self.stats
 
+    async def _fetch_page(
+        self,
+        at_home_data: ChapterAtHome,
+        url: str,
+        /,
+        *,
+        data_saver: bool,
+        report: bool,
+    ) -> bytes | None:
+        route = Route(
+            "GET",
+            f"/{'data-saver' if data_saver else 'data'}/{at_home_data.hash}/{url}",
+            base=at_home_data.base_url,
+        )
+        LOGGER.debug("Attempting to download: %s", route.url)
+        start_req = time.monotonic()
+
+        response: tuple[bytes, ClientResponse] = await self._http.request(route)
+        data, page_resp = response
+
+        end_req = time.monotonic()
+        total_req_secs = end_req - start_req
+        LOGGER.debug("Downloaded: %s", route.url)
+
+        if report and at_home_data.base_url != "https://uploads.mangadex.org":
+            try:
+                await self._http.at_home_report(
+                    url=route.url,
+                    success=page_resp.status == 200,
+                    cached=page_resp.headers.get("X-Cache", "").lower().startswith("hit"),
+                    size=(page_resp.content_length or 0),
+                    duration=int(total_req_secs * 1000),
+                )
+            except APIException as err:
+                if 500 <= err.status_code < 600:
+                    # known Cloudflare error due to MD@H failing.
+                    LOGGER.exception("Reporting MD@H node has failed with handled status code: %s")
+                raise
+
+        return data if page_resp.status == 200 else None
+
     async def _pages(
         self,
         *,
@@ -581,56 +723,49 @@ class Chapter:
         data_saver: bool,
         ssl: bool,
         report: bool,
-    ) -> AsyncGenerator[tuple[bytes, str], None]:
-        at_home_data = await self.get_at_home(ssl=ssl)
-        self._at_home_url = at_home_data.base_url
-
-        pages = at_home_data.data_saver if data_saver else at_home_data.data
-        resolved_pages = pages[start:] if end is None else pages[start:end]
-        for i, url in enumerate(resolved_pages, start=1):  # noqa: B007 # it gets used in the outer scope
-            route = Route(
-                "GET",
-                f"/{'data-saver' if data_saver else 'data'}/{at_home_data.hash}/{url}",
-                base=self._at_home_url,
-            )
-            LOGGER.debug("Attempting to download: %s", route.url)
-            start_req = time.monotonic()
-
-            response: tuple[bytes, ClientResponse] = await self._http.request(route)
-            data, page_resp = response
-
-            end_req = time.monotonic()
-            total_req_secs = end_req - start_req
-            LOGGER.debug("Downloaded: %s", route.url)
-
-            if report and self._at_home_url != "https://uploads.mangadex.org":
-                try:
-                    await self._http.at_home_report(
-                        url=route.url,
-                        success=page_resp.status == 200,
-                        cached=page_resp.headers.get("X-Cache", "").lower().startswith("hit"),
-                        size=(page_resp.content_length or 0),
-                        duration=int(total_req_secs * 1000),
-                    )
-                except APIException as err:
-                    if 500 <= err.status_code < 600:
-                        # known Cloudflare error due to MD@H failing.
-                        LOGGER.exception("Reporting MD@H node has failed with handled status code: %s")
-                    raise
-
-            if page_resp.status != 200:
-                self._at_home_url = None
-                break
-            else:
-                yield data, url.rsplit(".")[-1]
-
-        else:
-            return
-
-        # This code path will only be reached if there was an error downloading any of the pages.
-        # It basically restarts the entire process starting from the page with errors.
-        async for page in self._pages(start=i, end=end, data_saver=data_saver, ssl=ssl, report=report):
-            yield page
+        concurrency: int = 1,
+        skip: Callable[[int, str], bool] | None = None,
+        at_home: ChapterAtHome | None = None,
+    ) -> AsyncGenerator[tuple[int, bytes, str], None]:
+        # yields the (0-indexed) page number, the page bytes and the page's MD@H file name, in page order.
+        # up to `concurrency` pages are requested at once.
+        # pages where `skip(number, file_name)` is truthy are not requested at all.
+        # `at_home` is used for the first attempt, if the caller already fetched it.
+        position = start
+        while True:
+            at_home_data = at_home or await self.get_at_home(ssl=ssl)
+            at_home = None
+            self._at_home_url = at_home_data.base_url
+
+            pages = at_home_data.data_saver if data_saver else at_home_data.data
+            stop = len(pages) if end is None else min(end, len(pages))
+            wanted = [
+                (number, pages[number])
+                for number in range(position, stop)
+                if skip is None or not skip(number, pages[number])
+            ]
+
+            failed_at: int | None = None
+            for chunk in as_chunks(wanted, max(concurrency, 1)):
+                results = await asyncio.gather(
+                    *(self._fetch_page(at_home_data, url, data_saver=data_saver, report=report) for _, url in chunk),
+                )
+                for (number, url), data in zip(chunk, results, strict=True):
+                    if data is None:
+                        failed_at = number
+                        break
+                    yield number, data, url
+
+                if failed_at is not None:
+                    break
+
+            if failed_at is None:
+                return
+
+            # This code path will only be reached if there was an error downloading any of the pages.
+            # It requests a new MD@H node and restarts the process starting from the page with errors.
+            self._at_home_url = None
+            position = failed_at
 
     async def download(
         self,
@@ -641,6 +776,9 @@ class Chapter:
         data_saver: bool = False,
         ssl: bool = False,
         report: bool = False,
+        concurrency: int = 1,
+        resume: bool = False,
+        on_page: Callable[[pathlib.Path, int], Any] | None = None,
     ) -> None:
         """|coro|
 
@@ -668,26 +806,44 @@ class Chapter:
             Whether to report success or failures to MangaDex per page download.
             The API guidelines ask us to do this, however MD@H nodes are currently inconsistent so it defaults to ``False``.
             Does not count towards your (user) rate-limits.
+        concurrency: :class:`int`
+            How many pages to request at once. Defaults to ``1``.
+        resume: :class:`bool`
+            Whether to skip pages which already exist in ``path``, i.e. from a previous interrupted download.
+            Defaults to ``False``.
+        on_page: Optional[Callable[[:class:`pathlib.Path`, :class:`int`], Any]]
+            A callable that is called with the path and size (in bytes) of each page once it has been written.
+            Pages skipped due to ``resume`` are not passed to it.
         """
         path = path or f"{self.chapter} - {self.title}"
         path_ = pathlib.Path(path)
         if not path_.exists():
             path_.mkdir(parents=True, exist_ok=True)
 
-        idx = 1
-        async for page_data, page_ext in self._pages(
+        def page_path(number: int, extension: str, /) -> pathlib.Path:
+            return path_ / f"{number - start_page + 1}.{extension}"
+
+        async for number, page_data, file_name in self._pages(
             start=start_page,
             end=end_page,
             data_saver=data_saver,
             ssl=ssl,
             report=report,
+            concurrency=concurrency,
+            skip=(lambda number, file_name: page_path(number, file_name.rsplit(".")[-1]).exists()) if resume else None,
         ):
-            download_path = path_ / f"{idx}.{page_ext}"
-            with download_path.open("wb") as f:
-                f.write(page_data)
-                LOGGER.info("Downloaded to: %s", download_path)
-                await asyncio.sleep(0)
-            idx += 1
+            download_path = page_path(number, file_name.rsplit(".")[-1])
+            # write to a temporary file first so an interrupted download never leaves a partial page to resume from
+            partial_path = download_path.with_name(f"{download_path.name}.part")
+            with operation("chapter.download"):
+                with partial_path.open("wb") as f:
+                    f.write(page_data)
+                partial_path.replace(download_path)
+            LOGGER.info("Downloaded to: %s", download_path)
+
+            if on_page is not None:
+                on_page(download_path, len(page_data))
+            await asyncio.sleep(0)
 
     async def download_bytes(
         self,
@@ -697,6 +853,7 @@ class Chapter:
         data_saver: bool = False,
         ssl: bool = False,
         report: bool = False,
+        concurrency: int = 1,
     ) -> AsyncGenerator[bytes, None]:
         """|coro|
 
@@ -724,15 +881,79 @@ class Chapter:
             Whether to report success or failures to MangaDex per page download.
             The API guidelines ask us to do this, however MD@H nodes are currently inconsistent so it defaults to ``False``.
             Does not count towards your (user) rate-limits.
+        concurrency: :class:`int`
+            How many pages to request at once. Pages are still yielded in order. Defaults to ``1``.
 
         Yields
         ------
         :class:`bytes`
             The bytes of each page.
         """
-        async for page_data, _ in self._pages(start=start_page, end=end_page, data_saver=data_saver, ssl=ssl, report=report):
+        async for _, page_data, _ in self._pages(
+            start=start_page,
+            end=end_page,
+            data_saver=data_saver,
+            ssl=ssl,
+            report=report,
+            concurrency=concurrency,
+        ):
             yield page_data
 
+    async def download_to_store(
+        self,
+        store: PageStore,
+        /,
+        *,
+        data_saver: bool = False,
+        ssl: bool = False,
+        report: bool = False,
+        concurrency: int = 1,
+    ) -> list[str]:
+        """|coro|
+
+        This method will download this chapter's pages into a :class:`~hondana.PageStore`, and index them under this
+        chapter's ID.
+
+        Pages which are already in the store, e.g. from an earlier or interrupted download, are not requested again.
+
+        Parameters
+        ----------
+        store: :class:`~hondana.PageStore`
+            The store to download the pages into.
+        data_saver: :class:`bool`
+            Whether to use the smaller (and poorer quality) images. Defaults to ``False``.
+        ssl: :class:`bool`
+            Whether to request an SSL @Home link from MangaDex. Defaults to ``False``.
+        report: :class:`bool`
+            Whether to report success or failures to MangaDex per page download. Defaults to ``False``.
+        concurrency: :class:`int`
+            How many pages to request at once. Defaults to ``1``.
+
+        Returns
+        -------
+        List[:class:`str`]
+            The keys of this chapter's pages, in page order.
+        """
+        at_home = await self.get_at_home(ssl=ssl)
+        files = at_home.data_saver if data_saver else at_home.data
+        keys = [store.key(at_home.hash, file_name) for file_name in files]
+        stored = await store.contains(keys)
+
+        async for _, page_data, file_name in self._pages(
+            start=0,
+            end=None,
+            data_saver=data_saver,
+            ssl=ssl,
+            report=report,
+            concurrency=concurrency,
+            skip=lambda _, file_name: store.key(at_home.hash, file_name) in stored,
+            at_home=at_home,
+        ):
+            await store.put(at_home.hash, file_name, page_data)
+
+        await store.set_chapter(self.id, keys)
+        return keys
+
 
 class ChapterAtHome:
     """
@@ -827,6 +1048,141 @@ class UploadData:
         return self._filenames ^ succeeded
 
 
+class UploadImageReport:
+    """The result of validating one image before it is uploaded, see :meth:`ChapterUpload.validate_images`.
+
+    Attributes
+    ----------
+    path: :class:`pathlib.Path`
+        The image file.
+    mime_type: Optional[:class:`str`]
+        The image type, as read from its contents. ``None`` if it is not a supported type.
+    size: :class:`int`
+        The file size, in bytes.
+    width: Optional[:class:`int`]
+        The image width, if it could be read.
+    height: Optional[:class:`int`]
+        The image height, if it could be read.
+    problems: List[:class:`str`]
+        Why the image would be rejected, empty if it passed validation.
+    """
+
+    __slots__ = (
+        "height",
+        "mime_type",
+        "path",
+        "problems",
+        "size",
+        "width",
+    )
+
+    def __init__(self, path: pathlib.Path, /) -> None:
+        self.path: pathlib.Path = path
+        self.mime_type: str | None = None
+        self.size: int = 0
+        self.width: int | None = None
+        self.height: int | None = None
+        self.problems: list[str] = []
+
+    def __repr__(self) -> str:
+        return f"<UploadImageReport path={str(self.path)!r} ok={self.ok}>"
+
+    @property
+    def ok(self) -> bool:
+        """Whether the image passed validation.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return not self.problems
+
+
+def _inspect_image(
+    path: pathlib.Path,
+    data: bytes | None,
+    /,
+    *,
+    max_file_size: int,
+    max_dimension: int,
+) -> UploadImageReport:
+    # runs in a worker thread; only reads as much of the file as is needed to find its dimensions
+    report = UploadImageReport(path)
+    try:
+        if data is not None:
+            report.size = len(data)
+            report.mime_type = get_image_mime_type(data)
+            report.width, report.height = get_image_dimensions(data)
+        else:
+            report.size = path.stat().st_size
+            with path.open("rb") as fp:
+                header = fp.read(64 * 1024)
+                report.mime_type = get_image_mime_type(header)
+                try:
+                    report.width, report.height = get_image_dimensions(header)
+                except ValueError:
+                    # a JPEG's frame header can sit behind large metadata segments
+                    report.width, report.height = get_image_dimensions(header + fp.read())
+    except OSError as exc:
+        report.problems.append(f"could not be read ({exc.strerror or exc})")
+        return report
+    except ValueError:
+        if report.mime_type is None:
+            report.problems.append("is not a PNG, JPEG, GIF or WebP image")
+        else:
+            report.problems.append("its dimensions could not be read")
+
+    if report.size > max_file_size:
+        report.problems.append(f"is {report.size} bytes, over the {max_file_size} byte limit")
+    if report.width is not None and report.height is not None and max(report.width, report.height) > max_dimension:
+        report.problems.append(f"is {report.width}x{report.height}, over the {max_dimension}px limit")
+
+    return report
+
+
+def _image_sizes(images: list[pathlib.Path], contents: Mapping[pathlib.Path, bytes], /) -> dict[pathlib.Path, int]:
+    # runs in a worker thread
+    return {item: len(contents[item]) if item in contents else item.stat().st_size for item in images}
+
+
+async def _prepare_images(
+    images: list[pathlib.Path],
+    /,
+    *,
+    validate: bool,
+    sort: bool,
+    sorting_key: Callable[[pathlib.Path], Any] | None,
+    contents: Mapping[pathlib.Path, bytes] | None,
+    transform: ImageTransform | None,
+    executor: Executor | None,
+) -> tuple[list[pathlib.Path], Mapping[pathlib.Path, bytes] | None]:
+    # validates, sorts and transforms images ready to upload, shared with `UploadQueue`
+    if validate:
+        if transform is None:
+            await ChapterUpload.validate_images(images, sort=sort, sorting_key=sorting_key, contents=contents)
+        else:
+            # the transform can change an image's size and dimensions, so those are checked on its output below
+            await ChapterUpload.validate_images(
+                images,
+                sort=sort,
+                sorting_key=sorting_key,
+                contents=contents,
+                max_file_size=sys.maxsize,
+                max_request_size=sys.maxsize,
+                max_dimension=sys.maxsize,
+            )
+
+    if sort:
+        images = sorted(images, key=sorting_key or upload_file_sort)
+
+    if transform is not None:
+        images, contents = await transform_images(images, transform, contents=contents, executor=executor)
+        if validate:
+            await ChapterUpload.validate_images(images, sort=False, contents=contents)
+
+    return images, contents
+
+
 class ChapterUpload:
     """
     A context manager for handling the uploading of chapters to the MangaDex API.
@@ -862,6 +1218,21 @@ class ChapterUpload:
         Parameter is ignored if ``chapter_to_edit`` is ``None``.
     accept_tos: :class:`bool`
         Whether you accept the `MangaDex Terms of Service <https://mangadex.org/compliance>`_ by uploading this chapter.
+    state_path: Optional[Union[:class:`os.PathLike`, :class:`str`]]
+        A file to persist the session ID and uploaded pages to as the upload progresses.
+        If the file exists when the session is entered and its session is still open, that session is resumed and
+        the pages recorded in it are not uploaded again. The file is removed once the session is committed or abandoned.
+        The file records the manga, chapter and language it was written for, and entering the session with a file
+        written for another upload raises :exc:`ValueError`.
+
+    .. note::
+        The session is committed when the context manager exits, unless an exception was raised inside it.
+        In that case the session is left open, to be resumed (see ``state_path``) or abandoned.
+
+    .. note::
+        Used directly, images are only validated by :meth:`upload_images`, once the session is already open.
+        :meth:`Client.upload_chapter <hondana.Client.upload_chapter>` and :class:`~hondana.UploadQueue` validate
+        them before opening a session.
 
     Raises
     ------
@@ -874,6 +1245,7 @@ class ChapterUpload:
     __slots__ = (
         "__committed",
         "_http",
+        "_page_ids",
         "_uploaded_filenames",
         "accepted_tos",
         "chapter",
@@ -882,6 +1254,7 @@ class ChapterUpload:
         "manga",
         "publish_at",
         "scanlator_groups",
+        "state_path",
         "title",
         "translated_language",
         "upload_errors",
@@ -908,6 +1281,7 @@ class ChapterUpload:
         existing_upload_session_id: str | None = None,
         version: int | None = None,
         accept_tos: bool,
+        state_path: PathLike[str] | str | None = None,
     ) -> None:
         if len(scanlator_groups) > 10:
             msg = "You can only attribute up to 10 scanlator groups per upload."
@@ -932,25 +1306,86 @@ class ChapterUpload:
         self.upload_session_id: str | None = existing_upload_session_id
         self.version: int | None = version
         self.accepted_tos: bool = accept_tos
+        self.state_path: pathlib.Path | None = pathlib.Path(state_path) if state_path is not None else None
         self._uploaded_filenames: set[str] = set()
+        # the page ID of each uploaded file name
+        self._page_ids: dict[str, str] = {}
         self.__committed: bool = False
 
     def __repr__(self) -> str:
         return f"<ChapterUpload id={self.upload_session_id!r} current_uploads={len(self.uploaded)}>"
 
-    async def _check_for_session(self) -> None:
+    async def _open_session_id(self) -> str | None:
         route = Route("GET", "/upload", authenticate=True)
         try:
             data: GetUploadSessionResponse = await self._http.request(route)
         except NotFound:
+            return None
+        return data["data"]["id"]
+
+    async def _check_for_session(self) -> None:
+        session_id = await self._open_session_id()
+        if session_id is None:
             LOGGER.info("No upload session found, continuing.")
         else:
-            msg = f"You already have an existing session, please terminate it: {data['data']['id']}"
+            msg = f"You already have an existing session, please terminate it: {session_id}"
             raise UploadInProgress(
                 msg,
-                session_id=data["data"]["id"],
+                session_id=session_id,
             )
 
+    def _state_identity(self) -> dict[str, str]:
+        # what a state file must match for its session to be resumed by this upload
+        return {
+            "manga": self.manga.id if isinstance(self.manga, Manga) else self.manga,
+            "chapter": self.chapter,
+            "translated_language": self.translated_language,
+        }
+
+    def _load_state(self) -> dict[str, Any] | None:
+        if self.state_path is None or not self.state_path.exists():
+            return None
+        try:
+            return from_json(self.state_path.read_text("utf-8"))
+        except ValueError:
+            LOGGER.warning("Ignoring the unreadable upload state in %s.", self.state_path)
+            return None
+
+    def _save_state(self) -> None:
+        if self.state_path is None or self.upload_session_id is None:
+            return
+        state = {"session_id": self.upload_session_id, **self._state_identity(), "pages": self._page_ids}
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        # written next to it first, so a crash mid-write never leaves a truncated state behind
+        partial = self.state_path.with_name(f"{self.state_path.name}.part")
+        partial.write_text(to_json(state), "utf-8")
+        partial.replace(self.state_path)
+
+    def _clear_state(self) -> None:
+        if self.state_path is not None:
+            self.state_path.unlink(missing_ok=True)
+
+    async def _resume_from_state(self) -> bool:
+        state = self._load_state()
+        if state is None:
+            return False
+
+        identity = self._state_identity()
+        if any(state.get(key) != value for key, value in identity.items()):
+            # the file is left alone, as it may be needed to resume the upload it belongs to
+            msg = f"The upload state in {self.state_path} belongs to another upload than {identity}."
+            raise ValueError(msg)
+
+        if await self._open_session_id() != state["session_id"]:
+            LOGGER.info("The upload session in %s is no longer open, starting a new one.", self.state_path)
+            self._clear_state()
+            return False
+
+        self.upload_session_id = state["session_id"]
+        self._page_ids.update(state["pages"])
+        LOGGER.info("Resuming upload session %s with %d uploaded pages.", self.upload_session_id, len(self._page_ids))
+        return True
+
     @require_authentication
     async def open_session(self) -> BeginChapterUploadResponse:
         """|coro|
@@ -977,6 +1412,158 @@ class ChapterUpload:
             version=None,
         )
 
+    @staticmethod
+    async def validate_images(
+        images: list[pathlib.Path],
+        /,
+        *,
+        sort: bool = True,
+        sorting_key: Callable[[pathlib.Path], Any] | None = None,
+        max_file_size: int = MAX_UPLOAD_FILE_SIZE,
+        max_request_size: int = MAX_UPLOAD_REQUEST_SIZE,
+        max_dimension: int = MAX_IMAGE_DIMENSION,
+        contents: Mapping[pathlib.Path, bytes] | None = None,
+    ) -> list[UploadImageReport]:
+        """|coro|
+
+        This method will check images for anything MangaDex would reject, before any of them are uploaded.
+
+        The files are checked concurrently in worker threads, and only their headers are read.
+        Each image is checked for a supported type (by its contents), its file size and dimensions,
+        a unique file name, and that it can be sorted with ``sorting_key``.
+        Each image must also fit in an upload request of ``max_request_size`` on its own.
+
+        Parameters
+        ----------
+        images: List[:class:`pathlib.Path`]
+            The image files to check.
+        sort: :class:`bool`
+            Whether the images will be sorted when uploaded, see :meth:`upload_images`.
+        sorting_key: Optional[Callable[[:class:`pathlib.Path`], Any]]
+            The sorting key the images will be uploaded with, see :meth:`upload_images`.
+        max_file_size: :class:`int`
+            The largest accepted file, in bytes. Defaults to MangaDex's limit of 20 MiB.
+        max_request_size: :class:`int`
+            The largest accepted upload request, in bytes. Defaults to MangaDex's limit of 150 MiB.
+        max_dimension: :class:`int`
+            The largest accepted width or height, in pixels. Defaults to ``10000``.
+        contents: Optional[Mapping[:class:`pathlib.Path`, :class:`bytes`]]
+            The contents of some or all of the images, e.g. from :func:`~hondana.transform_images`.
+            These are checked instead of the files on disk.
+
+        Raises
+        ------
+        UploadValidationError
+            One or more images failed validation. Every failing image is reported, not just the first.
+
+        Returns
+        -------
+        List[:class:`~hondana.UploadImageReport`]
+            The reports of every image, in the order they were given.
+        """
+        contents = contents or {}
+        reports = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    _inspect_image,
+                    path,
+                    contents.get(path),
+                    max_file_size=max_file_size,
+                    max_dimension=max_dimension,
+                )
+                for path in images
+            ),
+        )
+
+        seen: set[str] = set()
+        for report in reports:
+            if report.path.name in seen:
+                report.problems.append("has the same file name as another image")
+            seen.add(report.path.name)
+
+        ordered = reports
+        if sort:
+            key = sorting_key or upload_file_sort
+            sortable: list[UploadImageReport] = []
+            for report in reports:
+                try:
+                    key(report.path)
+                except (ValueError, TypeError):
+                    report.problems.append("has a file name which cannot be sorted, e.g. use `1.png` or `1-extra.png`")
+                else:
+                    sortable.append(report)
+            ordered = sorted(sortable, key=lambda report: key(report.path))
+
+        # batches are filled by size, so only an image too large for a request on its own can overflow one
+        for report in ordered:
+            if report.size > max_request_size:
+                report.problems.append(f"is too large for an upload request, over the {max_request_size} byte limit")
+
+        failed = [report for report in reports if not report.ok]
+        if failed:
+            raise UploadValidationError(failed)
+
+        return reports
+
+    async def _upload_batches(
+        self,
+        route: Route,
+        images: list[pathlib.Path],
+        /,
+        *,
+        responses: list[UploadedChapterResponse],
+        errors: list[ErrorType],
+        contents: Mapping[pathlib.Path, bytes],
+        request_size: int,
+    ) -> list[pathlib.Path]:
+        # uploads the images in batches, and returns the ones which did not make it into the session
+        sizes = await asyncio.to_thread(_image_sizes, images, contents)
+        batches = as_sized_chunks(
+            images,
+            sizes.__getitem__,
+            max_size=MAX_UPLOAD_FILES_PER_REQUEST,
+            max_weight=min(request_size, MAX_UPLOAD_REQUEST_SIZE),
+        )
+        for batch in batches:
+            form = aiohttp.FormData()
+            for item in batch:
+                data = contents.get(item)
+                if data is None:
+                    with operation("chapter.upload_images"), item.open("rb") as f:
+                        data = f.read()
+
+                form.add_field(name=item.name, value=data)
+                self._uploaded_filenames.add(item.name)
+
+            try:
+                response: UploadedChapterResponse = await self._http.request(route, data=form)
+            except (MangaDexServerError, aiohttp.ClientError) as exc:
+                LOGGER.exception("Uploading a batch of %d images failed.", len(batch))
+                # recorded per file, so a batch that never reached the session still counts as failed
+                status = exc.status_code if isinstance(exc, MangaDexServerError) else 0
+                errors.extend(
+                    {
+                        "id": "upload_request_failed",
+                        "status": status,
+                        "title": "The upload request failed",
+                        "detail": f"{item.name}: {exc}",
+                    }
+                    for item in batch
+                )
+                continue
+
+            for item in response["data"]:
+                self._page_ids[item["attributes"]["originalFileName"]] = item["id"]
+
+            # check for errors in upload
+            if response["errors"]:
+                errors.extend(response["errors"])
+
+            responses.append(response)
+            self._save_state()
+
+        return [item for item in images if item.name not in self._page_ids]
+
     @require_authentication
     async def upload_images(
         self,
@@ -984,6 +1571,13 @@ class ChapterUpload:
         *,
         sort: bool = True,
         sorting_key: Callable[[pathlib.Path], Any] | None = None,
+        validate: bool = True,
+        retries: int = 3,
+        retry_delay: float = 2.0,
+        contents: Mapping[pathlib.Path, bytes] | None = None,
+        request_size: int = UPLOAD_REQUEST_TARGET_SIZE,
+        transform: ImageTransform | None = None,
+        executor: Executor | None = None,
     ) -> UploadData:
         """|coro|
 
@@ -999,6 +1593,36 @@ class ChapterUpload:
             A key to use in the sorting of the list of above paths.
             This callable is passed to the ``key`` parameter of the ``sorted`` builtin.
             If ``None``, the default sorting key is used.
+        validate: :class:`bool`
+            Whether to check the images with :meth:`validate_images` before uploading any of them.
+            With a ``transform``, the size and dimensions of its output are checked rather than of the original files.
+            Defaults to ``True``.
+        retries: :class:`int`
+            How many times to retry the images which failed to upload. Only the failed images are sent again.
+            Defaults to ``3``.
+        retry_delay: :class:`float`
+            How long to wait, in seconds, before the first retry. The delay doubles with each retry.
+            Defaults to ``2.0``.
+        contents: Optional[Mapping[:class:`pathlib.Path`, :class:`bytes`]]
+            The contents of some or all of the images, if they were already read.
+            Images not in this mapping are read from disk as they are uploaded.
+        request_size: :class:`int`
+            How many bytes of images to send per upload request.
+            Images are batched in order until the next would go over this size, up to 10 images per request.
+            It is capped at MangaDex's limit of 150 MiB, and defaults to 32 MiB.
+        transform: Optional[:class:`~hondana.ImageTransform`]
+            A transform to run over the images before they are sent, e.g. :class:`~hondana.PillowTransform`
+            to re-encode them smaller. Sorting applies to the original files.
+        executor: Optional[:class:`concurrent.futures.Executor`]
+            The executor to run ``transform`` in, see :func:`~hondana.transform_images`.
+
+        Raises
+        ------
+        UploadValidationError
+            ``validate`` is ``True`` and one or more images failed validation. Nothing was uploaded.
+            The upload session is already open by then, unlike with
+            :meth:`Client.upload_chapter <hondana.Client.upload_chapter>` or :class:`~hondana.UploadQueue`,
+            which validate before opening one.
 
         Returns
         -------
@@ -1020,34 +1644,47 @@ class ChapterUpload:
             ``pathlib.Path`` and returns a sortable value.
             This means that the return value of ``sorting_key`` must be richly comparable, with ``__lt__`` and ``__gt__``.
         """
+        images, contents = await _prepare_images(
+            images,
+            validate=validate,
+            sort=sort,
+            sorting_key=sorting_key,
+            contents=contents,
+            transform=transform,
+            executor=executor,
+        )
+
         route = Route("POST", "/upload/{session_id}", session_id=self.upload_session_id, authenticate=True)
         success: list[UploadedChapterResponse] = []
 
-        if sort:
-            sort_key = sorting_key or upload_file_sort
-            images = sorted(images, key=sort_key)
-
-        chunks = as_chunks(images, 10)
-        outer_idx = 1
-        for batch in chunks:
-            form = aiohttp.FormData()
-            for _, item in enumerate(batch, start=outer_idx):
-                with item.open("rb") as f:
-                    data = f.read()
-
-                form.add_field(name=item.name, value=data)
-                self._uploaded_filenames.add(item.name)
-                outer_idx += 1
-
-            response: UploadedChapterResponse = await self._http.request(route, data=form)
-            for item in response["data"]:
-                self.uploaded.append(item["id"])
+        # images already in the session, e.g. from a resumed session, are not sent again
+        pending = [item for item in images if item.name not in self._page_ids]
+        for attempt in range(retries + 1):
+            errors: list[ErrorType] = []
+            pending = await self._upload_batches(
+                route,
+                pending,
+                responses=success,
+                errors=errors,
+                contents=contents or {},
+                request_size=request_size,
+            )
+            if not pending or attempt == retries:
+                # only the errors of the last attempt are kept, earlier ones were retried
+                self.upload_errors.extend(errors)
+                break
 
-            # check for errors in upload
-            if response["errors"]:
-                self.upload_errors.extend(response["errors"])
+            delay = retry_delay * 2**attempt
+            LOGGER.warning("%d images failed to upload, retrying them in %.1f seconds.", len(pending), delay)
+            await asyncio.sleep(delay)
 
-            success.append(response)
+        # pages are ordered as the images were given, not by when their upload succeeded
+        uploaded = set(self.uploaded)
+        for item in images:
+            page_id = self._page_ids.get(item.name)
+            if page_id is not None and page_id not in uploaded:
+                self.uploaded.append(page_id)
+                uploaded.add(page_id)
 
         return UploadData(success, self.upload_errors, filenames=self._uploaded_filenames)
 
@@ -1104,6 +1741,8 @@ class ChapterUpload:
             self.__committed = True
 
         await self._http.abandon_upload_session(session)
+        if session == self.upload_session_id:
+            self._clear_state()
 
     @require_authentication
     async def commit(self) -> Chapter:
@@ -1141,15 +1780,19 @@ class ChapterUpload:
         data: GetSingleChapterResponse = await self._http.request(route, json=payload)
 
         self.__committed = True
+        self._clear_state()
         return Chapter(self._http, data["data"])
 
     @require_authentication
     async def __aenter__(self: Self) -> Self:
         if self.upload_session_id is None:
+            if await self._resume_from_state():
+                return self
             await self._check_for_session()
 
         session_data = await self.open_session()
         self.upload_session_id = session_data["data"]["id"]
+        self._save_state()
 
         return self
 
@@ -1159,7 +1802,8 @@ class ChapterUpload:
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
-        if self.__committed is False:
+        # an exception means the upload is incomplete, so it is left open to be resumed or abandoned
+        if self.__committed is False and exc_type is None:
             await self.commit()
 
 
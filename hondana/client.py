@@ -24,17 +24,21 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import json
 import logging
 import operator
 import pathlib
-from typing import TYPE_CHECKING, Any, TypeVar, overload
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+
+import aiohttp
 
 from . import errors
 from .artist import Artist
 from .author import Author
-from .chapter import Chapter, ChapterUpload, PreviouslyReadChapter
+from .chapter import Chapter, ChapterStatistics, ChapterUpload, PreviouslyReadChapter
 from .collections import (
     AuthorCollection,
     ChapterFeed,
@@ -57,6 +61,7 @@ from .enums import (
     MangaRelationType,
     MangaState,
     MangaStatus,
+    Order,
     PublicationDemographic,
     ReadingStatus,
     ReportCategory,
@@ -66,7 +71,7 @@ from .enums import (
 from .forums import ForumThread
 from .http import HTTPClient
 from .legacy import LegacyItem
-from .manga import Manga, MangaRating, MangaRelation, MangaStatistics
+from .manga import Manga, MangaLibraryState, MangaRating, MangaRelation, MangaStatistics
 from .query import (
     ArtistIncludes,
     AuthorIncludes,
@@ -86,27 +91,41 @@ from .query import (
     UserReportIncludes,
 )
 from .report import ReportDetails, UserReport
-from .scanlator_group import ScanlatorGroup
-from .tags import Tag
+from .scanlator_group import ScanlatorGroup, ScanlatorGroupStatistics
+from .store import FeedWatermark
+from .tags import Tag, TagRegistry
 from .user import User
-from .utils import MISSING, deprecated, require_authentication
+from .utils import DECODE_THRESHOLD, MAX_DEPTH, MISSING, as_url_chunks, deprecated, require_authentication
+from .watchdog import operation
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Iterable
+    from concurrent.futures import Executor
+    from os import PathLike
     from types import TracebackType
-    from typing import Self
+    from typing import Self, TypeAlias
 
     from aiohttp import ClientSession
     from multidict import MultiDict
 
+    from .cover import CoverCache
+    from .store import EntityStore, SyncStorage
     from .tags import QueryTags
     from .types_ import common, legacy, manga
+    from .types_.chapter import GetMultiChapterResponse
+    from .types_.manga import MangaSearchResponse
     from .types_.settings import Settings, SettingsPayload
+    from .utils import InternTable
 
     T = TypeVar("T")
     BE = TypeVar("BE", bound=BaseException)
+    # fetches a page of chapters by ``(limit, offset, updated_at_since)``, ordered by ``updatedAt`` ascending
+    ChapterPageFetcher: TypeAlias = Callable[[int, int, datetime.datetime | None], Awaitable[GetMultiChapterResponse]]
 
 _PROJECT_DIR = pathlib.Path(__file__)
 LOGGER: logging.Logger = logging.getLogger(__name__)
+# how many yielded chapter IDs a feed watch remembers, so later edits to them aren't yielded again
+WATCH_MEMORY: int = 10_000
 
 __all__ = ("Client",)
 
@@ -129,6 +148,30 @@ class Client:
     dev_api: :class:`bool`
         If you want to use the Dev api instead of production.
         Defaults to ``False``.
+    compact_models: :class:`bool`
+        Whether :class:`~hondana.Manga` and :class:`~hondana.Chapter` objects should drop their raw payloads once parsed,
+        keeping only their parsed fields and relationship IDs. Useful for long-lived caches of many objects.
+        Defaults to ``False``.
+    intern_strings: :class:`bool`
+        Whether to share repeated strings (language codes, relationship types and IDs, enum values and tag payloads)
+        between the objects this client creates. This reduces resident memory for large cached collections.
+        IDs unique to one entity, such as its own or its cover's, are not shared.
+        See :attr:`intern_table`.
+        Defaults to ``False``.
+    store: Optional[:class:`~hondana.EntityStore`]
+        A persistent store to upsert every entity returned by a ``GET`` request into, and to serve :meth:`get_manga`,
+        :meth:`get_chapter` and :meth:`get_author` from while the stored payload is fresh.
+        Failures to store a response are logged, and don't fail the request.
+        The store is not closed with the client.
+        Defaults to ``None``.
+    decode_executor: Optional[:class:`concurrent.futures.Executor`]
+        An executor to decode large JSON responses in, rather than on the event loop.
+        See :func:`~hondana.utils.default_decode_executor` for what a thread or process pool gives here.
+        The executor is not shut down with the client.
+        Defaults to ``None``, decoding every response on the event loop.
+    decode_threshold: :class:`int`
+        The size in bytes a response body must reach to be decoded in ``decode_executor``.
+        Defaults to 262,144.
 
 
     .. note::
@@ -150,13 +193,47 @@ class Client:
         client_id: str,
         client_secret: str,
         dev_api: bool = ...,
+        compact_models: bool = ...,
+        intern_strings: bool = ...,
+        store: EntityStore | None = ...,
+        decode_executor: Executor | None = ...,
+        decode_threshold: int = ...,
     ) -> None: ...
 
     @overload
-    def __init__(self, *, session: ClientSession) -> None: ...
+    def __init__(
+        self,
+        *,
+        session: ClientSession,
+        compact_models: bool = ...,
+        intern_strings: bool = ...,
+        store: EntityStore | None = ...,
+        decode_executor: Executor | None = ...,
+        decode_threshold: int = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, *, dev_api: bool) -> None: ...
+    def __init__(
+        self,
+        *,
+        dev_api: bool,
+        compact_models: bool = ...,
+        intern_strings: bool = ...,
+        store: EntityStore | None = ...,
+        decode_executor: Executor | None = ...,
+        decode_threshold: int = ...,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self,
+        *,
+        compact_models: bool = ...,
+        intern_strings: bool = ...,
+        store: EntityStore | None = ...,
+        decode_executor: Executor | None = ...,
+        decode_threshold: int = ...,
+    ) -> None: ...
 
     def __init__(
         self,
@@ -167,6 +244,11 @@ class Client:
         client_id: str | None = None,
         client_secret: str | None = None,
         dev_api: bool = False,
+        compact_models: bool = False,
+        intern_strings: bool = False,
+        store: EntityStore | None = None,
+        decode_executor: Executor | None = None,
+        decode_threshold: int = DECODE_THRESHOLD,
     ) -> None:
         self._http: HTTPClient = HTTPClient(
             session=session,
@@ -175,6 +257,11 @@ class Client:
             client_id=client_id,
             client_secret=client_secret,
             dev_api=dev_api,
+            compact_models=compact_models,
+            intern_strings=intern_strings,
+            store=store,
+            decode_executor=decode_executor,
+            decode_threshold=decode_threshold,
         )
 
     async def __aenter__(self) -> Self:
@@ -214,6 +301,47 @@ class Client:
         """
         return await self._http.close()
 
+    @property
+    def intern_table(self) -> InternTable | None:
+        """The table of shared strings used by this client, if ``intern_strings`` was enabled.
+
+        Call :meth:`~hondana.utils.InternTable.clear` on it to release the held values.
+
+        Returns
+        -------
+        Optional[:class:`~hondana.utils.InternTable`]
+        """
+        return self._http.intern_table
+
+    @property
+    def store(self) -> EntityStore | None:
+        """The persistent entity store used by this client, if one was given.
+
+        Returns
+        -------
+        Optional[:class:`~hondana.EntityStore`]
+        """
+        return self._http.store
+
+    async def _from_store(self, type_: str, id_: str, includes: Any | None, /) -> Any | None:
+        # explicit includes may ask for expansions the stored payload wasn't fetched with
+        if self._http.store is None or includes is not None:
+            return None
+        return await self._http.store.get(type_, id_)
+
+    def _by_ids(
+        self,
+        fetch: Callable[..., Coroutine[Any, Any, T]],
+        ids: list[str] | None,
+        limit: int | None,
+        /,
+    ) -> tuple[Callable[..., Coroutine[Any, Any, T]], bool]:
+        # an ``ids[]`` filter too long for one URL is fetched in one go through concurrent chunks instead of paginated,
+        # with the caller's limit (not the page size) applied to the merged results
+        if len(list(as_url_chunks(ids or (), "ids"))) > 1:
+            return partial(self._http.fetch_by_ids, fetch, max_results=limit), True
+        return fetch, False
+
     async def check_username_available(self, username: str) -> bool:
         """|coro|
 
@@ -256,7 +384,7 @@ class Client:
         fmt = dict(sorted(pre_fmt.items(), key=operator.itemgetter(0)))
 
         path = _PROJECT_DIR.parent / "extras" / "tags.json"
-        with path.open("w") as fp:
+        with operation("client.update_tags"), path.open("w") as fp:
             json.dump(fmt, fp, indent=4)
 
         return fmt
@@ -310,6 +438,7 @@ class Client:
         """|coro|
 
         This method will retrieve the current list of tags on MangaDex.
+        The returned tags are also added to the default :class:`~hondana.TagRegistry`.
 
         Returns
         -------
@@ -318,7 +447,8 @@ class Client:
         """
         data = await self._http.update_tags()
 
-        return [Tag(item) for item in data["data"]]
+        registry = TagRegistry.default()
+        return [registry.add(Tag(item, intern_table=self._http.intern_table)) for item in data["data"]]
 
     @require_authentication
     async def get_my_feed(
@@ -439,6 +569,502 @@ class Client:
 
     subscription_feed = get_my_feed
 
+    async def sync_feed(
+        self,
+        key: str,
+        /,
+        *,
+        storage: SyncStorage,
+        manga_id: str | None = None,
+        custom_list_id: str | None = None,
+        translated_language: list[common.LanguageCode] | None = None,
+        original_language: list[common.LanguageCode] | None = None,
+        excluded_original_language: list[common.LanguageCode] | None = None,
+        content_rating: list[ContentRating] | None = None,
+        excluded_groups: list[str] | None = None,
+        excluded_uploaders: list[str] | None = None,
+        includes: ChapterIncludes | None = None,
+        include_empty_pages: bool | None = None,
+        include_future_publish_at: bool | None = None,
+        include_external_url: bool | None = None,
+    ) -> list[Chapter]:
+        """|coro|
+
+        This method will incrementally sync a chapter feed, returning only the chapters that are new or have changed
+        since the last sync of the same ``key``.
+
+        The latest ``updatedAt`` seen (and the IDs of the chapters updated at that instant) are persisted in ``storage``
+        per key, so only newer chapters are requested, in ascending ``updatedAt`` order, on each call.
+
+        By default this syncs the logged-in user's followed manga feed (see :meth:`get_my_feed`).
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key to persist this feed's watermark under. Each distinct feed (and set of filters) should use its own key.
+        storage: :class:`~hondana.SyncStorage`
+            Where to load and save the feed watermarks, e.g. :class:`~hondana.JSONSyncStorage`
+            or :class:`~hondana.SQLiteSyncStorage`.
+        manga_id: Optional[:class:`str`]
+            Sync this manga's feed instead, as in :meth:`~hondana.Manga.feed`.
+        custom_list_id: Optional[:class:`str`]
+            Sync this custom list's feed instead, as in :meth:`get_custom_list_manga_feed`.
+        translated_language: List[:class:`~hondana.types_.common.LanguageCode`]
+            A list of language codes to filter the returned chapters with.
+        original_language: List[:class:`~hondana.types_.common.LanguageCode`]
+            A list of language codes to filter the original language of the returned chapters with.
+        excluded_original_language: List[:class:`~hondana.types_.common.LanguageCode`]
+            A list of language codes to negate filter the original language of the returned chapters with.
+        content_rating: Optional[List[:class:`~hondana.ContentRating`]]
+            The content rating to filter the feed by.
+        excluded_groups: Optional[List[:class:`str`]]
+            The list of scanlator groups to exclude from the response.
+        excluded_uploaders: Optional[List[:class:`str`]]
+            The list of uploaders to exclude from the response.
+        includes: Optional[:class:`~hondana.query.ChapterIncludes`]
+            The optional data to include in the response.
+        include_empty_pages: Optional[:class:`bool`]
+            Whether to show chapters with no pages available.
+        include_future_publish_at: Optional[:class:`bool`]
+            Whether to show chapters with a publishAt value set in the future.
+        include_external_url: Optional[:class:`bool`]
+            Whether to show chapters that have an external URL attached to them.
+
+        Raises
+        ------
+        TypeError
+            Both ``manga_id`` and ``custom_list_id`` were given.
+        AuthenticationRequired
+            The followed feed was requested without authentication.
+        BadRequest
+            The query parameters were not valid.
+
+        Returns
+        -------
+        List[:class:`~hondana.Chapter`]
+            The new or changed chapters, oldest update first.
+
+
+        .. note::
+            The watermark is only saved once the whole feed has been synced, so a failed sync is retried in full.
+        """
+        fetch, _ = self._feed_source(
+            manga_id=manga_id,
+            custom_list_id=custom_list_id,
+            translated_language=translated_language,
+            original_language=original_language,
+            excluded_original_language=excluded_original_language,
+            content_rating=content_rating,
+            excluded_groups=excluded_groups,
+            excluded_uploaders=excluded_uploaders,
+            includes=includes,
+            include_empty_pages=include_empty_pages,
+            include_future_publish_at=include_future_publish_at,
+            include_external_url=include_external_url,
+        )
+
+        previous = await storage.load(key) or FeedWatermark()
+
+        chapters, watermark = await self._updated_since(fetch, previous, limit=500)
+
+        if watermark != previous:
+            await storage.save(key, watermark)
+
+        return chapters
+
+    def _feed_source(
+        self,
+        *,
+        manga_id: str | None,
+        custom_list_id: str | None,
+        translated_language: list[common.LanguageCode] | None,
+        original_language: list[common.LanguageCode] | None,
+        excluded_original_language: list[common.LanguageCode] | None,
+        content_rating: list[ContentRating] | None,
+        excluded_groups: list[str] | None,
+        excluded_uploaders: list[str] | None,
+        includes: ChapterIncludes | None,
+        include_empty_pages: bool | None,
+        include_future_publish_at: bool | None,
+        include_external_url: bool | None,
+    ) -> tuple[ChapterPageFetcher, str]:
+        # resolves which chapter feed to page through by ``updatedAt``, and the ratelimit bucket it falls under
+        if manga_id is not None and custom_list_id is not None:
+            msg = "Only one of `manga_id` and `custom_list_id` can be given to this method."
+            raise TypeError(msg)
+
+        if manga_id is None and custom_list_id is None and not self._http._authenticated:  # pyright: ignore[reportPrivateUsage] # noqa: SLF001 # sanity reasons
+            msg = "This method requires authentication."
+            raise errors.AuthenticationRequired(msg)
+
+        async def fetch(limit: int, offset: int, since: datetime.datetime | None) -> GetMultiChapterResponse:
+            kwargs: dict[str, Any] = {
+                "limit": limit,
+                "offset": offset,
+                "translated_language": translated_language,
+                "original_language": original_language,
+                "excluded_original_language": excluded_original_language,
+                "content_rating": content_rating,
+                "excluded_groups": excluded_groups,
+                "excluded_uploaders": excluded_uploaders,
+                "include_future_updates": None,
+                "created_at_since": None,
+                "updated_at_since": since,
+                "published_at_since": None,
+                "order": FeedOrderQuery(updated_at=Order.ascending),
+                "includes": includes or ChapterIncludes(),
+                "include_empty_pages": include_empty_pages,
+                "include_future_publish_at": include_future_publish_at,
+                "include_external_url": include_external_url,
+            }
+            if custom_list_id is not None:
+                return await self._http.custom_list_manga_feed(custom_list_id, **kwargs)
+            return await self._http.manga_feed(manga_id, include_unavailable=None, **kwargs)
+
+        if custom_list_id is not None:
+            return fetch, "/list/{custom_list_id}/feed"
+        if manga_id is not None:
+            return fetch, "/manga/{manga_id}/feed"
+        return fetch, "/user/follows/manga/feed"
+
+    async def _updated_since(
+        self,
+        fetch: ChapterPageFetcher,
+        previous: FeedWatermark,
+        /,
+        *,
+        limit: int,
+    ) -> tuple[list[Chapter], FeedWatermark]:
+        # walks the chapters updated since a watermark in ascending ``updatedAt`` order, returning them and the new watermark
+        watermark = FeedWatermark(previous.updated_at, previous.boundary_ids)
+        since = previous.updated_at
+        offset = 0
+
+        chapters: dict[str, Chapter] = {}
+        while True:
+            data = await fetch(limit, offset, since)
+
+            for item in data["data"]:
+                chapter = Chapter(self._http, item)
+                updated_at = chapter.updated_at
+                # ``updatedAtSince`` is inclusive, so the previous boundary is returned again and skipped here
+                if previous.is_new(chapter.id, updated_at):
+                    chapters[chapter.id] = chapter
+                    watermark.advance(chapter.id, updated_at)
+
+            offset += limit
+            if len(data["data"]) < limit or offset >= data["total"]:
+                break
+
+            if offset >= MAX_DEPTH:
+                # the offset cap has been reached, so start a new window from the latest update seen
+                if watermark.updated_at == since:
+                    LOGGER.warning("More than %d chapters share an update time, some were skipped.", MAX_DEPTH)
+                    break
+                since = watermark.updated_at
+                offset = 0
+
+        return sorted(chapters.values(), key=operator.attrgetter("updated_at")), watermark
+
+    async def _created_at_keyset(
+        self,
+        fetch: Callable[[int, int, datetime.datetime | None], Awaitable[Any]],
+        /,
+        *,
+        limit: int,
+        created_at_since: datetime.datetime | None,
+    ) -> tuple[list[Any], Any]:
+        # walks a list ordered by ``createdAt`` ascending, moving the ``createdAtSince`` window forward after each page
+        # rather than using offsets, so there is no 10,000 item cap. Returns the raw items and the first response.
+        since = created_at_since
+        boundary_at: datetime.datetime | None = None
+        boundary: set[str] = set()
+        offset = 0
+
+        first: Any = None
+        items: list[Any] = []
+        while True:
+            data = await fetch(limit, offset, since)
+            if first is None:
+                first = data
+
+            page: list[Any] = data["data"]
+            for item in page:
+                created_at = datetime.datetime.fromisoformat(item["attributes"]["createdAt"])
+                # ``createdAtSince`` is inclusive, so items on the boundary timestamp are returned again
+                if created_at == boundary_at and item["id"] in boundary:
+                    continue
+                items.append(item)
+
+                if boundary_at is None or created_at > boundary_at:
+                    boundary_at = created_at
+                    boundary = {item["id"]}
+                elif created_at == boundary_at:
+                    boundary.add(item["id"])
+
+            if len(page) < limit:
+                break
+
+            if boundary_at != since:
+                since = boundary_at
+                offset = 0
+            else:
+                # a whole page shared one timestamp, so page through that timestamp by offset instead
+                offset += limit
+                if offset >= MAX_DEPTH:
+                    LOGGER.warning("More than %d items share a creation time, some were skipped.", MAX_DEPTH)
+                    break
+
+        return items, first
+
+    async def _watch(
+        self,
+        fetch: ChapterPageFetcher,
+        bucket: str,
+        /,
+        *,
+        since: datetime.datetime | None,
+        min_interval: float,
+        max_interval: float,
+    ) -> AsyncGenerator[Chapter, None]:
+        if min_interval <= 0 or max_interval < min_interval:
+            msg = "`min_interval` must be positive and no greater than `max_interval`."
+            raise ValueError(msg)
+
+        watermark = FeedWatermark(since or datetime.datetime.now(datetime.UTC))
+        # the most recently yielded IDs, oldest first; an edit moves a chapter past the watermark, so it is returned again
+        yielded: dict[str, None] = {}
+        interval = min_interval
+
+        while True:
+            chapters, watermark = await self._updated_since(fetch, watermark, limit=100)
+
+            new: list[Chapter] = []
+            for chapter in chapters:
+                if chapter.id not in yielded:
+                    new.append(chapter)
+                yielded.pop(chapter.id, None)
+                yielded[chapter.id] = None
+                if len(yielded) > WATCH_MEMORY:
+                    del yielded[next(iter(yielded))]
+
+            for chapter in new:
+                yield chapter
+
+            # poll again quickly while chapters are arriving, and back off exponentially while idle
+            interval = min_interval if new else min(interval * 2, max_interval)
+
+            delay = interval
+            headroom = self._http.ratelimit_headroom(bucket)
+            if headroom is not None and headroom < 0.25:
+                # stretch the delay up to 4x as the ratelimit runs out, leaving room for other requests
+                delay = min(interval * 0.25 / max(headroom, 0.0625), max(interval, max_interval))
+
+            LOGGER.debug("Watching %r again in %.1fs", bucket, delay)
+            await asyncio.sleep(delay)
+
+    def watch_feed(
+        self,
+        *,
+        manga_id: str | None = None,
+        custom_list_id: str | None = None,
+        since: datetime.datetime | None = None,
+        min_interval: float = 30.0,
+        max_interval: float = 900.0,
+        translated_language: list[common.LanguageCode] | None = None,
+        original_language: list[common.LanguageCode] | None = None,
+        excluded_original_language: list[common.LanguageCode] | None = None,
+        content_rating: list[ContentRating] | None = None,
+        excluded_groups: list[str] | None = None,
+        excluded_uploaders: list[str] | None = None,
+        includes: ChapterIncludes | None = None,
+        include_empty_pages: bool | None = None,
+        include_future_publish_at: bool | None = None,
+        include_external_url: bool | None = None,
+    ) -> AsyncGenerator[Chapter, None]:
+        """Watches a chapter feed, yielding each new chapter as it appears.
+
+        The feed is polled with an ``updatedAtSince`` watermark. The polling interval drops to ``min_interval`` while new
+        chapters are arriving, doubles up to ``max_interval`` while the feed is idle, and is stretched further while less
+        than a quarter of the feed's ratelimit remains.
+
+        By default this watches the logged-in user's followed manga feed (see :meth:`get_my_feed`).
+
+        .. code-block:: python3
+
+            async for chapter in client.watch_feed(translated_language=["en"]):
+                print(chapter.manga_id, chapter.chapter)
+
+        Parameters
+        ----------
+        manga_id: Optional[:class:`str`]
+            Watch this manga's feed instead, as in :meth:`~hondana.Manga.feed`.
+        custom_list_id: Optional[:class:`str`]
+            Watch this custom list's feed instead, as in :meth:`get_custom_list_manga_feed`.
+        since: Optional[:class:`datetime.datetime`]
+            Only yield chapters updated after this point. Defaults to now.
+        min_interval: :class:`float`
+            The shortest time between polls, in seconds. Defaults to 30.
+        max_interval: :class:`float`
+            The longest time between polls while idle, in seconds. Defaults to 900.
+        translated_language: List[:class:`~hondana.types_.common.LanguageCode`]
+            A list of language codes to filter the returned chapters with.
+        original_language: List[:class:`~hondana.types_.common.LanguageCode`]
+            A list of language codes to filter the original language of the returned chapters with.
+        excluded_original_language: List[:class:`~hondana.types_.common.LanguageCode`]
+            A list of language codes to negate filter the original language of the returned chapters with.
+        content_rating: Optional[List[:class:`~hondana.ContentRating`]]
+            The content rating to filter the feed by.
+        excluded_groups: Optional[List[:class:`str`]]
+            The list of scanlator groups to exclude from the response.
+        excluded_uploaders: Optional[List[:class:`str`]]
+            The list of uploaders to exclude from the response.
+        includes: Optional[:class:`~hondana.query.ChapterIncludes`]
+            The optional data to include in the response.
+        include_empty_pages: Optional[:class:`bool`]
+            Whether to show chapters with no pages available.
+        include_future_publish_at: Optional[:class:`bool`]
+            Whether to show chapters with a publishAt value set in the future.
+        include_external_url: Optional[:class:`bool`]
+            Whether to show chapters that have an external URL attached to them.
+
+        Raises
+        ------
+        TypeError
+            Both ``manga_id`` and ``custom_list_id`` were given.
+        ValueError
+            The intervals were not valid.
+        AuthenticationRequired
+            The followed feed was requested without authentication.
+
+        Yields
+        ------
+        :class:`~hondana.Chapter`
+            Each new chapter, oldest update first. Chapters are only yielded once, later edits to them are not re-yielded
+            while the chapter is among the last 10,000 yielded.
+        """
+        fetch, bucket = self._feed_source(
+            manga_id=manga_id,
+            custom_list_id=custom_list_id,
+            translated_language=translated_language,
+            original_language=original_language,
+            excluded_original_language=excluded_original_language,
+            content_rating=content_rating,
+            excluded_groups=excluded_groups,
+            excluded_uploaders=excluded_uploaders,
+            includes=includes,
+            include_empty_pages=include_empty_pages,
+            include_future_publish_at=include_future_publish_at,
+            include_external_url=include_external_url,
+        )
+
+        return self._watch(fetch, bucket, since=since, min_interval=min_interval, max_interval=max_interval)
+
+    def watch_chapters(
+        self,
+        *,
+        since: datetime.datetime | None = None,
+        min_interval: float = 30.0,
+        max_interval: float = 900.0,
+        groups: list[str] | None = None,
+        uploader: str | list[str] | None = None,
+        manga: str | None = None,
+        translated_language: list[common.LanguageCode] | None = None,
+        original_language: list[common.LanguageCode] | None = None,
+        excluded_original_language: list[common.LanguageCode] | None = None,
+        content_rating: list[ContentRating] | None = None,
+        excluded_groups: list[str] | None = None,
+        excluded_uploaders: list[str] | None = None,
+        include_empty_pages: bool | None = None,
+        include_future_publish_at: bool | None = None,
+        include_external_url: bool | None = None,
+        include_unavailable: bool | None = None,
+        includes: ChapterIncludes | None = None,
+    ) -> AsyncGenerator[Chapter, None]:
+        """Watches the chapter list, yielding each new chapter matching the filters as it appears.
+
+        This polls :meth:`chapter_list` the same way :meth:`watch_feed` polls a feed.
+
+        Parameters
+        ----------
+        since: Optional[:class:`datetime.datetime`]
+            Only yield chapters updated after this point. Defaults to now.
+        min_interval: :class:`float`
+            The shortest time between polls, in seconds. Defaults to 30.
+        max_interval: :class:`float`
+            The longest time between polls while idle, in seconds. Defaults to 900.
+        groups: Optional[List[:class:`str`]]
+            The scanlation group UUID(s) to limit the request with.
+        uploader: Optional[Union[:class:`str`, List[:class:`str`]]]
+            The uploader UUID to limit the request with.
+        manga: Optional[:class:`str`]
+            The manga UUID to limit the request with.
+        translated_language: Optional[List[:class:`~hondana.types_.common.LanguageCode`]]
+            The list of languages codes to filter the request with.
+        original_language: Optional[List[:class:`~hondana.types_.common.LanguageCode`]]
+            The list of languages to specifically target in the request.
+        excluded_original_language: Optional[List[:class:`~hondana.types_.common.LanguageCode`]]
+            The list of original languages to exclude from the request.
+        content_rating: Optional[List[:class:`~hondana.ContentRating`]]
+            The content rating to filter the feed by.
+        excluded_groups: Optional[List[:class:`str`]]
+            The list of scanlator groups to exclude from the response.
+        excluded_uploaders: Optional[List[:class:`str`]]
+            The list of uploaders to exclude from the response.
+        include_empty_pages: Optional[:class:`bool`]
+            Whether to show chapters with no pages available.
+        include_future_publish_at: Optional[:class:`bool`]
+            Whether to show chapters with a publishAt value set in the future.
+        include_external_url: Optional[:class:`bool`]
+            Whether to show chapters that have an external URL attached to them.
+        include_unavailable: Optional[:class:`bool`]
+            Whether to show chapters that are marked as unavailable.
+        includes: Optional[:class:`~hondana.query.ChapterIncludes`]
+            The list of options to include increased payloads for per chapter.
+
+        Raises
+        ------
+        ValueError
+            The intervals were not valid.
+
+        Yields
+        ------
+        :class:`~hondana.Chapter`
+            Each new chapter, oldest update first. Chapters are only yielded once, later edits to them are not re-yielded
+            while the chapter is among the last 10,000 yielded.
+        """
+
+        async def fetch(limit: int, offset: int, since: datetime.datetime | None) -> GetMultiChapterResponse:
+            return await self._http.chapter_list(
+                limit=limit,
+                offset=offset,
+                ids=None,
+                title=None,
+                groups=groups,
+                uploader=uploader,
+                manga=manga,
+                volume=None,
+                chapter=None,
+                translated_language=translated_language,
+                original_language=original_language,
+                excluded_original_language=excluded_original_language,
+                content_rating=content_rating,
+                excluded_groups=excluded_groups,
+                excluded_uploaders=excluded_uploaders,
+                include_future_updates=None,
+                include_empty_pages=include_empty_pages,
+                include_future_publish_at=include_future_publish_at,
+                include_external_url=include_external_url,
+                include_unavailable=include_unavailable,
+                created_at_since=None,
+                updated_at_since=since,
+                published_at_since=None,
+                order=FeedOrderQuery(updated_at=Order.ascending),
+                includes=includes or ChapterIncludes(),
+            )
+
+        return self._watch(fetch, "/chapter", since=since, min_interval=min_interval, max_interval=max_interval)
+
     async def manga_list(
         self,
         *,
@@ -465,6 +1091,7 @@ class Client:
         has_available_chapters: bool | None = None,
         has_unavailable_chapters: bool | None = None,
         group: str | None = None,
+        deep: bool = False,
     ) -> MangaCollection:
         """|coro|
 
@@ -506,8 +1133,11 @@ class Client:
             i.e. ``["en"]``
         publication_demographic: Optional[List[:class:`~hondana.PublicationDemographic`]]
             The publication demographic(s) to limit the search to.
-        ids: Optional[:class:`str`]
+        ids: Optional[List[:class:`str`]]
             A list of manga UUID(s) to limit the search to.
+            Too many IDs for one request are split into chunks that are requested concurrently,
+            and ``limit``, ``offset`` and ``order`` are applied to the combined matches. Ordering them by a field which is
+            not a plain attribute (e.g. ``relevance`` or ``title``) raises :exc:`ValueError`.
         content_rating: Optional[List[:class:`~hondana.ContentRating`]]
             The content rating(s) to filter the search to.
         created_at_since: Optional[datetime.datetime]
@@ -528,13 +1158,21 @@ class Client:
             Filter the manga list to only those that have chapters marked as unavailable.
         group: Optional[:class:`str`]
             Filter the manga list to only those uploaded by this group.
+        deep: :class:`bool`
+            Whether to retrieve every matching manga, past the API's 10,000 result pagination cap.
+            The list is walked in ``createdAt`` order by advancing ``created_at_since``, rather than by offset.
+            Requires ``limit`` to be ``None`` and ``order`` to not be given.
+            Defaults to ``False``.
 
 
         .. note::
             Passing ``None`` to ``limit`` will attempt to retrieve all items in the manga list.
+            Without ``deep``, this stops at the API's pagination cap of 10,000 results.
 
         Raises
         ------
+        TypeError
+            ``deep`` was passed with a ``limit`` or ``order``.
         BadRequest
             The query parameters were not valid.
 
@@ -543,11 +1181,47 @@ class Client:
         :class:`~hondana.MangaCollection`
             Returns a collection of Manga.
         """
+        if deep:
+            if limit is not None or order is not None:
+                msg = "`deep` requires `limit` to be `None` and no `order` to be given."
+                raise TypeError(msg)
+
+            async def fetch(limit: int, offset: int, since: datetime.datetime | None) -> MangaSearchResponse:
+                return await self._http.manga_list(
+                    limit=limit,
+                    offset=offset,
+                    title=title,
+                    author_or_artist=author_or_artist,
+                    authors=authors,
+                    artists=artists,
+                    year=year,
+                    included_tags=included_tags,
+                    excluded_tags=excluded_tags,
+                    status=status,
+                    original_language=original_language,
+                    excluded_original_language=excluded_original_language,
+                    available_translated_language=available_translated_language,
+                    publication_demographic=publication_demographic,
+                    ids=ids,
+                    content_rating=content_rating,
+                    created_at_since=since,
+                    updated_at_since=updated_at_since,
+                    order=MangaListOrderQuery(created_at=Order.ascending),
+                    includes=includes or MangaIncludes(),
+                    has_available_chapters=has_available_chapters,
+                    has_unavailable_chapters=has_unavailable_chapters,
+                    group=group,
+                )
+
+            items, first = await self._created_at_keyset(fetch, limit=100, created_at_since=created_at_since)
+            return MangaCollection(self._http, first, [Manga(self._http, item) for item in items])
+
+        fetch_page, chunked = self._by_ids(self._http.manga_list, ids, limit)
         inner_limit = limit or 100
 
         manga: list[Manga] = []
         while True:
-            data = await self._http.manga_list(
+            data = await fetch_page(
                 limit=inner_limit,
                 offset=offset,
                 title=title,
@@ -576,7 +1250,7 @@ class Client:
             manga.extend([Manga(self._http, item) for item in data["data"]])
 
             offset += inner_limit
-            if not data["data"] or offset >= 10_000 or limit is not None:
+            if chunked or not data["data"] or offset >= 10_000 or limit is not None:
                 break
 
         return MangaCollection(self._http, data, manga)
@@ -738,6 +1412,9 @@ class Client:
 
         .. versionadded:: 2.0.11
         """
+        if payload := await self._from_store("manga", manga_id, includes):
+            return Manga(self._http, payload)
+
         data = await self._http.get_manga(manga_id, includes=includes or MangaIncludes())
 
         return Manga(self._http, data["data"])
@@ -1511,6 +2188,7 @@ class Client:
         published_at_since: datetime.datetime | None = None,
         order: FeedOrderQuery | None = None,
         includes: ChapterIncludes | None = None,
+        deep: bool = False,
     ) -> ChapterFeed:
         """|coro|
 
@@ -1524,6 +2202,9 @@ class Client:
             Defaults to 0. This specifies the pagination offset.
         ids: Optional[List[:class:`str`]]
             The list of chapter UUIDs to filter the request with.
+            Too many IDs for one request are split into chunks that are requested concurrently,
+            and ``limit``, ``offset`` and ``order`` are applied to the combined matches. Ordering them by a field which is
+            not a plain attribute (e.g. ``relevance`` or ``title``) raises :exc:`ValueError`.
         title: Optional[:class:`str`]
             The chapter title query to limit the request with.
         groups: Optional[List[:class:`str`]]
@@ -1569,10 +2250,16 @@ class Client:
         includes: Optional[:class:`~hondana.query.ChapterIncludes`]
             The list of options to include increased payloads for per chapter.
             Defaults to all possible expansions.
+        deep: :class:`bool`
+            Whether to retrieve every matching chapter, past the API's 10,000 result pagination cap.
+            The list is walked in ``createdAt`` order by advancing ``created_at_since``, rather than by offset.
+            Requires ``limit`` to be ``None`` and ``order`` to not be given.
+            Defaults to ``False``.
 
 
         .. note::
             Passing ``None`` to ``limit`` will attempt to retrieve all items in the chapter feed.
+            Without ``deep``, this stops at the API's pagination cap of 10,000 results.
 
         .. note::
             If `order` is not specified then the API will return results first based on their creation date,
@@ -1580,6 +2267,8 @@ class Client:
 
         Raises
         ------
+        TypeError
+            ``deep`` was passed with a ``limit`` or ``order``.
         BadRequest
             The query parameters were malformed
         Forbidden
@@ -1590,11 +2279,49 @@ class Client:
         :class:`~hondana.ChapterFeed`
             Returns a collection of chapters.
         """
+        if deep:
+            if limit is not None or order is not None:
+                msg = "`deep` requires `limit` to be `None` and no `order` to be given."
+                raise TypeError(msg)
+
+            async def fetch(limit: int, offset: int, since: datetime.datetime | None) -> GetMultiChapterResponse:
+                return await self._http.chapter_list(
+                    limit=limit,
+                    offset=offset,
+                    ids=ids,
+                    title=title,
+                    groups=groups,
+                    uploader=uploader,
+                    manga=manga,
+                    volume=volume,
+                    chapter=chapter,
+                    translated_language=translated_language,
+                    original_language=original_language,
+                    excluded_original_language=excluded_original_language,
+                    content_rating=content_rating,
+                    excluded_groups=excluded_groups,
+                    excluded_uploaders=excluded_uploaders,
+                    include_future_updates=include_future_updates,
+                    include_empty_pages=include_empty_pages,
+                    include_future_publish_at=include_future_publish_at,
+                    include_external_url=include_external_url,
+                    include_unavailable=include_unavailable,
+                    created_at_since=since,
+                    updated_at_since=updated_at_since,
+                    published_at_since=published_at_since,
+                    order=FeedOrderQuery(created_at=Order.ascending),
+                    includes=includes or ChapterIncludes(),
+                )
+
+            items, first = await self._created_at_keyset(fetch, limit=100, created_at_since=created_at_since)
+            return ChapterFeed(self._http, first, [Chapter(self._http, item) for item in items])
+
+        fetch_page, chunked = self._by_ids(self._http.chapter_list, ids, limit)
         inner_limit = limit or 100
 
         chapters: list[Chapter] = []
         while True:
-            data = await self._http.chapter_list(
+            data = await fetch_page(
                 limit=inner_limit,
                 offset=offset,
                 ids=ids,
@@ -1625,7 +2352,7 @@ class Client:
             chapters.extend([Chapter(self._http, item) for item in data["data"]])
 
             offset += inner_limit
-            if not data["data"] or offset >= 10_000 or limit is not None:
+            if chunked or not data["data"] or offset >= 10_000 or limit is not None:
                 break
 
         return ChapterFeed(self._http, data, chapters)
@@ -1662,9 +2389,11 @@ class Client:
         :class:`~hondana.Chapter`
             The Chapter we fetched from the API.
         """
-        data = await self._http.get_chapter(chapter_id, includes=includes or ChapterIncludes())
-
-        chapter = Chapter(self._http, data["data"])
+        if payload := await self._from_store("chapter", chapter_id, includes):
+            chapter = Chapter(self._http, payload)
+        else:
+            data = await self._http.get_chapter(chapter_id, includes=includes or ChapterIncludes())
+            chapter = Chapter(self._http, data["data"])
 
         if fetch_full_manga:
             if chapter.manga_id is None:
@@ -1814,6 +2543,9 @@ class Client:
             A list of manga UUID(s) to limit the request to.
         ids: Optional[List[:class:`str`]]
             A list of cover art UUID(s) to limit the request to.
+            Too many IDs for one request are split into chunks that are requested concurrently,
+            and ``limit``, ``offset`` and ``order`` are applied to the combined matches. Ordering them by a field which is
+            not a plain attribute (e.g. ``relevance`` or ``title``) raises :exc:`ValueError`.
         uploaders: Optional[List[:class:`str`]]
             A list of uploader UUID(s) to limit the request to.
         locales: Optional[List[:class:`~hondana.types_.common.LanguageCode`]]
@@ -1835,11 +2567,12 @@ class Client:
         :class:`~hondana.CoverCollection`
             Returns a collection of covers.
         """
+        fetch_page, chunked = self._by_ids(self._http.cover_art_list, ids, limit)
         inner_limit = limit or 10
 
         covers: list[Cover] = []
         while True:
-            data = await self._http.cover_art_list(
+            data = await fetch_page(
                 limit=inner_limit,
                 offset=offset,
                 manga=manga,
@@ -1853,7 +2586,7 @@ class Client:
             covers.extend([Cover(self._http, item) for item in data["data"]])
 
             offset += inner_limit
-            if not data["data"] or offset >= 10_000 or limit is not None:
+            if chunked or not data["data"] or offset >= 10_000 or limit is not None:
                 break
 
         return CoverCollection(self._http, data, covers)
@@ -1931,6 +2664,65 @@ class Client:
 
         return Cover(self._http, data["data"])
 
+    async def fetch_covers(
+        self,
+        covers: Iterable[Cover],
+        /,
+        *,
+        size: Literal[256, 512] | None = 256,
+        concurrency: int = 8,
+        cache: CoverCache | None = None,
+    ) -> dict[str, bytes]:
+        """|coro|
+
+        This method will fetch the images of many covers concurrently.
+
+        The images are fetched over a connection pool of their own, so they do not hold up, or wait on, API requests.
+
+        Parameters
+        ----------
+        covers: Iterable[:class:`~hondana.Cover`]
+            The covers to fetch the images of.
+        size: Optional[Literal[``256``, ``512``]]
+            The image size. Defaults to ``256``, pass ``None`` for the original images.
+        concurrency: :class:`int`
+            How many images to fetch at once. Defaults to ``8``.
+        cache: Optional[:class:`~hondana.CoverCache`]
+            An on-disk cache to serve the images from, and stream fetched images into.
+
+
+        .. note::
+            Covers without a parent manga (see :meth:`~hondana.Cover.url`) and images which fail to
+            fetch are left out of the result.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`bytes`]
+            The images, keyed by cover ID.
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(cover: Cover, url: str, /) -> bytes | None:
+            async with semaphore:
+                try:
+                    if cache is not None:
+                        return await cache.fetch(self._http, url, cover.file_name, size)
+                    data, _ = await self._http.fetch_image(url)
+                except (errors.APIException, aiohttp.ClientError):
+                    LOGGER.warning("Failed to fetch the image of cover %r.", cover.id, exc_info=True)
+                    return None
+                return data
+
+        wanted = [(cover, url) for cover in covers if (url := cover.url(size)) is not None]
+        # each image is fetched once, so duplicate covers never stream into the same cache file at once
+        unique: dict[str, tuple[Cover, str]] = {}
+        for cover, url in wanted:
+            unique.setdefault(cover.file_name, (cover, url))
+
+        results = await asyncio.gather(*(fetch(cover, url) for cover, url in unique.values()))
+        images = dict(zip(unique, results, strict=True))
+        return {cover.id: data for cover, _ in wanted if (data := images[cover.file_name]) is not None}
+
     @require_authentication
     async def edit_cover(
         self,
@@ -2021,6 +2813,9 @@ class Client:
             Defaults to 0. The pagination offset.
         ids: Optional[List[:class:`str`]]
             A list of scanlator group UUID(s) to limit the request to.
+            Too many IDs for one request are split into chunks that are requested concurrently,
+            and ``limit``, ``offset`` and ``order`` are applied to the combined matches. Ordering them by a field which is
+            not a plain attribute (e.g. ``relevance`` or ``title``) raises :exc:`ValueError`.
         name: Optional[:class:`str`]
             A name to limit the request to.
         focused_language: Optional[:class:`~hondana.types_.common.LanguageCode`]
@@ -2046,11 +2841,12 @@ class Client:
         :class:`ScanlatorGroupCollection`
             A returned collection of scanlation groups.
         """
+        fetch_page, chunked = self._by_ids(self._http.scanlation_group_list, ids, limit)
         inner_limit = limit or 10
 
         groups: list[ScanlatorGroup] = []
         while True:
-            data = await self._http.scanlation_group_list(
+            data = await fetch_page(
                 limit=inner_limit,
                 offset=offset,
                 ids=ids,
@@ -2063,7 +2859,7 @@ class Client:
             groups.extend([ScanlatorGroup(self._http, item) for item in data["data"]])
 
             offset += inner_limit
-            if not data["data"] or offset >= 10_000 or limit is not None:
+            if chunked or not data["data"] or offset >= 10_000 or limit is not None:
                 break
 
         return ScanlatorGroupCollection(self._http, data, groups)
@@ -2090,6 +2886,9 @@ class Client:
             Defaults to 0. The pagination offset.
         ids: Optional[List[:class:`str`]]
             A list of User UUID(s) to limit the request to.
+            Too many IDs for one request are split into chunks that are requested concurrently,
+            and ``limit``, ``offset`` and ``order`` are applied to the combined matches. Ordering them by a field which is
+            not a plain attribute (e.g. ``relevance`` or ``title``) raises :exc:`ValueError`.
         username: Optional[:class:`str`]
             The username to limit this request to.
         order: Optional[:class:`~hondana.query.UserListOrderQuery`]
@@ -2111,15 +2910,16 @@ class Client:
         :class:`UserCollection`
             A returned collection of users.
         """
+        fetch_page, chunked = self._by_ids(self._http.user_list, ids, limit)
         inner_limit = limit or 10
 
         users: list[User] = []
         while True:
-            data = await self._http.user_list(limit=inner_limit, offset=offset, ids=ids, username=username, order=order)
+            data = await fetch_page(limit=inner_limit, offset=offset, ids=ids, username=username, order=order)
             users.extend([User(self._http, item) for item in data["data"]])
 
             offset += inner_limit
-            if not data["data"] or offset >= 10_000 or limit is not None:
+            if chunked or not data["data"] or offset >= 10_000 or limit is not None:
                 break
 
         return UserCollection(self._http, data, users)
@@ -3281,6 +4081,9 @@ class Client:
             Defaults to 0. The pagination offset.
         ids: Optional[List[:class:`str`]]
             A list of author UUID(s) to limit the request to.
+            Too many IDs for one request are split into chunks that are requested concurrently,
+            and ``limit``, ``offset`` and ``order`` are applied to the combined matches. Ordering them by a field which is
+            not a plain attribute (e.g. ``relevance`` or ``title``) raises :exc:`ValueError`.
         name: Optional[:class:`str`]
             A name to limit the request to.
         order: Optional[:class:`~hondana.query.AuthorListOrderQuery`]
@@ -3305,11 +4108,12 @@ class Client:
         :class:`~hondana.AuthorCollection`
             A returned collection of authors.
         """
+        fetch_page, chunked = self._by_ids(self._http.author_list, ids, limit)
         inner_limit = limit or 10
 
         authors: list[Author] = []
         while True:
-            data = await self._http.author_list(
+            data = await fetch_page(
                 limit=inner_limit,
                 offset=offset,
                 ids=ids,
@@ -3321,7 +4125,7 @@ class Client:
             authors.extend([Author(self._http, item) for item in data["data"]])
 
             offset += inner_limit
-            if not data["data"] or offset >= 10_000 or limit is not None:
+            if chunked or not data["data"] or offset >= 10_000 or limit is not None:
                 break
 
         return AuthorCollection(self._http, data, authors)
@@ -3433,6 +4237,9 @@ class Client:
         :class:`~hondana.Author`
             The Author returned from the API.
         """
+        if payload := await self._from_store("author", author_id, includes):
+            return Author(self._http, payload)
+
         data = await self._http.get_author(author_id, includes=includes or AuthorIncludes())
 
         return Author(self._http, data["data"])
@@ -3694,6 +4501,47 @@ class Client:
 
         return [MangaRating(self._http, id_, stats) for id_, stats in ratings.items()]
 
+    @require_authentication
+    async def get_library_state(self, manga_ids: Iterable[str], /) -> dict[str, MangaLibraryState]:
+        """|coro|
+
+        This method will return your reading status, rating and read chapters for each of the given manga.
+
+        The reading statuses, ratings and read markers are requested concurrently,
+        with the IDs split into URL-safe chunks.
+
+        Parameters
+        ----------
+        manga_ids: Iterable[:class:`str`]
+            The IDs of the manga you wish to fetch your state for.
+
+        Raises
+        ------
+        Forbidden
+            Failed response due to authentication failure.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`~hondana.MangaLibraryState`]
+            The state of each manga, keyed by manga ID and in the order given.
+        """
+        ids = list(dict.fromkeys(manga_ids))
+        statuses, read, ratings = await self._http.get_library_state(ids)
+        status_map = statuses["statuses"] or {}
+
+        ret: dict[str, MangaLibraryState] = {}
+        for id_ in ids:
+            status = status_map.get(id_)
+            rating = ratings.get(id_)
+            ret[id_] = MangaLibraryState(
+                id_,
+                status=ReadingStatus(status) if status else None,
+                rating=MangaRating(self._http, id_, rating) if rating else None,
+                read_chapters=set(read.get(id_, ())),
+            )
+
+        return ret
+
     @require_authentication
     async def set_manga_rating(self, manga_id: str, /, *, rating: int) -> None:
         """|coro|
@@ -3754,6 +4602,11 @@ class Client:
         manga_ids: Optional[List[:class:`str`]]
             The list of manga IDs to fetch the statistics for.
 
+
+        .. note::
+            Only the statistics of the first manga are returned when passing ``manga_ids``.
+            Use :meth:`get_manga_statistics_bulk` to get the statistics of every manga.
+
         Returns
         -------
         :class:`~hondana.MangaStatistics`
@@ -3763,6 +4616,73 @@ class Client:
 
         return MangaStatistics(self._http, key, data["statistics"][key])
 
+    async def get_manga_statistics_bulk(self, manga_ids: Iterable[str], /) -> dict[str, MangaStatistics]:
+        """|coro|
+
+        This method will return the statistics for any number of manga.
+
+        The IDs are split into URL-safe chunks, which are requested concurrently.
+
+        Parameters
+        ----------
+        manga_ids: Iterable[:class:`str`]
+            The manga IDs to fetch the statistics for.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`~hondana.MangaStatistics`]
+            The statistics of each manga, keyed by manga ID. IDs with no statistics are missing.
+        """
+        data = await self._http.get_statistics_bulk("manga", manga_ids)
+
+        return {key: MangaStatistics(self._http, key, payload) for key, payload in data.items()}
+
+    async def get_chapter_statistics_bulk(self, chapter_ids: Iterable[str], /) -> dict[str, ChapterStatistics]:
+        """|coro|
+
+        This method will return the statistics for any number of chapters.
+
+        The IDs are split into URL-safe chunks, which are requested concurrently.
+
+        Parameters
+        ----------
+        chapter_ids: Iterable[:class:`str`]
+            The chapter IDs to fetch the statistics for.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`~hondana.ChapterStatistics`]
+            The statistics of each chapter, keyed by chapter ID. IDs with no statistics are missing.
+        """
+        data = await self._http.get_statistics_bulk("chapter", chapter_ids)
+
+        return {key: ChapterStatistics(self._http, key, payload) for key, payload in data.items()}
+
+    async def get_scanlator_group_statistics_bulk(
+        self,
+        scanlator_group_ids: Iterable[str],
+        /,
+    ) -> dict[str, ScanlatorGroupStatistics]:
+        """|coro|
+
+        This method will return the statistics for any number of scanlator groups.
+
+        The IDs are split into URL-safe chunks, which are requested concurrently.
+
+        Parameters
+        ----------
+        scanlator_group_ids: Iterable[:class:`str`]
+            The scanlator group IDs to fetch the statistics for.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`~hondana.ScanlatorGroupStatistics`]
+            The statistics of each scanlator group, keyed by group ID. IDs with no statistics are missing.
+        """
+        data = await self._http.get_statistics_bulk("group", scanlator_group_ids)
+
+        return {key: ScanlatorGroupStatistics(self._http, key, payload) for key, payload in data.items()}
+
     @require_authentication
     async def abandon_upload_session(self, session_id: str, /) -> None:
         """|coro|
@@ -3793,6 +4713,7 @@ class Client:
         existing_upload_session_id: str | None = None,
         version: int | None = None,
         accept_tos: bool,
+        state_path: PathLike[str] | str | None = None,
     ) -> ChapterUpload:
         """
         This method will return an async `context manager <https://realpython.com/python-with-statement/>`_
@@ -3850,6 +4771,9 @@ class Client:
             Only necessary if ``chapter_to_edit`` is not ``None``.
         accept_tos: :class:`bool`
             Whether you accept the `MangaDex Terms of Service <https://mangadex.org/compliance>`_ by uploading this chapter.
+        state_path: Optional[Union[:class:`os.PathLike`, :class:`str`]]
+            A file to persist the upload session's state to, so an interrupted upload can resume the same session.
+            See :class:`~hondana.ChapterUpload`.
 
 
         .. note::
@@ -3873,6 +4797,7 @@ class Client:
             existing_upload_session_id=existing_upload_session_id,
             version=version,
             accept_tos=accept_tos,
+            state_path=state_path,
         )
 
     @require_authentication
@@ -3893,6 +4818,7 @@ class Client:
         version: int | None = None,
         accept_tos: bool,
         images: list[pathlib.Path],
+        state_path: PathLike[str] | str | None = None,
     ) -> Chapter:
         """|coro|
 
@@ -3935,6 +4861,20 @@ class Client:
             Whether you accept the `MangaDex Terms of Service <https://mangadex.org/compliance>`_ by uploading this chapter.
         images: List[:class:`pathlib.Path`]
             The list of images to upload as their Paths.
+        state_path: Optional[Union[:class:`os.PathLike`, :class:`str`]]
+            A file to persist the upload session's state to, so an interrupted upload can resume the same session.
+            See :class:`~hondana.ChapterUpload`.
+
+        Raises
+        ------
+        UploadValidationError
+            One or more images failed :meth:`ChapterUpload.validate_images <hondana.ChapterUpload.validate_images>`.
+            This is checked before an upload session is opened.
+        UploadIncomplete
+            Images were still not uploaded after every retry. The chapter is not committed.
+            The session is abandoned, unless ``state_path`` is given so that it can be resumed.
+        ValueError
+            ``state_path`` holds the state of an upload for another manga, chapter or language.
 
         Returns
         -------
@@ -3960,6 +4900,9 @@ class Client:
             I personally advise the `context manager <https://realpython.com/python-with-statement/>`_
             method as it allows more control over your upload session.
         """
+        # checked before the session is opened, so a bad file never leaves one dangling
+        await ChapterUpload.validate_images(images)
+
         async with ChapterUpload(
             self._http,
             manga,
@@ -3974,8 +4917,15 @@ class Client:
             existing_upload_session_id=existing_upload_session_id,
             accept_tos=accept_tos,
             version=version,
+            state_path=state_path,
         ) as session:
-            await session.upload_images(images)
+            result = await session.upload_images(images, validate=False)
+            if result.has_failures:
+                # a chapter is never committed with pages missing; with a state file the session can be resumed
+                if state_path is None:
+                    await session.abandon()
+                raise errors.UploadIncomplete(result)
+
             return await session.commit()
 
     @require_authentication
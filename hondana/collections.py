@@ -24,25 +24,34 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import csv
+import datetime
+import json
+import math
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, TypeVar
+from array import array
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import IO
+
     from .author import Author
-    from .chapter import Chapter, PreviouslyReadChapter
+    from .chapter import Chapter, ChapterStatistics, PreviouslyReadChapter
     from .cover import Cover
     from .custom_list import CustomList
     from .http import HTTPClient
     from .legacy import LegacyItem
-    from .manga import Manga, MangaRelation
+    from .manga import Manga, MangaRelation, MangaStatistics
     from .report import Report, UserReport
     from .scanlator_group import ScanlatorGroup
     from .types_.author import GetMultiAuthorResponse
-    from .types_.chapter import ChapterReadHistoryResponse, GetMultiChapterResponse
+    from .types_.chapter import ChapterReadHistoryResponse, ChapterResponse, GetMultiChapterResponse
     from .types_.cover import GetMultiCoverResponse
     from .types_.custom_list import GetMultiCustomListResponse
     from .types_.legacy import GetLegacyMappingResponse
-    from .types_.manga import MangaRelationResponse, MangaSearchResponse
+    from .types_.manga import MangaRelationResponse, MangaResponse, MangaSearchResponse
+    from .types_.relationship import RelationshipResponse
     from .types_.report import GetReportReasonResponse, GetUserReportReasonResponse
     from .types_.scanlator_group import GetMultiScanlationGroupResponse
     from .types_.user import GetMultiUserResponse
@@ -65,6 +74,171 @@ __all__ = (
 
 T = TypeVar("T")
 
+ColumnFormat = Literal["csv", "ndjson"]
+Columns = dict[str, "array[Any] | list[Any]"]
+
+# (column name, array typecode or ``None`` for a plain list)
+_CHAPTER_COLUMNS: tuple[tuple[str, str | None], ...] = (
+    ("id", None),
+    ("volume", "d"),
+    ("chapter", "d"),
+    ("translated_language", None),
+    ("pages", "q"),
+    ("version", "q"),
+    ("created_at", "d"),
+    ("updated_at", "d"),
+    ("published_at", "d"),
+    ("readable_at", "d"),
+    ("manga_id", None),
+    ("scanlator_group_ids", None),
+    ("uploader_id", None),
+)
+_MANGA_COLUMNS: tuple[tuple[str, str | None], ...] = (
+    ("id", None),
+    ("original_language", None),
+    ("status", None),
+    ("content_rating", None),
+    ("publication_demographic", None),
+    ("year", "q"),
+    ("last_volume", "d"),
+    ("last_chapter", "d"),
+    ("version", "q"),
+    ("created_at", "d"),
+    ("updated_at", "d"),
+    ("tag_ids", None),
+    ("author_ids", None),
+    ("artist_ids", None),
+    ("cover_id", None),
+)
+
+
+def _to_number(value: str | None, /) -> float:
+    if not value:
+        return math.nan
+    try:
+        return float(value)
+    except ValueError:
+        return math.nan
+
+
+def _to_epoch(value: str | None, /) -> float:
+    if not value:
+        return math.nan
+    return datetime.datetime.fromisoformat(value).timestamp()
+
+
+def _relationship_ids(relationships: Iterable[RelationshipResponse | None], type_: str, /) -> tuple[str, ...]:
+    return tuple(item["id"] for item in relationships if item and item["type"] == type_)
+
+
+def _chapter_row(payload: ChapterResponse, relationships: list[RelationshipResponse], /) -> tuple[Any, ...]:
+    attributes = payload["attributes"]
+    manga_ids = _relationship_ids(relationships, "manga")
+    uploader_ids = _relationship_ids(relationships, "user")
+    return (
+        payload["id"],
+        _to_number(attributes["volume"]),
+        _to_number(attributes["chapter"]),
+        attributes["translatedLanguage"],
+        attributes["pages"],
+        attributes["version"],
+        _to_epoch(attributes["createdAt"]),
+        _to_epoch(attributes["updatedAt"]),
+        _to_epoch(attributes["publishAt"]),
+        _to_epoch(attributes["readableAt"]),
+        manga_ids[0] if manga_ids else None,
+        _relationship_ids(relationships, "scanlation_group"),
+        uploader_ids[0] if uploader_ids else None,
+    )
+
+
+def _manga_row(payload: MangaResponse, relationships: list[RelationshipResponse], /) -> tuple[Any, ...]:
+    attributes = payload["attributes"]
+    cover_ids = _relationship_ids(relationships, "cover_art")
+    return (
+        payload["id"],
+        attributes["originalLanguage"],
+        attributes["status"],
+        attributes["contentRating"],
+        attributes["publicationDemographic"],
+        attributes["year"] or -1,
+        _to_number(attributes["lastVolume"]),
+        _to_number(attributes["lastChapter"]),
+        attributes["version"],
+        _to_epoch(attributes["createdAt"]),
+        _to_epoch(attributes["updatedAt"]),
+        tuple(tag["id"] for tag in attributes["tags"]),
+        _relationship_ids(relationships, "author"),
+        _relationship_ids(relationships, "artist"),
+        cover_ids[0] if cover_ids else None,
+    )
+
+
+def _build_columns(spec: tuple[tuple[str, str | None], ...], rows: Iterable[tuple[Any, ...]], /) -> Columns:
+    columns: list[array[Any] | list[Any]] = [array(typecode) if typecode else [] for _, typecode in spec]
+    appenders = [column.append for column in columns]
+    for row in rows:
+        for append, value in zip(appenders, row, strict=True):
+            append(value)
+
+    return {name: column for (name, _), column in zip(spec, columns, strict=True)}
+
+
+def _iter_column_rows(columns: Columns, /) -> Iterator[dict[str, Any]]:
+    names = list(columns)
+    for values in zip(*columns.values(), strict=True):
+        row: dict[str, Any] = {}
+        for name, value in zip(names, values, strict=True):
+            if isinstance(value, float) and math.isnan(value):
+                value = None  # noqa: PLW2901 # normalising the missing value
+            elif isinstance(value, tuple):
+                value = list[str](value)  # pyright: ignore[reportUnknownArgumentType] # noqa: PLW2901 # ID tuples become json arrays
+            row[name] = value
+        yield row
+
+
+def write_columns(columns: Columns, fp: IO[str], /, *, format: ColumnFormat = "csv") -> int:  # noqa: A002 # mirrors the public kwarg
+    """Stream the output of a ``to_columns()`` call to a text file object, one row at a time.
+
+    Parameters
+    ----------
+    columns: Dict[:class:`str`, Union[:class:`array.array`, :class:`list`]]
+        The columns to write.
+    fp: :class:`typing.IO`
+        The text file object to write to.
+    format: Literal[``"csv"``, ``"ndjson"``]
+        The output format. Multi-valued columns are joined with ``;`` in CSV output.
+        Defaults to ``"csv"``.
+
+    Raises
+    ------
+    ValueError
+        An unknown format was passed.
+
+    Returns
+    -------
+    :class:`int`
+        The number of rows written.
+    """
+    if format not in {"csv", "ndjson"}:
+        msg = f"Unknown column output format: {format!r}"
+        raise ValueError(msg)
+
+    written = 0
+    if format == "csv":
+        writer = csv.DictWriter(fp, fieldnames=list(columns))
+        writer.writeheader()
+        for row in _iter_column_rows(columns):
+            writer.writerow({k: ";".join(v) if isinstance(v, list) else v for k, v in row.items()})  # pyright: ignore[reportUnknownArgumentType] # list columns are always IDs
+            written += 1
+    else:
+        for row in _iter_column_rows(columns):
+            fp.write(json.dumps(row, separators=(",", ":")))
+            fp.write("\n")
+            written += 1
+
+    return written
+
 
 class BaseCollection(ABC, Generic[T]):
     """
@@ -146,6 +320,78 @@ class MangaCollection(BaseCollection["Manga"]):
         """
         return self.manga
 
+    @staticmethod
+    def columns_from_payloads(payloads: Iterable[MangaResponse], /) -> Columns:
+        """
+        Builds the columnar form of :meth:`to_columns` directly from raw manga payloads, without creating any models.
+
+        Parameters
+        ----------
+        payloads: Iterable[:class:`~hondana.types_.manga.MangaResponse`]
+            The raw manga payloads, e.g. the ``"data"`` key of a manga list response.
+
+        Returns
+        -------
+        Dict[:class:`str`, Union[:class:`array.array`, :class:`list`]]
+        """
+        return _build_columns(_MANGA_COLUMNS, (_manga_row(item, item.get("relationships", [])) for item in payloads))
+
+    def to_columns(self) -> Columns:
+        """
+        Exports the manga in this collection as a mapping of column name to column.
+
+        Numeric columns are :class:`array.array` instances (``"d"`` or ``"q"``), so they can be handed to
+        vectorised tooling without a copy. Timestamps are UTC epoch seconds, missing numbers are ``nan``
+        and a missing ``year`` is ``-1``. Relationship columns hold tuples of IDs.
+
+        Returns
+        -------
+        Dict[:class:`str`, Union[:class:`array.array`, :class:`list`]]
+        """
+        return _build_columns(
+            _MANGA_COLUMNS,
+            (_manga_row(item._data or item.to_payload(), item._relationship_payloads()) for item in self.manga),  # pyright: ignore[reportPrivateUsage] # noqa: SLF001 # internal raw access
+        )
+
+    def write_columns(self, fp: IO[str], /, *, format: ColumnFormat = "csv") -> int:  # noqa: A002 # matches write_columns
+        """
+        Streams :meth:`to_columns` to a text file object as CSV or NDJSON.
+
+        Parameters
+        ----------
+        fp: :class:`typing.IO`
+            The text file object to write to.
+        format: Literal[``"csv"``, ``"ndjson"``]
+            The output format, defaults to ``"csv"``.
+
+        Returns
+        -------
+        :class:`int`
+            The number of rows written.
+        """
+        return write_columns(self.to_columns(), fp, format=format)
+
+    async def fetch_statistics(self) -> dict[str, MangaStatistics]:
+        """|coro|
+
+        Fetches the statistics of every manga in this collection in bulk, and caches them as each manga's
+        :attr:`~hondana.Manga.stats`.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`~hondana.MangaStatistics`]
+            The statistics, keyed by manga ID.
+        """
+        from .manga import MangaStatistics  # noqa: PLC0415 # circular import
+
+        data = await self._http.get_statistics_bulk("manga", [item.id for item in self.manga])
+
+        ret: dict[str, MangaStatistics] = {}
+        for item in self.manga:
+            if (payload := data.get(item.id)) is not None:
+                item.stats = ret[item.id] = MangaStatistics(self._http, item.id, payload)
+        return ret
+
 
 class MangaRelationCollection(BaseCollection["MangaRelation"]):
     """
@@ -252,6 +498,78 @@ class ChapterFeed(BaseCollection["Chapter"]):
         """
         return self.chapters
 
+    @staticmethod
+    def columns_from_payloads(payloads: Iterable[ChapterResponse], /) -> Columns:
+        """
+        Builds the columnar form of :meth:`to_columns` directly from raw chapter payloads, without creating any models.
+
+        Parameters
+        ----------
+        payloads: Iterable[:class:`~hondana.types_.chapter.ChapterResponse`]
+            The raw chapter payloads, e.g. the ``"data"`` key of a chapter list response.
+
+        Returns
+        -------
+        Dict[:class:`str`, Union[:class:`array.array`, :class:`list`]]
+        """
+        return _build_columns(_CHAPTER_COLUMNS, (_chapter_row(item, item.get("relationships", [])) for item in payloads))
+
+    def to_columns(self) -> Columns:
+        """
+        Exports the chapters in this feed as a mapping of column name to column.
+
+        Numeric columns are :class:`array.array` instances (``"d"`` or ``"q"``), so they can be handed to
+        vectorised tooling without a copy. Timestamps are UTC epoch seconds and non-numeric chapter or volume
+        identifiers are ``nan``. ``scanlator_group_ids`` holds tuples of IDs.
+
+        Returns
+        -------
+        Dict[:class:`str`, Union[:class:`array.array`, :class:`list`]]
+        """
+        return _build_columns(
+            _CHAPTER_COLUMNS,
+            (_chapter_row(item._data or item.to_payload(), item._relationship_payloads()) for item in self.chapters),  # pyright: ignore[reportPrivateUsage] # noqa: SLF001 # internal raw access
+        )
+
+    def write_columns(self, fp: IO[str], /, *, format: ColumnFormat = "csv") -> int:  # noqa: A002 # matches write_columns
+        """
+        Streams :meth:`to_columns` to a text file object as CSV or NDJSON.
+
+        Parameters
+        ----------
+        fp: :class:`typing.IO`
+            The text file object to write to.
+        format: Literal[``"csv"``, ``"ndjson"``]
+            The output format, defaults to ``"csv"``.
+
+        Returns
+        -------
+        :class:`int`
+            The number of rows written.
+        """
+        return write_columns(self.to_columns(), fp, format=format)
+
+    async def fetch_statistics(self) -> dict[str, ChapterStatistics]:
+        """|coro|
+
+        Fetches the statistics of every chapter in this collection in bulk, and caches them as each chapter's
+        :attr:`~hondana.Chapter.stats`.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`~hondana.ChapterStatistics`]
+            The statistics, keyed by chapter ID.
+        """
+        from .chapter import ChapterStatistics  # noqa: PLC0415 # circular import
+
+        data = await self._http.get_statistics_bulk("chapter", [item.id for item in self.chapters])
+
+        ret: dict[str, ChapterStatistics] = {}
+        for item in self.chapters:
+            if (payload := data.get(item.id)) is not None:
+                item._stats = ret[item.id] = ChapterStatistics(self._http, item.id, payload)  # pyright: ignore[reportPrivateUsage] # noqa: SLF001 # the stats cache is read-only publicly
+        return ret
+
 
 class AuthorCollection(BaseCollection["Author"]):
     """
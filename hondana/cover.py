@@ -24,13 +24,18 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
-from typing import TYPE_CHECKING, Literal
+import pathlib
+import time
+from typing import TYPE_CHECKING, Any, Literal
 
 from .user import User
-from .utils import MISSING, RelationshipResolver, Route, require_authentication
+from .utils import MISSING, RelationshipResolver, Route, from_json, require_authentication, to_json
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     from .http import HTTPClient
     from .types_.common import LanguageCode
     from .types_.cover import CoverResponse
@@ -38,7 +43,10 @@ if TYPE_CHECKING:
     from .types_.user import UserResponse
 
 
-__all__ = ("Cover",)
+__all__ = (
+    "Cover",
+    "CoverCache",
+)
 
 
 class Cover:
@@ -258,3 +266,162 @@ class Cover:
             The request returned an error due to authentication.
         """
         await self._http.delete_cover(self.id)
+
+
+class CoverCache:
+    """An on-disk cache of cover images, used by :meth:`Client.fetch_covers`.
+
+    Cover file names are unique and never reused for other images, so an image is stored under its
+    file name and size and served from disk from then on. With ``max_age`` set, older entries are
+    revalidated with a conditional request, which only transfers the image again if it changed.
+
+    Parameters
+    ----------
+    path: Union[:class:`os.PathLike`, :class:`str`]
+        The directory to store the images in. It is created when needed.
+    max_age: Optional[:class:`datetime.timedelta`]
+        How long an entry is used before it is revalidated. Defaults to ``None``, to never revalidate.
+
+    Attributes
+    ----------
+    path: :class:`pathlib.Path`
+        The directory the images are stored in.
+    max_age: Optional[:class:`datetime.timedelta`]
+        How long an entry is used before it is revalidated.
+    """
+
+    __slots__ = (
+        "max_age",
+        "path",
+    )
+
+    def __init__(self, path: PathLike[str] | str, /, *, max_age: datetime.timedelta | None = None) -> None:
+        self.path: pathlib.Path = pathlib.Path(path)
+        self.max_age: datetime.timedelta | None = max_age
+
+    def __repr__(self) -> str:
+        return f"<CoverCache path={str(self.path)!r}>"
+
+    def path_for(self, file_name: str, size: Literal[256, 512] | None = None, /) -> pathlib.Path:
+        """The path an image is stored at, whether it has been fetched or not.
+
+        Parameters
+        ----------
+        file_name: :class:`str`
+            The cover's file name.
+        size: Optional[Literal[``256``, ``512``]]
+            The image size, ``None`` for the original.
+
+        Returns
+        -------
+        :class:`pathlib.Path`
+        """
+        name = file_name if size is None else f"{file_name}.{size}.jpg"
+        # spread the entries over subdirectories, so no single directory gets huge
+        return self.path / name[:2] / name
+
+    def get(self, file_name: str, size: Literal[256, 512] | None = None, /) -> bytes | None:
+        """Read an image from the cache, whether it is due for revalidation or not.
+
+        Parameters
+        ----------
+        file_name: :class:`str`
+            The cover's file name.
+        size: Optional[Literal[``256``, ``512``]]
+            The image size, ``None`` for the original.
+
+        Returns
+        -------
+        Optional[:class:`bytes`]
+            The image, if it is cached.
+        """
+        path = self.path_for(file_name, size)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _meta_path(path: pathlib.Path, /) -> pathlib.Path:
+        return path.with_name(f"{path.name}.meta")
+
+    async def fetch(self, http: HTTPClient, url: str, file_name: str, size: Literal[256, 512] | None = None, /) -> bytes:
+        """|coro|
+
+        Return an image from the cache, fetching or revalidating it first if needed.
+
+        Parameters
+        ----------
+        http: :class:`~hondana.http.HTTPClient`
+            The client to fetch with.
+        url: :class:`str`
+            The image URL.
+        file_name: :class:`str`
+            The cover's file name.
+        size: Optional[Literal[``256``, ``512``]]
+            The image size, ``None`` for the original.
+
+        Raises
+        ------
+        APIException
+            The image could not be fetched.
+
+        Returns
+        -------
+        :class:`bytes`
+            The image.
+        """
+        path = self.path_for(file_name, size)
+        cached, meta = await asyncio.to_thread(self._lookup, path)
+        if cached is not None:
+            return cached
+
+        headers: dict[str, str] = {}
+        if etag := meta.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := meta.get("last_modified"):
+            headers["If-Modified-Since"] = last_modified
+
+        data, response = await http.fetch_image(url, destination=path, headers=headers)
+        if data is None:
+            meta["checked"] = time.time()
+            cached = await asyncio.to_thread(self._revalidated, path, meta)
+            if cached is not None:
+                return cached
+            # the stored copy was removed since it was looked up, so it is fetched again without validators
+            return await self.fetch(http, url, file_name, size)
+
+        meta = {
+            "checked": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        await asyncio.to_thread(self._store_meta, path, meta)
+        return data
+
+    def _lookup(self, path: pathlib.Path, /) -> tuple[bytes | None, dict[str, Any]]:
+        # runs in a worker thread; returns the image if it can be served without a request, and the entry's metadata
+        if not path.exists():
+            return None, {}
+
+        try:
+            meta: dict[str, Any] = from_json(self._meta_path(path).read_text("utf-8"))
+        except FileNotFoundError:
+            meta = {}
+
+        if self.max_age is None or time.time() - meta.get("checked", 0) < self.max_age.total_seconds():
+            return path.read_bytes(), meta
+        return None, meta
+
+    def _store_meta(self, path: pathlib.Path, meta: dict[str, Any], /) -> None:
+        # runs in a worker thread
+        self._meta_path(path).write_text(to_json(meta), "utf-8")
+
+    def _revalidated(self, path: pathlib.Path, meta: dict[str, Any], /) -> bytes | None:
+        # runs in a worker thread; the image was unchanged, so the stored copy is served if it is still there
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        self._store_meta(path, meta)
+        return data
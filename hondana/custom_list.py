@@ -199,7 +199,8 @@ class CustomList:
         Parameters
         ----------
         limit: Optional[:class:`int`]
-            The amount of manga to fetch per request, defaults to ``100``.
+            The amount of manga to fetch, defaults to ``100``.
+            Passing ``None`` will fetch every manga in the list.
         offset: :class:`int`
             The pagination offset to begin at. Defaults to ``0``.
 
@@ -213,11 +214,12 @@ class CustomList:
         if not self._manga_relationships:
             return None
 
-        ids = [r["id"] for r in self._manga_relationships]
+        ids = [r["id"] for r in self._manga_relationships][max(offset, 0) :]
+        if limit is not None:
+            ids = ids[:limit]
 
-        data = await self._http.manga_list(
-            limit=limit or 100,
-            offset=offset,
+        data = await self._http.fetch_by_ids(
+            self._http.manga_list,
             title=None,
             author_or_artist=None,
             authors=None,
@@ -24,11 +24,11 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import pathlib
 from enum import Enum
+from typing import TypedDict
 
-from .utils import (
-    _REPORT_REASONS,  # pyright: ignore[reportPrivateUsage] # these will stay private due to potential breakages or changes
-)
+from .utils import from_json
 
 __all__ = (
     "AuthorReportReason",
@@ -131,6 +131,21 @@ class MangaRelationType(Enum):
     alternate_version = "alternate_version"
 
 
+class _ReportReasons(TypedDict):
+    manga: dict[str, str]
+    chapter: dict[str, str]
+    scanlation_group: dict[str, str]
+    author: dict[str, str]
+    user: dict[str, str]
+
+
+# the report reason enums below need their values when they are created, so unlike the tag cache in
+# ``hondana.utils`` this file is read on import
+_REPORT_REASONS: _ReportReasons = from_json(
+    (pathlib.Path(__file__).parent / "extras" / "report_reasons.json").read_text(encoding="utf-8"),
+)
+
+
 class AuthorReportReason(Enum):
     duplicate_entry = _REPORT_REASONS["author"]["duplicate_entry"]
     information_to_correct = _REPORT_REASONS["author"]["information_to_correct"]
@@ -29,6 +29,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     import aiohttp
 
+    from .chapter import UploadData, UploadImageReport
     from .types_.errors import ErrorType
 
 __all__ = (
@@ -43,6 +44,8 @@ __all__ = (
     "TermsOfServiceNotAccepted",
     "Unauthorized",
     "UploadInProgress",
+    "UploadIncomplete",
+    "UploadValidationError",
 )
 
 
@@ -140,6 +143,45 @@ class UploadInProgress(Exception):
         return f"An upload session was already found, it's ID is: {self.session_id}"
 
 
+class UploadValidationError(Exception):
+    """An exception to be raised when images fail validation before they are uploaded.
+
+    Attributes
+    ----------
+    reports: List[:class:`~hondana.UploadImageReport`]
+        The reports of every image which failed validation.
+    """
+
+    __slots__ = ("reports",)
+
+    def __init__(self, reports: list[UploadImageReport], /) -> None:
+        self.reports: list[UploadImageReport] = reports
+        details = "\n".join(f"{report.path.name}: {', '.join(report.problems)}" for report in reports)
+        super().__init__(f"{len(reports)} image(s) failed validation:\n{details}")
+
+
+class UploadIncomplete(Exception):
+    """An exception to be raised when images are still missing from an upload session after every retry.
+
+    Attributes
+    ----------
+    data: :class:`~hondana.UploadData`
+        The upload data, holding the errors of the failed images.
+    files: Set[:class:`str`]
+        The file names of the images which were not uploaded.
+    """
+
+    __slots__ = (
+        "data",
+        "files",
+    )
+
+    def __init__(self, data: UploadData, /) -> None:
+        self.data: UploadData = data
+        self.files: set[str] = data.errored_files
+        super().__init__(f"{len(self.files)} image(s) failed to upload: {', '.join(sorted(self.files))}")
+
+
 class MangaDexServerError(Exception):
     """Generic exception type for when MangaDex is down.
 
@@ -27,9 +27,11 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import sqlite3
 import sys
 import weakref
 from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
 from os import getenv
 from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar, overload
 
@@ -62,25 +64,34 @@ from .errors import (
     Unauthorized,
 )
 from .utils import (
-    MANGA_TAGS,
+    DECODE_THRESHOLD,
+    IMAGE_CHUNK_SIZE,
     MANGADEX_TIME_REGEX,
+    MAX_COMPILED_QUERIES,
     MISSING,
     AuthRoute,
+    CompiledQuery,
+    InternTable,
     Route,
+    as_url_chunks,
     calculate_limits,
     clean_isoformat,
+    decode_json,
     delta_to_iso,
     from_json,
     get_image_mime_type,
     json_or_text,
-    php_query_builder,
+    order_by_attributes,
     to_json,
 )
+from .watchdog import operation
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    import pathlib
+    from collections.abc import Callable, Coroutine, Hashable, Iterable
+    from concurrent.futures import Executor
     from types import TracebackType
-    from typing import TypeAlias
+    from typing import BinaryIO, TypeAlias
 
     from yarl import URL
 
@@ -103,6 +114,7 @@ if TYPE_CHECKING:
         UserReportIncludes,
     )
     from .report import ReportDetails
+    from .store import EntityStore
     from .tags import QueryTags
     from .types_ import (
         artist,
@@ -134,13 +146,18 @@ if TYPE_CHECKING:
 
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
-TAGS: dict[str, str] = MANGA_TAGS
 ALLOWED_IMAGE_FORMATS: set[str] = {"image/png", "image/gif", "image/jpeg", "image/jpg", "image/webp"}
 
 
 __all__ = []
 
 
+def _open_partial(path: pathlib.Path, /) -> BinaryIO:
+    # runs in a worker thread
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.open("wb")
+
+
 class Token:
     __slots__ = (
         "_client_secret",
@@ -269,6 +286,8 @@ class HTTPClient:  # not part of the public API
         "_auth_token",
         "_authenticated",
         "_client_secret",
+        "_compiled_queries",
+        "_image_session",
         "_locks",
         "_oauth_scopes",
         "_password",
@@ -276,6 +295,12 @@ class HTTPClient:  # not part of the public API
         "_session",
         "_token_lock",
         "client_id",
+        "compact_models",
+        "decode_executor",
+        "decode_threshold",
+        "intern_table",
+        "ratelimits",
+        "store",
         "user_agent",
         "username",
     )
@@ -289,8 +314,14 @@ class HTTPClient:  # not part of the public API
         password: str | None = None,
         client_id: str | None = None,
         client_secret: str | None = None,
+        compact_models: bool = False,
+        intern_strings: bool = False,
+        store: EntityStore | None = None,
+        decode_executor: Executor | None = None,
+        decode_threshold: int = DECODE_THRESHOLD,
     ) -> None:
         self._session: aiohttp.ClientSession | None = session
+        self._image_session: aiohttp.ClientSession | None = None
         self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
         self._token_lock: asyncio.Lock = asyncio.Lock()
         user_agent = "Hondana (https://github.com/AbstractUmbra/Hondana {0}) Python/{1[0]}.{1[1]} aiohttp/{2}"
@@ -301,6 +332,13 @@ class HTTPClient:  # not part of the public API
         self._client_secret: str | None = client_secret
         self._auth_token: Token | None = None
         self._refresh_token: Token | None = None
+        self.compact_models: bool = compact_models
+        self.intern_table: InternTable | None = InternTable() if intern_strings else None
+        self.store: EntityStore | None = store
+        self.decode_executor: Executor | None = decode_executor
+        self.decode_threshold: int = decode_threshold
+        self.ratelimits: dict[str, tuple[int, int]] = {}
+        self._compiled_queries: dict[Hashable, CompiledQuery] = {}
         self._authenticated: bool = all([username, password, client_id, client_secret])
         self._resolve_api_type(dev_api=dev_api)
         if any([username, password, client_id, client_secret]) and not self._authenticated:
@@ -336,6 +374,84 @@ class HTTPClient:  # not part of the public API
         if self._session is not None:
             await self._session.close()
 
+        await self.close_image_session()
+
+    async def close_image_session(self) -> None:
+        """|coro|
+
+        This method will close the session used for image downloads, if one was created.
+        """
+        if self._image_session is not None:
+            await self._image_session.close()
+            self._image_session = None
+
+    async def fetch_image(
+        self,
+        url: str,
+        /,
+        *,
+        destination: pathlib.Path | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[bytes | None, aiohttp.ClientResponse]:
+        """|coro|
+
+        Fetches an image outside of the API ratelimit buckets, over a session and connector of its own.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The image URL.
+        destination: Optional[:class:`pathlib.Path`]
+            If given, the body is streamed into this file as it arrives.
+            It is written next to it first, off the event loop, and moved into place once complete or removed if the
+            download fails.
+        headers: Optional[Dict[:class:`str`, :class:`str`]]
+            Extra request headers, e.g. conditional request validators.
+
+        Raises
+        ------
+        APIException
+            The response was neither ``200`` nor ``304``.
+
+        Returns
+        -------
+        Tuple[Optional[:class:`bytes`], :class:`aiohttp.ClientResponse`]
+            The image and the (closed) response. The image is ``None`` for a ``304 Not Modified`` response.
+        """
+        if self._image_session is None:
+            self._image_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                headers={"User-Agent": self.user_agent},
+            )
+
+        async with self._image_session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return None, response
+            if response.status != 200:
+                raise APIException(response, status_code=response.status, errors=[])
+
+            if destination is None:
+                return await response.read(), response
+
+            data = bytearray()
+            partial = destination.with_name(f"{destination.name}.part")
+            fp = await asyncio.to_thread(_open_partial, partial)
+            try:
+                with operation("http.fetch_image"):
+                    async for chunk in response.content.iter_chunked(IMAGE_CHUNK_SIZE):
+                        await asyncio.to_thread(fp.write, chunk)
+                        data += chunk
+                await asyncio.to_thread(fp.close)
+                await asyncio.to_thread(partial.replace, destination)
+            except BaseException:
+                # cleaned up inline so that a cancelled fetch does not leave the partial file behind either
+                fp.close()
+                partial.unlink(missing_ok=True)
+                raise
+
+            return bytes(data), response
+
     async def get_token(self) -> Token:
         if not self.client_id or not self._client_secret:
             msg = "You must pass the correct OAuth2 details to use authentication."
@@ -389,11 +505,60 @@ class HTTPClient:  # not part of the public API
 
         return self._auth_token
 
+    def ratelimit_headroom(self, bucket: str, /) -> float | None:
+        """The fraction of the ratelimit left for a route path, as of its last response.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            Between ``0.0`` and ``1.0``, or ``None`` if the route has no known ratelimit.
+        """
+        remaining, limit = self.ratelimits.get(bucket, (0, 0))
+        if limit <= 0:
+            return None
+        return min(max(remaining / limit, 0.0), 1.0)
+
+    async def _decode(self, response: aiohttp.ClientResponse, /) -> dict[str, Any] | str:
+        if self.decode_executor is None or response.headers.get("content-type") != "application/json":
+            return await json_or_text(response)
+
+        body = await response.read()
+        try:
+            if len(body) < self.decode_threshold:
+                return from_json(body)
+            # large bodies are decoded off the event loop. A thread shares the decoded objects with the loop, so only
+            # another process's result is worth shrinking for pickling, by sharing its repeated strings
+            decode = from_json if isinstance(self.decode_executor, ThreadPoolExecutor) else decode_json
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.decode_executor, decode, body)
+        except ValueError:  # both ``json`` and ``orjson`` decode errors are ValueErrors
+            return body.decode("utf-8")
+
+    def compile_query(self, params: MANGADEX_QUERY_PARAM_TYPE, /) -> CompiledQuery:
+        """Compiles query parameters, reusing the built static part of a previously compiled query.
+
+        Each page of a paginated call only differs by ``limit`` and ``offset``, so it only builds those.
+
+        Returns
+        -------
+        :class:`~hondana.utils.CompiledQuery`
+        """
+        key = CompiledQuery.params_key(params)
+        compiled = self._compiled_queries.pop(key, None)
+        if compiled is None:
+            compiled = CompiledQuery(params)
+            if len(self._compiled_queries) >= MAX_COMPILED_QUERIES:
+                # evict the least recently used
+                del self._compiled_queries[next(iter(self._compiled_queries))]
+        self._compiled_queries[key] = compiled
+
+        return compiled.with_page(limit=params.get("limit"), offset=params.get("offset"))  # pyright: ignore[reportArgumentType] # pagination is always an int
+
     async def request(
         self,
         route: Route | AuthRoute,
         *,
-        params: MANGADEX_QUERY_PARAM_TYPE | None = None,
+        params: MANGADEX_QUERY_PARAM_TYPE | CompiledQuery | None = None,
         json: Any | None = None,
         **kwargs: Any,
     ) -> Any:
@@ -427,6 +592,24 @@ class HTTPClient:  # not part of the public API
         Any
             The potential response data we got from the request.
         """
+        data: Any = await self._request(route, params=params, json=json, **kwargs)
+        # stored once the route's lock is released, and only for reads, so the store never slows or fails a request
+        if self.store is not None and route.verb == "GET" and isinstance(data, dict):
+            try:
+                await self.store.upsert_response(data)  # pyright: ignore[reportUnknownArgumentType] # this is a raw payload
+            except (sqlite3.Error, OSError):
+                LOGGER.exception("Failed to store the response of %s %s.", route.verb, route.path)
+
+        return data  # pyright: ignore[reportUnknownVariableType] # this is a raw payload
+
+    async def _request(
+        self,
+        route: Route | AuthRoute,
+        *,
+        params: MANGADEX_QUERY_PARAM_TYPE | CompiledQuery | None,
+        json: Any | None,
+        **kwargs: Any,
+    ) -> Any:
         if self._session is None:
             self._session = await self._generate_session()
 
@@ -454,14 +637,13 @@ class HTTPClient:  # not part of the public API
             LOGGER.debug("Current json body is: %s", kwargs["data"])
 
         if params:
-            resolved_params = php_query_builder(params)
-            kwargs["params"] = resolved_params
+            kwargs["params"] = (params if isinstance(params, CompiledQuery) else self.compile_query(params)).to_multidict()
 
         kwargs["headers"] = headers
 
         response: aiohttp.ClientResponse | None = None
         await lock.acquire()
-        with MaybeUnlock(lock) as maybe_lock:
+        with MaybeUnlock(lock) as maybe_lock, operation(f"{route.verb} {route.path}"):
             for tries in range(5):
                 try:
                     async with self._session.request(route.verb, route.url, **kwargs) as response:
@@ -477,6 +659,8 @@ class HTTPClient:  # not part of the public API
                         # The total ratelimit session hits
                         limit = response.headers.get("x-ratelimit-limit", None)
                         LOGGER.debug("limit is: %s", limit)
+                        if remaining is not None and limit is not None:
+                            self.ratelimits[bucket] = (int(remaining), int(limit))
 
                         if remaining == "0" and response.status != 429:
                             if not retry:
@@ -492,7 +676,7 @@ class HTTPClient:  # not part of the public API
                             data = (await response.read(), response)
                         else:
                             try:
-                                data = await json_or_text(response)
+                                data = await self._decode(response)
                             except aiohttp.ClientResponseError:
                                 continue
 
@@ -2270,7 +2454,7 @@ class HTTPClient:  # not part of the public API
     def get_chapter_statistics(
         self,
         chapter_id: str | None,
-        chapter_ids: str | None,
+        chapter_ids: list[str] | None,
     ) -> Response[statistics.GetCommentsStatisticsResponse]:
         if chapter_id:
             route = Route("GET", "/statistics/chapter/{chapter_id}", chapter_id=chapter_id, authenticate=True)
@@ -2285,13 +2469,13 @@ class HTTPClient:  # not part of the public API
     def get_scanlation_group_statistics(
         self,
         scanlation_group_id: str | None,
-        scanlation_group_ids: str | None,
+        scanlation_group_ids: list[str] | None,
     ) -> Response[statistics.GetCommentsStatisticsResponse]:
         if scanlation_group_id:
             route = Route(
                 "GET",
                 "/statistics/group/{scanlation_group_id}",
-                scanlation_group_id=scanlation_group_ids,
+                scanlation_group_id=scanlation_group_id,
                 authenticate=True,
             )
             return self.request(route)
@@ -2299,7 +2483,7 @@ class HTTPClient:  # not part of the public API
             route = Route("GET", "/statistics/group", authenticate=True)
             return self.request(route, params={"group": scanlation_group_ids})
 
-        msg = "Either chapter_id or chapter_ids is required."
+        msg = "Either scanlation_group_id or scanlation_group_ids is required."
         raise ValueError(msg)
 
     def get_manga_statistics(
@@ -2319,6 +2503,108 @@ class HTTPClient:  # not part of the public API
         msg = "Either `manga_id` or `manga_ids` must be passed."
         raise ValueError(msg)
 
+    @overload
+    async def get_statistics_bulk(
+        self,
+        type_: Literal["manga"],
+        ids: Iterable[str],
+        /,
+    ) -> dict[str, statistics.MangaStatisticsResponse]: ...
+
+    @overload
+    async def get_statistics_bulk(
+        self,
+        type_: Literal["chapter", "group"],
+        ids: Iterable[str],
+        /,
+    ) -> dict[str, statistics.StatisticsCommentsResponse]: ...
+
+    async def get_statistics_bulk(
+        self,
+        type_: Literal["manga", "chapter", "group"],
+        ids: Iterable[str],
+        /,
+    ) -> dict[str, Any]:
+        # splits the IDs into URL-safe chunks, requests them all at once and merges the per-ID statistics
+        if type_ == "manga":
+            fetch = self.get_manga_statistics
+        elif type_ == "chapter":
+            fetch = self.get_chapter_statistics
+        else:
+            fetch = self.get_scanlation_group_statistics
+
+        chunks = list(as_url_chunks(dict.fromkeys(ids), type_))
+        responses = await asyncio.gather(*(fetch(None, chunk) for chunk in chunks))
+
+        ret: dict[str, Any] = {}
+        for response in responses:
+            ret.update(response["statistics"])
+        return ret
+
+    async def get_library_state(
+        self,
+        manga_ids: Iterable[str],
+        /,
+    ) -> tuple[
+        manga.MangaMultipleReadingStatusResponse,
+        dict[str, list[str]],
+        dict[str, statistics.PersonalMangaRatingsResponse],
+    ]:
+        # the reading statuses can't be filtered by manga, the read markers and ratings are chunked and merged
+        ids = list(dict.fromkeys(manga_ids))
+
+        statuses, markers, ratings = await asyncio.gather(
+            self.get_all_manga_reading_status(),
+            asyncio.gather(*(self.manga_read_markers(chunk, grouped=True) for chunk in as_url_chunks(ids, "ids"))),
+            asyncio.gather(*(self.get_my_ratings(chunk) for chunk in as_url_chunks(ids, "manga"))),
+        )
+
+        read: dict[str, list[str]] = {}
+        for response in markers:
+            # an empty mapping is sent as an empty list
+            read.update(response["data"] or {})
+
+        rated: dict[str, statistics.PersonalMangaRatingsResponse] = {}
+        for response in ratings:
+            rated.update(response["ratings"] or {})
+
+        return statuses, read, rated
+
+    async def fetch_by_ids(
+        self,
+        fetch: Callable[..., Response[T]],
+        /,
+        *,
+        ids: list[str] | None,
+        max_results: int | None = None,
+        offset: int = 0,
+        order: Any | None = None,
+        **kwargs: Any,
+    ) -> T:
+        # splits the ``ids[]`` filter of a list endpoint into URL-safe chunks and requests them all at once,
+        # then orders, offsets and limits the merged results as the API would have for a single request
+        kwargs.pop("limit", None)
+
+        ordered = list(dict.fromkeys(ids or ()))
+        responses: list[Any] = await asyncio.gather(
+            *(
+                fetch(limit=len(chunk), offset=0, ids=chunk, order=order, **kwargs)
+                for chunk in as_url_chunks(ordered, "ids")
+            ),
+        )
+
+        found: dict[str, Any] = {item["id"]: item for response in responses for item in response["data"]}
+        data = [found[id_] for id_ in ordered if id_ in found]
+        total = len(data)
+        if order is not None:
+            data = order_by_attributes(data, order.to_dict())
+
+        end = None if max_results is None else offset + max_results
+        data = data[offset:end]
+        base: dict[str, Any] = responses[0] if responses else {"result": "ok", "response": "collection"}
+
+        return {**base, "data": data, "limit": len(data), "offset": offset, "total": total}  # pyright: ignore[reportReturnType] # the merged response has the shape of the endpoint's
+
     def open_upload_session(
         self,
         manga_id: str,
@@ -34,14 +34,22 @@ from .cover import Cover
 from .enums import ContentRating, MangaRelationType, MangaState, MangaStatus, PublicationDemographic, ReadingStatus
 from .forums import MangaComments
 from .query import ArtistIncludes, AuthorIncludes, ChapterIncludes, CoverIncludes, FeedOrderQuery, MangaIncludes
-from .tags import Tag
-from .utils import MISSING, RelationshipResolver, cached_slot_property, require_authentication, to_multidict
+from .tags import TagRegistry
+from .utils import (
+    MISSING,
+    InternTable,
+    RelationshipResolver,
+    cached_slot_property,
+    compact_relationships,
+    require_authentication,
+    to_multidict,
+)
 
 if TYPE_CHECKING:
     from multidict import MultiDict
 
     from .http import HTTPClient
-    from .tags import QueryTags
+    from .tags import QueryTags, Tag
     from .types_ import manga
     from .types_.artist import ArtistResponse
     from .types_.author import AuthorResponse
@@ -59,6 +67,7 @@ if TYPE_CHECKING:
 
 __all__ = (
     "Manga",
+    "MangaLibraryState",
     "MangaRating",
     "MangaRelation",
     "MangaStatistics",
@@ -109,6 +118,12 @@ class Manga:
 
     .. note::
         The :attr:`stats` is only populated after :meth:`~hondana.Manga.get_statistics` is called.
+
+    .. note::
+        When the client was created with ``compact_models=True`` the raw payload is not retained, tags are held only
+        as the :class:`~hondana.TagRegistry`'s shared instances and relationships are reduced to their IDs,
+        so :attr:`authors`, :attr:`artists`, :attr:`cover` and :attr:`related_manga` return ``None`` unless set or fetched.
+        Use :meth:`to_payload` to rebuild the payload.
     """
 
     __slots__ = (
@@ -151,9 +166,26 @@ class Manga:
 
     def __init__(self, http: HTTPClient, payload: manga.MangaResponse) -> None:
         self._http = http
-        self._data = payload
+        self._data: manga.MangaResponse | None = payload
         relationships: list[RelationshipResponse] = self._data.pop("relationships", [])
-        self._attributes = payload["attributes"]
+        self._attributes: manga.MangaAttributesResponse | None = payload["attributes"]
+        intern_table: InternTable | None = getattr(http, "intern_table", None)
+        if intern_table is not None:
+            # only values which repeat across entities are interned, as the table holds everything it is given
+            intern_table.update(payload, "type")  # pyright: ignore[reportArgumentType] # TypedDicts are mutable mappings
+            intern_table.update(
+                self._attributes,  # pyright: ignore[reportArgumentType] # TypedDicts are mutable mappings
+                "originalLanguage",
+                "availableTranslatedLanguages",
+                "publicationDemographic",
+                "contentRating",
+                "status",
+                "state",
+            )
+            self._attributes["tags"] = [
+                intern_table.shared(("tag", tag["id"], tag["attributes"]["version"]), tag)
+                for tag in self._attributes["tags"]
+            ]
         self.id: str = payload["id"]
         self._title: LocalizedString = self._attributes["title"]
         self._description: LocalizedString = self._attributes["description"]
@@ -187,23 +219,29 @@ class Manga:
         self._author_relationships: list[AuthorResponse] = RelationshipResolver["AuthorResponse"](
             relationships,
             "author",
+            intern_table=intern_table,
         ).resolve()
         self._artist_relationships: list[ArtistResponse] = RelationshipResolver["ArtistResponse"](
             relationships,
             "artist",
+            intern_table=intern_table,
         ).resolve()
         self._related_manga_relationships: list[MangaResponse] = RelationshipResolver["MangaResponse"](
             relationships,
             "manga",
+            intern_table=intern_table,
         ).resolve()
         self._cover_relationship: CoverResponse | None = RelationshipResolver["CoverResponse"](
             relationships,
             "cover_art",
+            intern_table=intern_table,
         ).pop(with_fallback=True)
         self.__authors: list[Author] | None = None
         self.__artists: list[Artist] | None = None
         self.__cover: Cover | None = None
         self.__related_manga: list[Manga] | None = None
+        if getattr(http, "compact_models", False):
+            self._compact()
 
     def __repr__(self) -> str:
         return f"<Manga id={self.id!r} title={self.title!r}>"
@@ -220,6 +258,72 @@ class Manga:
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    def _compact(self) -> None:
+        self._data = None
+        self._attributes = None
+        self._author_relationships = compact_relationships(self._author_relationships)
+        self._artist_relationships = compact_relationships(self._artist_relationships)
+        self._related_manga_relationships = compact_relationships(self._related_manga_relationships)
+        if self._cover_relationship:
+            self._cover_relationship = compact_relationships([self._cover_relationship])[0]
+        # resolving ``tags`` caches the registry's shared instances, so this manga's copies of the tag payloads can go
+        _ = self.tags
+        self._tags = []
+
+    def to_payload(self) -> manga.MangaResponse:
+        """
+        Rebuilds the API payload of this manga from its parsed fields.
+
+        Relationships are included as they are currently held, so they will only be
+        ``id`` and ``type`` stubs for compacted models.
+
+        Returns
+        -------
+        :class:`~hondana.types_.manga.MangaResponse`
+        """
+        attributes: manga.MangaAttributesResponse = {
+            "title": self._title,
+            "altTitles": [{key: value} for key, value in self.alternate_titles.items()],  # pyright: ignore[reportAssignmentType] # narrowing of a Literal
+            "description": self._description,
+            "isLocked": self.locked,
+            "links": self.links,
+            "originalLanguage": self.original_language,
+            "lastVolume": self.last_volume,
+            "lastChapter": self.last_chapter,
+            "publicationDemographic": self.publication_demographic.value if self.publication_demographic else None,
+            "status": self.status.value if self.status else None,  # pyright: ignore[reportAssignmentType] # the API can send null here
+            "year": self.year,
+            "contentRating": self.content_rating.value if self.content_rating else None,
+            "chapterNumbersResetOnNewVolume": self.chapter_numbers_reset_on_new_volume,
+            "latestUploadedChapter": self.latest_uploaded_chapter,
+            "availableTranslatedLanguages": self.available_translated_languages,
+            "tags": [tag.to_payload() for tag in self.tags],
+            "state": self.state.value if self.state else None,  # pyright: ignore[reportAssignmentType] # the API can send null here
+            "version": self.version,
+            "createdAt": self._created_at,
+            "updatedAt": self._updated_at,
+        }
+        payload: manga.MangaResponse = {
+            "id": self.id,
+            "type": "manga",
+            "attributes": attributes,
+            "relationships": self._relationship_payloads(),
+        }
+        if self.relation_type:
+            payload["related"] = self.relation_type.value  # pyright: ignore[reportGeneralTypeIssues] # the payload holds the raw value
+
+        return payload
+
+    def _relationship_payloads(self) -> list[RelationshipResponse]:
+        relationships: list[RelationshipResponse] = [
+            *self._author_relationships,
+            *self._artist_relationships,
+            *self._related_manga_relationships,
+        ]  # pyright: ignore[reportAssignmentType] # these are relationship payloads
+        if self._cover_relationship:
+            relationships.append(self._cover_relationship)  # pyright: ignore[reportArgumentType] # these are relationship payloads
+        return relationships
+
     @property
     def url(self) -> str:
         """The URL to this manga.
@@ -323,8 +427,11 @@ class Manga:
         -------
         List[:class:`~hondana.Tag`]
             The list of tags that this manga is associated with.
+            These are the shared instances held by the default :class:`~hondana.TagRegistry`.
         """
-        return [Tag(item) for item in self._tags]
+        registry = TagRegistry.default()
+        intern_table = getattr(self._http, "intern_table", None)
+        return [registry.shared(item, intern_table=intern_table) for item in self._tags]
 
     @property
     def artists(self) -> list[Artist] | None:
@@ -1595,3 +1702,44 @@ class MangaRating:
 
     def __repr__(self) -> str:
         return f"<MangaRating parent_id={self.parent_id!r}>"
+
+
+class MangaLibraryState:
+    """
+    A small object to encompass your personal state for a manga, as returned by :meth:`~hondana.Client.get_library_state`.
+
+    Attributes
+    ----------
+    manga_id: :class:`str`
+        The manga this state belongs to.
+    status: Optional[:class:`~hondana.ReadingStatus`]
+        Your reading status for this manga, or ``None`` if it is not in your library.
+    rating: Optional[:class:`~hondana.MangaRating`]
+        Your personal rating for this manga, if any.
+    read_chapters: Set[:class:`str`]
+        The IDs of the chapters of this manga you have read.
+    """
+
+    __slots__ = (
+        "manga_id",
+        "rating",
+        "read_chapters",
+        "status",
+    )
+
+    def __init__(
+        self,
+        manga_id: str,
+        /,
+        *,
+        status: ReadingStatus | None,
+        rating: MangaRating | None,
+        read_chapters: set[str],
+    ) -> None:
+        self.manga_id: str = manga_id
+        self.status: ReadingStatus | None = status
+        self.rating: MangaRating | None = rating
+        self.read_chapters: set[str] = read_chapters
+
+    def __repr__(self) -> str:
+        return f"<MangaLibraryState manga_id={self.manga_id!r} status={self.status!r}>"
@@ -0,0 +1,261 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+import aiohttp
+
+from .client import Client
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Iterator
+    from types import TracebackType
+    from typing import Self
+
+    from .http import HTTPClient
+    from .store import EntityStore
+
+    T = TypeVar("T")
+    BE = TypeVar("BE", bound=BaseException)
+
+__all__ = (
+    "ClientCredentials",
+    "ClientPool",
+)
+
+
+class ClientCredentials(NamedTuple):
+    """The OAuth2 credentials of one account in a :class:`ClientPool`."""
+
+    username: str
+    password: str
+    client_id: str
+    client_secret: str
+
+
+class ClientPool:
+    """A pool of authenticated clients for several accounts, sharing one connection pool.
+
+    Authenticated calls are spread across the accounts by their remaining ratelimits,
+    or pinned to one account when the operation is scoped to that user.
+    Unauthenticated calls go through :attr:`public`, so they all share one set of ratelimit buckets.
+
+    The pool must be logged in (see :meth:`login`) before use, which is done for you
+    when using it as an async context manager.
+
+    Parameters
+    ----------
+    credentials: Iterable[:class:`ClientCredentials`]
+        The credentials of each account. Usernames must be unique.
+    session: Optional[:class:`aiohttp.ClientSession`]
+        The session every client will share once logged in. If not given, one is created (and closed) by the pool.
+    dev_api: :class:`bool`
+        If you want to use the Dev api instead of production.
+        Defaults to ``False``.
+    compact_models: :class:`bool`
+        Passed to each :class:`~hondana.Client`.
+    intern_strings: :class:`bool`
+        Passed to each :class:`~hondana.Client`.
+    store: Optional[:class:`~hondana.EntityStore`]
+        Passed to each :class:`~hondana.Client`.
+
+    Raises
+    ------
+    ValueError
+        No credentials were given, or a username was given more than once.
+    """
+
+    __slots__ = (
+        "_clients",
+        "_owns_session",
+        "_session",
+        "_uses",
+        "public",
+    )
+
+    def __init__(
+        self,
+        credentials: Iterable[ClientCredentials],
+        /,
+        *,
+        session: aiohttp.ClientSession | None = None,
+        dev_api: bool = False,
+        compact_models: bool = False,
+        intern_strings: bool = False,
+        store: EntityStore | None = None,
+    ) -> None:
+        self._clients: dict[str, Client] = {}
+        for item in credentials:
+            if item.username in self._clients:
+                msg = f"The username {item.username!r} was given more than once."
+                raise ValueError(msg)
+
+            self._clients[item.username] = Client(
+                username=item.username,
+                password=item.password,
+                client_id=item.client_id,
+                client_secret=item.client_secret,
+                dev_api=dev_api,
+                compact_models=compact_models,
+                intern_strings=intern_strings,
+                store=store,
+            )
+
+        if not self._clients:
+            msg = "A ClientPool needs at least one set of credentials."
+            raise ValueError(msg)
+
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session: bool = session is None
+        self._uses: dict[str, int] = dict.fromkeys(self._clients, 0)
+        self.public: Client = Client(
+            compact_models=compact_models,
+            intern_strings=intern_strings,
+            store=store,
+        )
+
+    def __repr__(self) -> str:
+        return f"<ClientPool accounts={len(self._clients)}>"
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._clients)
+
+    def __getitem__(self, username: str, /) -> Client:
+        """Returns the client of ``username``, for operations scoped to that user."""
+        return self._clients[username]
+
+    async def __aenter__(self) -> Self:
+        await self.login()
+        return self
+
+    async def __aexit__(self, type_: type[BE] | None, value: BE, traceback: TracebackType) -> None:  # noqa: PYI036 # not expanding the typevar
+        await self.close()
+
+    @staticmethod
+    def _http(client: Client, /) -> HTTPClient:
+        return client._http  # pyright: ignore[reportPrivateUsage] # noqa: SLF001 # the pool manages its clients' internals
+
+    async def login(self) -> None:
+        """|coro|
+
+        Shares one session between every client in the pool, then logs every account in concurrently.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar())
+
+        for client in (*self._clients.values(), self.public):
+            self._http(client)._session = self._session  # pyright: ignore[reportPrivateUsage] # noqa: SLF001 # the pool manages its clients' internals
+
+        await asyncio.gather(*(client.login() for client in self._clients.values()))
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the shared session, if the pool created it, and each client's image session, including :attr:`public`'s.
+        """
+        clients = (*self._clients.values(), self.public)
+        await asyncio.gather(*(self._http(client).close_image_session() for client in clients))
+
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def headroom(self, username: str, bucket: str | None = None, /) -> float:
+        """The fraction of an account's ratelimit left for a route path, as of its last response.
+
+        Parameters
+        ----------
+        username: :class:`str`
+            The account to check.
+        bucket: Optional[:class:`str`]
+            The route path, e.g. ``"/manga/{manga_id}/read"``.
+            If not given, the account's most used up route is used.
+
+        Returns
+        -------
+        :class:`float`
+            Between ``0.0`` and ``1.0``. Routes with no known ratelimit count as ``1.0``.
+        """
+        http = self._http(self._clients[username])
+        buckets = [bucket] if bucket is not None else list(http.ratelimits)
+        known = [value for value in map(http.ratelimit_headroom, buckets) if value is not None]
+        return min(known, default=1.0)
+
+    def least_limited(self, bucket: str | None = None, /) -> Client:
+        """Returns the client of the account with the most ratelimit left for a route path.
+
+        Accounts with the same headroom are picked in turn.
+
+        Parameters
+        ----------
+        bucket: Optional[:class:`str`]
+            The route path, e.g. ``"/manga/{manga_id}/read"``.
+            If not given, each account's most used up route is compared.
+
+        Returns
+        -------
+        :class:`~hondana.Client`
+        """
+        username = max(self._clients, key=lambda name: (self.headroom(name, bucket), -self._uses[name]))
+        self._uses[username] += 1
+        return self._clients[username]
+
+    async def run(
+        self,
+        func: Callable[[Client], Awaitable[T]],
+        /,
+        *,
+        username: str | None = None,
+        bucket: str | None = None,
+    ) -> T:
+        """|coro|
+
+        Runs an authenticated call on the pinned account, or on the account with the most ratelimit left.
+
+        .. code-block:: python3
+
+            markers = await pool.run(lambda client: client.manga_read_markers(manga_ids=ids), bucket="/manga/read")
+
+        Parameters
+        ----------
+        func: Callable[[:class:`~hondana.Client`], Awaitable[T]]
+            The call to run, given the chosen client.
+        username: Optional[:class:`str`]
+            The account to pin the call to, for operations scoped to that user.
+        bucket: Optional[:class:`str`]
+            The route path the call uses, to compare the accounts' ratelimits by.
+
+        Returns
+        -------
+        T
+            What ``func`` returns.
+        """
+        client = self._clients[username] if username is not None else self.least_limited(bucket)
+        return await func(client)
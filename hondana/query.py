@@ -24,6 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 from .enums import Order
@@ -53,6 +54,9 @@ __all__ = (
     "UserListOrderQuery",
 )
 
+# order fields are a small fixed set, so their camelCase names are only worked out once
+_camel_case = cache(to_camel_case)
+
 
 class _OrderQuery:
     __slots__: tuple[str, ...] = ()
@@ -85,7 +89,7 @@ class _OrderQuery:
         for item in self.__slots__:
             if val := getattr(self, item, None):  # pyright: ignore[reportAssignmentType] # only Order can be assigned here
                 val: str
-                fmt[to_camel_case(str(item))] = val
+                fmt[_camel_case(item)] = val
 
         return fmt
 
@@ -101,14 +105,7 @@ class _Includes:
         List[:class:`str`]
             The list of query parameters (pre-PHP formatting).
         """
-        fmt: list[str] = []
-        for item in dir(self):
-            if item.startswith("_"):
-                continue
-            if getattr(self, item) and item in self.__slots__:
-                fmt.append(item)
-
-        return fmt
+        return [item for item in sorted(self.__slots__) if getattr(self, item)]
 
     def __repr__(self) -> str:
         fmt = " ".join([f"{key}={getattr(self, key, False)}" for key in self.__slots__])
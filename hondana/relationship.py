@@ -30,6 +30,7 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from .types_.relationship import RelationshipResponse
+    from .utils import InternTable
 
 
 __all__ = ("Relationship",)
@@ -60,8 +61,10 @@ class Relationship:
         "type",
     )
 
-    def __init__(self, payload: RelationshipResponse) -> None:
+    def __init__(self, payload: RelationshipResponse, /, *, intern_table: InternTable | None = None) -> None:
         self._data: RelationshipResponse = payload
+        if intern_table is not None:
+            intern_table.relationships([payload])  # pyright: ignore[reportArgumentType] # TypedDicts are mutable mappings
         self.id: str = self._data["id"]
         self.type: str = self._data["type"]
         self.attributes: Mapping[str, Any] = self._data.pop("attributes", {})  # pyright: ignore[reportAttributeAccessIssue,reportCallIssue,reportArgumentType] # can't pop from a TypedDict
@@ -348,7 +348,7 @@ class ScanlatorGroup:
 
         ids = [r["id"] for r in self._member_relationships]
 
-        data = await self._http.user_list(limit=100, offset=0, ids=ids, username=None, order=None)
+        data = await self._http.fetch_by_ids(self._http.user_list, ids=ids, username=None, order=None)
 
         self.__members = [User(self._http, payload) for payload in data["data"]]
         return self.__members
@@ -510,13 +510,13 @@ class ScanlatorGroup:
     async def get_statistics(self) -> ScanlatorGroupStatistics | None:
         """|coro|
 
-        This method will fetch statistics on the current chapter, and cache them as the :attr:`stats`
+        This method will fetch statistics on the current scanlator group, and cache them as the :attr:`stats`
 
         Returns
         -------
-        :class:`~hondana.MangaStatistics`
+        :class:`~hondana.ScanlatorGroupStatistics`
         """
-        data = await self._http.get_chapter_statistics(self.id, None)
+        data = await self._http.get_scanlation_group_statistics(self.id, None)
 
         key = next(iter(data["statistics"]))
         stats = ScanlatorGroupStatistics(self._http, self.id, data["statistics"][key])
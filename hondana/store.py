@@ -0,0 +1,752 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import hashlib
+import mmap
+import pathlib
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .utils import MISSING, from_json, to_json
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from os import PathLike
+    from types import TracebackType
+    from typing import Self
+
+    T = TypeVar("T")
+
+__all__ = (
+    "EntityStore",
+    "FeedWatermark",
+    "JSONSyncStorage",
+    "PageStore",
+    "SQLiteSyncStorage",
+    "SyncStorage",
+)
+
+_ENTITY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    updated_at TEXT,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (type, id)
+)
+"""
+
+# an incoming payload only replaces the stored one if it is at least as new, so an older list response can't clobber it.
+_UPSERT = """
+INSERT INTO entities (type, id, version, updated_at, fetched_at, payload) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (type, id) DO UPDATE SET
+    version = excluded.version,
+    updated_at = excluded.updated_at,
+    fetched_at = excluded.fetched_at,
+    payload = excluded.payload
+WHERE excluded.version > entities.version
+    OR (excluded.version = entities.version AND COALESCE(excluded.updated_at, '') >= COALESCE(entities.updated_at, ''))
+"""
+
+_WATERMARK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+)
+"""
+
+# pages are keyed by "<chapter hash>/<file name>" and point at a blob named after the sha256 of its content.
+# a blob is deleted once no page references it.
+_PAGE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest);
+CREATE TABLE IF NOT EXISTS chapter_pages (
+    chapter_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (chapter_id, position)
+);
+CREATE INDEX IF NOT EXISTS chapter_pages_key ON chapter_pages (key);
+"""
+
+
+class _SQLiteDatabase:
+    __slots__ = (
+        "_connection",
+        "_executor",
+        "path",
+    )
+
+    _SCHEMA: str
+
+    def __init__(self, path: PathLike[str] | str, /) -> None:
+        self.path: str = str(path)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hondana-store")
+        self._connection: sqlite3.Connection | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path != ":memory:":
+                pathlib.Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            # only ever used from the single worker thread
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(self._SCHEMA)
+        return self._connection
+
+    async def _run(self, func: Callable[[sqlite3.Connection], T], /) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(self._connect()))
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the database connection and the worker thread.
+        """
+
+        def close(_: sqlite3.Connection) -> None:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+        if self._connection is not None:
+            await self._run(close)
+        self._executor.shutdown(wait=False)
+
+
+class EntityStore(_SQLiteDatabase):
+    """A persistent, SQLite backed store of raw API payloads.
+
+    When passed to :class:`~hondana.Client`, every entity returned by the API (from single and list responses alike)
+    is upserted into the store, and :meth:`Client.get_manga <hondana.Client.get_manga>`,
+    :meth:`Client.get_chapter <hondana.Client.get_chapter>` and :meth:`Client.get_author <hondana.Client.get_author>`
+    are served from it while the stored payload is fresh.
+
+    Payloads are keyed by their type and ID, and a stored payload is only replaced by one with an equal or greater
+    ``version`` (and ``updatedAt``), so a stale response can never overwrite newer data.
+
+    All database work is done on a dedicated worker thread, so the event loop is never blocked on disk I/O.
+
+    Parameters
+    ----------
+    path: Union[:class:`os.PathLike`, :class:`str`]
+        The path to the SQLite database. It is created if it does not exist.
+        ``":memory:"`` can be used for a non-persistent store.
+    max_age: Optional[:class:`float`]
+        How long, in seconds, a stored payload is considered fresh for.
+        ``None`` means stored payloads never go stale, and are only refreshed when a newer version passes through the client.
+        Defaults to one hour.
+
+
+    .. note::
+        Served payloads contain whichever relationship expansions they were last fetched with.
+        Client methods bypass the store when they are given explicit ``includes``.
+    """
+
+    __slots__ = ("max_age",)
+
+    _SCHEMA = _ENTITY_SCHEMA
+
+    def __init__(self, path: PathLike[str] | str, /, *, max_age: float | None = 3600.0) -> None:
+        super().__init__(path)
+        self.max_age: float | None = max_age
+
+    def __repr__(self) -> str:
+        return f"<EntityStore path={self.path!r} max_age={self.max_age!r}>"
+
+    async def get(self, type_: str, id_: str, /, *, max_age: float | None = MISSING) -> Any | None:
+        """|coro|
+
+        Returns the stored payload for an entity, if there is a fresh one.
+
+        Parameters
+        ----------
+        type_: :class:`str`
+            The entity type, e.g. ``"manga"``.
+        id_: :class:`str`
+            The entity ID.
+        max_age: Optional[:class:`float`]
+            Overrides the store's ``max_age`` for this lookup.
+
+        Returns
+        -------
+        Optional[Dict[:class:`str`, Any]]
+            The raw payload, or ``None`` if it was not stored or is stale.
+        """
+        max_age = self.max_age if max_age is MISSING else max_age
+        oldest = 0.0 if max_age is None else time.time() - max_age
+
+        def select(connection: sqlite3.Connection) -> Any | None:
+            row = connection.execute(
+                "SELECT payload FROM entities WHERE type = ? AND id = ? AND fetched_at >= ?",
+                (type_, id_, oldest),
+            ).fetchone()
+            return from_json(row[0]) if row else None
+
+        return await self._run(select)
+
+    async def upsert(self, payloads: Iterable[dict[str, Any]], /) -> int:
+        """|coro|
+
+        Stores entity payloads, keeping whichever of the stored and given payloads is newer.
+
+        Parameters
+        ----------
+        payloads: Iterable[Dict[:class:`str`, Any]]
+            The raw entity payloads. Anything without an ``id``, ``type`` and ``attributes`` is skipped.
+
+        Returns
+        -------
+        :class:`int`
+            The number of payloads written.
+        """
+        now = time.time()
+        rows: list[tuple[str, str, int, str | None, float, str]] = []
+        for payload in payloads:
+            if "id" not in payload or "type" not in payload:
+                continue
+            attributes: dict[str, Any] | None = payload.get("attributes")
+            if not isinstance(attributes, dict):
+                continue
+            rows.append(
+                (
+                    payload["type"],
+                    payload["id"],
+                    attributes.get("version", 0),
+                    attributes.get("updatedAt"),
+                    now,
+                    to_json(payload),
+                ),
+            )
+        if not rows:
+            return 0
+
+        def write(connection: sqlite3.Connection) -> int:
+            with connection:
+                return connection.executemany(_UPSERT, rows).rowcount
+
+        return await self._run(write)
+
+    async def upsert_response(self, response: dict[str, Any], /) -> int:
+        """|coro|
+
+        Stores the entities from an API response body, whether it is a single entity or a collection.
+
+        Returns
+        -------
+        :class:`int`
+            The number of payloads written.
+        """
+        data: Any = response.get("data")
+        if isinstance(data, list):
+            return await self.upsert(data)  # pyright: ignore[reportUnknownArgumentType] # this is a raw payload
+        if isinstance(data, dict):
+            return await self.upsert([data])  # pyright: ignore[reportUnknownArgumentType] # this is a raw payload
+        return 0
+
+    async def delete(self, type_: str, id_: str, /) -> None:
+        """|coro|
+
+        Removes an entity from the store.
+        """
+
+        def delete(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.execute("DELETE FROM entities WHERE type = ? AND id = ?", (type_, id_))
+
+        await self._run(delete)
+
+
+class PageStore(_SQLiteDatabase):
+    """A content-addressed, deduplicating store of chapter pages.
+
+    Pages are downloaded into it with :meth:`Chapter.download_to_store <hondana.Chapter.download_to_store>`,
+    and keyed by their chapter's :attr:`ChapterAtHome.hash <hondana.ChapterAtHome.hash>` and their file name,
+    while the bytes are stored once per distinct content and reference counted. Re-uploaded pages, and the same image
+    across chapters, take up disk space once. An index maps chapter IDs to their ordered page keys.
+
+    All database and file work is done on a dedicated worker thread, so the event loop is never blocked on disk I/O.
+
+    Parameters
+    ----------
+    path: Union[:class:`os.PathLike`, :class:`str`]
+        The directory to store the pages and their index in. It is created if it does not exist.
+    """
+
+    __slots__ = ("root",)
+
+    _SCHEMA = _PAGE_SCHEMA
+
+    def __init__(self, path: PathLike[str] | str, /) -> None:
+        self.root: pathlib.Path = pathlib.Path(path)
+        super().__init__(self.root / "pages.sqlite3")
+
+    def __repr__(self) -> str:
+        return f"<PageStore root={str(self.root)!r}>"
+
+    @staticmethod
+    def key(chapter_hash: str, file_name: str, /) -> str:
+        """The key of a page.
+
+        Parameters
+        ----------
+        chapter_hash: :class:`str`
+            The :attr:`ChapterAtHome.hash <hondana.ChapterAtHome.hash>` of the page's chapter.
+        file_name: :class:`str`
+            The MD@H file name of the page.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        return f"{chapter_hash}/{file_name}"
+
+    def _blob_path(self, digest: str, /) -> pathlib.Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def _release(self, connection: sqlite3.Connection, digest: str, /) -> None:
+        # deletes the blob once nothing references it
+        if connection.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone() is None:
+            self._blob_path(digest).unlink(missing_ok=True)
+
+    def _drop_unused(self, connection: sqlite3.Connection, keys: Iterable[str], /) -> tuple[int, set[str]]:
+        # deletes the page rows of the keys no indexed chapter uses, returning how many went and their digests
+        removed = 0
+        digests: set[str] = set()
+        for key in keys:
+            if connection.execute("SELECT 1 FROM chapter_pages WHERE key = ? LIMIT 1", (key,)).fetchone():
+                continue
+            row = connection.execute("DELETE FROM pages WHERE key = ? RETURNING digest", (key,)).fetchone()
+            if row is not None:
+                removed += 1
+                digests.add(row[0])
+        return removed, digests
+
+    async def put(self, chapter_hash: str, file_name: str, data: bytes, /) -> str:
+        """|coro|
+
+        Stores a page, reusing the stored bytes if the same content is already stored.
+
+        Parameters
+        ----------
+        chapter_hash: :class:`str`
+            The :attr:`ChapterAtHome.hash <hondana.ChapterAtHome.hash>` of the page's chapter.
+        file_name: :class:`str`
+            The MD@H file name of the page.
+        data: :class:`bytes`
+            The page.
+
+        Returns
+        -------
+        :class:`str`
+            The key of the page.
+        """
+        key = self.key(chapter_hash, file_name)
+
+        def write(connection: sqlite3.Connection) -> None:
+            digest = hashlib.sha256(data).hexdigest()
+            blob = self._blob_path(digest)
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                partial = blob.with_name(f"{digest}.part")
+                partial.write_bytes(data)
+                partial.replace(blob)
+
+            with connection:
+                row = connection.execute("SELECT digest FROM pages WHERE key = ?", (key,)).fetchone()
+                connection.execute(
+                    "INSERT INTO pages (key, digest, size) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET digest = excluded.digest, size = excluded.size",
+                    (key, digest, len(data)),
+                )
+            if row is not None and row[0] != digest:
+                self._release(connection, row[0])
+
+        await self._run(write)
+        return key
+
+    async def contains(self, keys: Iterable[str], /) -> set[str]:
+        """|coro|
+
+        Returns which of the given page keys are stored.
+
+        Parameters
+        ----------
+        keys: Iterable[:class:`str`]
+            The page keys to look up.
+
+        Returns
+        -------
+        Set[:class:`str`]
+        """
+        keys = list(keys)
+
+        def select(connection: sqlite3.Connection) -> set[str]:
+            found: set[str] = set()
+            # stay below SQLite's bound parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = connection.execute(f"SELECT key FROM pages WHERE key IN ({placeholders})", chunk)  # noqa: S608 # only placeholders are interpolated
+                found.update(row[0] for row in rows)
+            return found
+
+        return await self._run(select)
+
+    async def set_chapter(self, chapter_id: str, keys: Iterable[str], /) -> None:
+        """|coro|
+
+        Sets the ordered page keys of a chapter in the index.
+
+        Pages the chapter no longer uses are removed, unless another indexed chapter uses them,
+        e.g. the pages of an older :attr:`ChapterAtHome.hash <hondana.ChapterAtHome.hash>` of the chapter.
+
+        Parameters
+        ----------
+        chapter_id: :class:`str`
+            The chapter ID.
+        keys: Iterable[:class:`str`]
+            The keys of the chapter's pages, in page order.
+        """
+        rows = [(chapter_id, position, key) for position, key in enumerate(keys)]
+
+        def write(connection: sqlite3.Connection) -> None:
+            with connection:
+                previous = {
+                    row[0] for row in connection.execute("SELECT key FROM chapter_pages WHERE chapter_id = ?", (chapter_id,))
+                }
+                connection.execute("DELETE FROM chapter_pages WHERE chapter_id = ?", (chapter_id,))
+                connection.executemany("INSERT INTO chapter_pages (chapter_id, position, key) VALUES (?, ?, ?)", rows)
+                _, digests = self._drop_unused(connection, previous.difference(row[2] for row in rows))
+
+            for digest in digests:
+                self._release(connection, digest)
+
+        await self._run(write)
+
+    async def chapter_pages(self, chapter_id: str, /) -> list[str]:
+        """|coro|
+
+        Returns the ordered page keys of a chapter from the index.
+
+        Parameters
+        ----------
+        chapter_id: :class:`str`
+            The chapter ID.
+
+        Returns
+        -------
+        List[:class:`str`]
+            The page keys, empty if the chapter is not indexed.
+        """
+
+        def select(connection: sqlite3.Connection) -> list[str]:
+            rows = connection.execute(
+                "SELECT key FROM chapter_pages WHERE chapter_id = ? ORDER BY position",
+                (chapter_id,),
+            )
+            return [row[0] for row in rows]
+
+        return await self._run(select)
+
+    async def open(self, key: str, /) -> mmap.mmap:
+        """|coro|
+
+        Opens a stored page for reading, memory-mapped so it can be served without copying it into memory.
+
+        The returned object supports the buffer protocol and should be closed once done with,
+        e.g. by using it as a context manager.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The page key.
+
+        Raises
+        ------
+        KeyError
+            The page is not stored.
+
+        Returns
+        -------
+        :class:`mmap.mmap`
+        """
+
+        def open_(connection: sqlite3.Connection) -> mmap.mmap:
+            row = connection.execute("SELECT digest FROM pages WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                raise KeyError(key)
+            with self._blob_path(row[0]).open("rb") as fp:
+                return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return await self._run(open_)
+
+    async def remove_chapter(self, chapter_id: str, /) -> int:
+        """|coro|
+
+        Removes a chapter from the index, along with the pages no other indexed chapter uses.
+
+        Parameters
+        ----------
+        chapter_id: :class:`str`
+            The chapter ID.
+
+        Returns
+        -------
+        :class:`int`
+            The number of pages removed.
+        """
+
+        def delete(connection: sqlite3.Connection) -> int:
+            with connection:
+                keys = [
+                    row[0] for row in connection.execute("SELECT key FROM chapter_pages WHERE chapter_id = ?", (chapter_id,))
+                ]
+                connection.execute("DELETE FROM chapter_pages WHERE chapter_id = ?", (chapter_id,))
+                removed, digests = self._drop_unused(connection, keys)
+
+            for digest in digests:
+                self._release(connection, digest)
+            return removed
+
+        return await self._run(delete)
+
+
+class FeedWatermark:
+    """The high-water mark of a synced feed, see :meth:`Client.sync_feed <hondana.Client.sync_feed>`.
+
+    Attributes
+    ----------
+    updated_at: Optional[:class:`datetime.datetime`]
+        The latest ``updatedAt`` seen in the feed, or ``None`` if it has never been synced.
+    boundary_ids: Set[:class:`str`]
+        The IDs of the chapters last updated at exactly ``updated_at``.
+        These are skipped when the next sync re-requests that instant.
+    """
+
+    __slots__ = (
+        "boundary_ids",
+        "updated_at",
+    )
+
+    def __init__(self, updated_at: datetime.datetime | None = None, boundary_ids: Iterable[str] = ()) -> None:
+        self.updated_at: datetime.datetime | None = updated_at
+        self.boundary_ids: set[str] = set(boundary_ids)
+
+    def __repr__(self) -> str:
+        return f"<FeedWatermark updated_at={self.updated_at!r} boundary_ids={len(self.boundary_ids)}>"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, FeedWatermark)
+            and self.updated_at == other.updated_at
+            and self.boundary_ids == other.boundary_ids
+        )
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType] # this is mutable
+
+    def is_new(self, id_: str, updated_at: datetime.datetime, /) -> bool:
+        """Whether an item with this ID and ``updatedAt`` is past this watermark.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        if self.updated_at is None or updated_at > self.updated_at:
+            return True
+        return updated_at == self.updated_at and id_ not in self.boundary_ids
+
+    def advance(self, id_: str, updated_at: datetime.datetime, /) -> None:
+        """Moves this watermark forward to include an item, if it is newer."""
+        if self.updated_at is None or updated_at > self.updated_at:
+            self.updated_at = updated_at
+            self.boundary_ids = {id_}
+        elif updated_at == self.updated_at:
+            self.boundary_ids.add(id_)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialises this watermark for storage.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+        """
+        return {
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "boundary_ids": sorted(self.boundary_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any], /) -> Self:
+        """Loads a watermark serialised with :meth:`to_dict`.
+
+        Returns
+        -------
+        :class:`FeedWatermark`
+        """
+        updated_at = payload.get("updated_at")
+        return cls(
+            datetime.datetime.fromisoformat(updated_at) if updated_at else None,
+            payload.get("boundary_ids", ()),
+        )
+
+
+class SyncStorage(ABC):
+    """The base class for storing feed watermarks between :meth:`Client.sync_feed <hondana.Client.sync_feed>` calls.
+
+    Subclass this to persist watermarks somewhere other than :class:`JSONSyncStorage` or :class:`SQLiteSyncStorage`.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def load(self, key: str, /) -> FeedWatermark | None:
+        """|coro|
+
+        Loads the watermark stored for a feed key.
+
+        Returns
+        -------
+        Optional[:class:`FeedWatermark`]
+            The stored watermark, or ``None`` if the feed has never been synced.
+        """
+
+    @abstractmethod
+    async def save(self, key: str, watermark: FeedWatermark, /) -> None:
+        """|coro|
+
+        Stores the watermark for a feed key, replacing any previous one.
+        """
+
+
+class JSONSyncStorage(SyncStorage):
+    """Stores feed watermarks in a JSON file, keyed by feed key.
+
+    Parameters
+    ----------
+    path: Union[:class:`os.PathLike`, :class:`str`]
+        The path to the JSON file. It is created on first save.
+    """
+
+    __slots__ = (
+        "_lock",
+        "path",
+    )
+
+    def __init__(self, path: PathLike[str] | str, /) -> None:
+        self.path: pathlib.Path = pathlib.Path(path)
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"<JSONSyncStorage path={self.path!r}>"
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            return from_json(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: dict[str, Any], /) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(self.path.name + ".part")
+        partial.write_text(to_json(data), encoding="utf-8")
+        partial.replace(self.path)
+
+    async def load(self, key: str, /) -> FeedWatermark | None:  # noqa: D102 # inherited
+        data = await asyncio.to_thread(self._read)
+        payload = data.get(key)
+        return FeedWatermark.from_dict(payload) if payload else None
+
+    async def save(self, key: str, watermark: FeedWatermark, /) -> None:  # noqa: D102 # inherited
+        async with self._lock:
+
+            def update() -> None:
+                data = self._read()
+                data[key] = watermark.to_dict()
+                self._write(data)
+
+            await asyncio.to_thread(update)
+
+
+class SQLiteSyncStorage(_SQLiteDatabase, SyncStorage):
+    """Stores feed watermarks in an SQLite database, keyed by feed key.
+
+    The database can be shared with an :class:`EntityStore`.
+
+    Parameters
+    ----------
+    path: Union[:class:`os.PathLike`, :class:`str`]
+        The path to the SQLite database. It is created if it does not exist.
+    """
+
+    __slots__ = ()
+
+    _SCHEMA = _WATERMARK_SCHEMA
+
+    def __repr__(self) -> str:
+        return f"<SQLiteSyncStorage path={self.path!r}>"
+
+    async def load(self, key: str, /) -> FeedWatermark | None:  # noqa: D102 # inherited
+        def select(connection: sqlite3.Connection) -> FeedWatermark | None:
+            row = connection.execute("SELECT payload FROM watermarks WHERE key = ?", (key,)).fetchone()
+            return FeedWatermark.from_dict(from_json(row[0])) if row else None
+
+        return await self._run(select)
+
+    async def save(self, key: str, watermark: FeedWatermark, /) -> None:  # noqa: D102 # inherited
+        payload = to_json(watermark.to_dict())
+
+        def upsert(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.execute(
+                    "INSERT INTO watermarks (key, payload) VALUES (?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET payload = excluded.payload",
+                    (key, payload),
+                )
+
+        await self._run(upsert)
@@ -25,24 +25,33 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Literal
+import unicodedata
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 from .relationship import Relationship
-from .utils import MANGA_TAGS, cached_slot_property
+from .utils import cached_slot_property
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from typing import Self
+
     from .types_.common import LocalizedString
     from .types_.relationship import RelationshipResponse
     from .types_.tags import TagResponse
+    from .utils import InternTable
 
 
 __all__ = (
     "QueryTags",
     "Tag",
+    "TagRegistry",
 )
 
 logger: logging.Logger = logging.getLogger("hondana")
 
+# unicode categories dropped from names when normalising them: control, punctuation, symbols and separators
+_NORMALISE_IGNORED: str = "CPSZ"
+
 
 class Tag:
     """A class representing a single Tag from MangaDex.
@@ -71,6 +80,7 @@ class Tag:
         "_cs_relationships",
         "_data",
         "_description",
+        "_intern_table",
         "_name",
         "_relationships",
         "group",
@@ -78,15 +88,20 @@ class Tag:
         "version",
     )
 
-    def __init__(self, payload: TagResponse) -> None:
+    def __init__(self, payload: TagResponse, /, *, intern_table: InternTable | None = None) -> None:
         self._data = payload
         self._attributes = payload["attributes"]
+        if intern_table is not None:
+            intern_table.update(payload, "id", "type")  # pyright: ignore[reportArgumentType] # TypedDicts are mutable mappings
+            intern_table.update(self._attributes, "group")  # pyright: ignore[reportArgumentType] # TypedDicts are mutable mappings
+            intern_table.update(self._attributes["name"], *self._attributes["name"])  # pyright: ignore[reportArgumentType] # TypedDicts are mutable mappings
         self._relationships: list[RelationshipResponse] = self._data.pop("relationships", [])  # pyright: ignore[reportUnknownArgumentType,reportAttributeAccessIssue,reportArgumentType] # can't pop from a typed dict
         self._name = self._attributes["name"]
         self.id: str = payload["id"]
         self._description: LocalizedString = self._attributes["description"]
         self.group: str = self._attributes["group"]
         self.version: int = self._attributes["version"]
+        self._intern_table: InternTable | None = intern_table
 
     def __repr__(self) -> str:
         return f"<Tag id={self.id!r} name={self.name!r}>"
@@ -147,6 +162,16 @@ class Tag:
         """
         return f"https://mangadex.org/tag/{self.id}"
 
+    def to_payload(self) -> TagResponse:
+        """
+        Rebuilds the API payload of this tag.
+
+        Returns
+        -------
+        :class:`~hondana.types_.tags.TagResponse`
+        """
+        return {"id": self.id, "type": "tag", "attributes": self._attributes, "relationships": self._relationships}
+
     @cached_slot_property("_cs_relationships")
     def relationships(self) -> list[Relationship]:
         """The relationships of this Tag.
@@ -156,7 +181,230 @@ class Tag:
         List[:class:`~hondana.Relationship`]
             The list of relationships this tag has.
         """
-        return [Relationship(item) for item in self._relationships]
+        return [Relationship(item, intern_table=self._intern_table) for item in self._relationships]
+
+
+class TagRegistry:
+    """An indexed registry of MangaDex tags.
+
+    The registry resolves tag names case-insensitively and ignoring punctuation and spacing (so ``"sci fi"`` and
+    ``"SCI-FI"`` both resolve to ``"Sci-Fi"``), as well as through aliases and tag IDs. It also holds one shared
+    :class:`Tag` instance per tag, which :attr:`Manga.tags <hondana.Manga.tags>` hands out instead of building a
+    new object per manga.
+
+    The default registry is built once from the local tag cache on first use, and is extended with full tag data
+    whenever :meth:`Client.get_tags <hondana.Client.get_tags>` is called.
+
+    Parameters
+    ----------
+    names: Optional[Mapping[:class:`str`, :class:`str`]]
+        A mapping of tag name to tag ID to seed the registry with.
+    tags: Optional[Iterable[:class:`Tag`]]
+        Tags to seed the registry with.
+    """
+
+    DEFAULT_ALIASES: ClassVar[dict[str, str]] = {
+        "bl": "Boys' Love",
+        "gl": "Girls' Love",
+        "yaoi": "Boys' Love",
+        "yuri": "Girls' Love",
+        "genderbender": "Genderswap",
+        "shounen ai": "Boys' Love",
+        "shoujo ai": "Girls' Love",
+    }
+
+    __default: ClassVar[TagRegistry | None] = None
+
+    __slots__ = (
+        "_groups",
+        "_ids",
+        "_names",
+        "_tags",
+    )
+
+    def __init__(self, *, names: Mapping[str, str] | None = None, tags: Iterable[Tag] | None = None) -> None:
+        self._names: dict[str, str] = {}
+        self._ids: dict[str, str] = {}
+        self._tags: dict[str, Tag] = {}
+        self._groups: dict[str, dict[str, Tag]] = {}
+
+        for name, tag_id in (names or {}).items():
+            self.add_name(name, tag_id)
+
+        for tag in tags or ():
+            self.add(tag)
+
+        for alias, name in self.DEFAULT_ALIASES.items():
+            if (tag_id := self.resolve(name)) is not None:
+                self._register(alias, tag_id, replace=False)
+
+    def __repr__(self) -> str:
+        return f"<TagRegistry names={len(self._names)} tags={len(self._tags)}>"
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, name_or_id: object) -> bool:
+        return isinstance(name_or_id, str) and self.resolve(name_or_id) is not None
+
+    @classmethod
+    def default(cls) -> TagRegistry:
+        """Returns the library-wide registry, building it from the local tag cache on first use.
+
+        Returns
+        -------
+        :class:`TagRegistry`
+        """
+        if cls.__default is None:
+            from .utils import MANGA_TAGS  # noqa: PLC0415 # the local tag cache is loaded on first access
+
+            cls.__default = cls(names=MANGA_TAGS)
+        return cls.__default
+
+    @classmethod
+    def from_tags(cls, tags: Iterable[Tag], /) -> Self:
+        """Builds a registry from a list of tags, such as the return of :meth:`Client.get_tags <hondana.Client.get_tags>`.
+
+        Returns
+        -------
+        :class:`TagRegistry`
+        """
+        return cls(tags=tags)
+
+    @staticmethod
+    def normalise(name: str, /) -> str:
+        """Normalises a tag name for lookup, casefolding it and removing whitespace, punctuation and symbols.
+
+        Letters and digits of any script are kept, so non-Latin names stay distinct.
+
+        Returns
+        -------
+        :class:`str`
+            The normalised name, which is empty if the name had no letters or digits.
+        """
+        folded = unicodedata.normalize("NFKC", name).casefold()
+        return "".join(char for char in folded if unicodedata.category(char)[0] not in _NORMALISE_IGNORED)
+
+    def _register(self, name: str, tag_id: str, /, *, replace: bool = True) -> None:
+        key = self.normalise(name)
+        # a name with nothing left to match on would otherwise resolve every such input to one tag
+        if not key:
+            return
+
+        if replace:
+            self._names[key] = tag_id
+        else:
+            self._names.setdefault(key, tag_id)
+
+    def add_name(self, name: str, tag_id: str, /) -> None:
+        """Registers a name for a tag ID. The first name registered for an ID is used as its display name."""
+        self._register(name, tag_id)
+        self._ids.setdefault(tag_id, name)
+
+    def add_alias(self, alias: str, name_or_id: str, /) -> None:
+        """Registers an alias for an existing tag.
+
+        Raises
+        ------
+        KeyError
+            The tag to alias could not be found in the registry.
+        """
+        tag_id = self.resolve(name_or_id)
+        if tag_id is None:
+            msg = f"Tag {name_or_id!r} is not in the registry."
+            raise KeyError(msg)
+
+        self._register(alias, tag_id)
+
+    def add(self, tag: Tag, /) -> Tag:
+        """Adds (or replaces with a newer version of) a tag in the registry.
+
+        Returns
+        -------
+        :class:`Tag`
+            The shared instance of this tag.
+        """
+        existing = self._tags.get(tag.id)
+        if existing is not None:
+            if existing.version >= tag.version:
+                return existing
+
+            # the names and group of the older version no longer apply, aliases registered for the tag are kept
+            old_names: list[str] = list(existing._name.values())  # noqa: SLF001 # pyright: ignore[reportPrivateUsage,reportAssignmentType] # every localised name was registered
+            for name in old_names:
+                key = self.normalise(name)
+                if self._names.get(key) == tag.id:
+                    del self._names[key]
+            self._groups.get(existing.group, {}).pop(tag.id, None)
+
+        self._tags[tag.id] = tag
+        self._ids[tag.id] = tag.name
+        self._groups.setdefault(tag.group, {})[tag.id] = tag
+        names: list[str] = list(tag._name.values())  # noqa: SLF001 # pyright: ignore[reportPrivateUsage,reportAssignmentType] # every localised name should resolve
+        for name in names:
+            self._register(name, tag.id)
+
+        return tag
+
+    def shared(self, payload: TagResponse, /, *, intern_table: InternTable | None = None) -> Tag:
+        """Returns the shared :class:`Tag` for a tag payload, creating and registering it if needed.
+
+        Returns
+        -------
+        :class:`Tag`
+        """
+        existing = self._tags.get(payload["id"])
+        if existing is not None and existing.version >= payload["attributes"]["version"]:
+            return existing
+
+        return self.add(Tag(payload, intern_table=intern_table))
+
+    def resolve(self, name_or_id: str, /) -> str | None:
+        """Resolves a tag name, alias or ID to the tag ID, if it is known.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+        """
+        if name_or_id in self._ids:
+            return name_or_id
+
+        key = self.normalise(name_or_id)
+        if not key:
+            return None
+
+        return self._names.get(key)
+
+    def get(self, name_or_id: str, /) -> Tag | None:
+        """Returns the shared :class:`Tag` for a name, alias or ID.
+
+        This will only return a tag if full tag data has been added,
+        e.g. via :meth:`Client.get_tags <hondana.Client.get_tags>` or from a manga payload.
+
+        Returns
+        -------
+        Optional[:class:`Tag`]
+        """
+        tag_id = self.resolve(name_or_id)
+        return self._tags.get(tag_id) if tag_id else None
+
+    def name_of(self, tag_id: str, /) -> str | None:
+        """Returns the name of a tag from its ID, if it is known.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+        """
+        return self._ids.get(tag_id)
+
+    def group(self, group: str, /) -> list[Tag]:
+        """Returns all known tags within a group, such as ``"genre"`` or ``"theme"``.
+
+        Returns
+        -------
+        List[:class:`Tag`]
+        """
+        return list(self._groups.get(group, {}).values())
 
 
 class QueryTags:
@@ -178,7 +426,8 @@ class QueryTags:
 
 
     .. note::
-        The tags passed need to match the *local* cache of the tags.
+        The tags passed need to match the *local* cache of the tags, via the default :class:`~hondana.TagRegistry`.
+        Names are matched case-insensitively, and aliases and tag IDs are also accepted.
         If you feel this is out of date, you can try the helper method :meth:`~hondana.Client.update_tags`
     """
 
@@ -199,9 +448,10 @@ class QueryTags:
         return f"<Tags mode={self.mode} number_of_tags={len(self.tags)}>"
 
     def _set_tags(self, tags: tuple[str, ...]) -> list[str]:
+        registry = TagRegistry.default()
         resolved_tags: list[str] = []
         for tag in tags:
-            if tag_ := MANGA_TAGS.get(tag.title()):
+            if tag_ := registry.resolve(tag):
                 resolved_tags.append(tag_)
             else:
                 logger.warning("Tag '%s' cannot be found in the local tag cache, skipping.", tag)
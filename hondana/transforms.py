@@ -0,0 +1,238 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import io
+import logging
+import pathlib
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Literal
+
+from .utils import default_transform_executor
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from concurrent.futures import Executor
+
+__all__ = (
+    "ImageTransform",
+    "PillowTransform",
+    "transform_images",
+)
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class ImageTransform(ABC):
+    """The base class for transforming chapter images before they are uploaded, e.g. to re-encode them smaller.
+
+    Transforms are run in a process pool, so subclasses must be picklable and defined at module level.
+
+    .. code-block:: python3
+
+        class Grayscale(ImageTransform):
+            def __call__(self, name: str, data: bytes, /) -> tuple[str, bytes]:
+                ...
+                return name, converted
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __call__(self, name: str, data: bytes, /) -> tuple[str, bytes]:
+        """Transforms one image.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The image's file name, e.g. ``1.png``.
+        data: :class:`bytes`
+            The image's contents.
+
+        Returns
+        -------
+        Tuple[:class:`str`, :class:`bytes`]
+            The file name and contents to upload.
+            Only the extension of the file name should change, so the images still sort in the same order.
+        """
+
+
+def _load_pillow() -> Any:
+    try:
+        return importlib.import_module("PIL.Image")
+    except ModuleNotFoundError:
+        msg = "PillowTransform requires Pillow, which can be installed with `pip install hondana[images]`."
+        raise ImportError(msg) from None
+
+
+class PillowTransform(ImageTransform):
+    """Re-encodes images with `Pillow <https://python-pillow.org>`_, which is installed with the ``images`` extra.
+
+    Animated images are left as they are.
+
+    Parameters
+    ----------
+    format: Literal[``"png"``, ``"webp"``, ``"jpeg"``]
+        The format to encode images to. ``"png"`` is lossless, recompressing the image as small as Pillow can.
+        Defaults to ``"png"``.
+    quality: :class:`int`
+        The quality to encode lossy WebP and JPEG images at, from 1 to 100. Defaults to ``90``.
+    lossless: :class:`bool`
+        Whether to encode WebP images losslessly. Defaults to ``False``.
+    keep_smaller: :class:`bool`
+        Whether to keep the original image when re-encoding it does not make it smaller. Defaults to ``True``.
+
+    Raises
+    ------
+    ImportError
+        Pillow is not installed.
+    """
+
+    __slots__ = (
+        "format",
+        "keep_smaller",
+        "lossless",
+        "quality",
+    )
+
+    def __init__(
+        self,
+        format: Literal["png", "webp", "jpeg"] = "png",  # noqa: A002 # matches Pillow's naming
+        *,
+        quality: int = 90,
+        lossless: bool = False,
+        keep_smaller: bool = True,
+    ) -> None:
+        _load_pillow()
+        self.format: Literal["png", "webp", "jpeg"] = format
+        self.quality: int = quality
+        self.lossless: bool = lossless
+        self.keep_smaller: bool = keep_smaller
+
+    def __repr__(self) -> str:
+        return f"<PillowTransform format={self.format!r} quality={self.quality} lossless={self.lossless}>"
+
+    def __call__(self, name: str, data: bytes, /) -> tuple[str, bytes]:
+        """Re-encodes one image, see :meth:`ImageTransform.__call__`."""
+        image_module = _load_pillow()
+        output = io.BytesIO()
+        with image_module.open(io.BytesIO(data)) as image:
+            if getattr(image, "is_animated", False):
+                return name, data
+
+            if self.format == "png":
+                image.save(output, "PNG", optimize=True)
+            elif self.format == "webp":
+                image.save(output, "WEBP", quality=self.quality, lossless=self.lossless, method=6)
+            else:
+                if image.mode not in {"RGB", "L"}:
+                    image = image.convert("RGB")  # noqa: PLW2901 # JPEG has no alpha channel or palette
+                image.save(output, "JPEG", quality=self.quality, optimize=True, progressive=True)
+
+        result = output.getvalue()
+        if self.keep_smaller and len(result) >= len(data):
+            return name, data
+
+        return str(pathlib.PurePath(name).with_suffix(f".{self.format}")), result
+
+
+def _run_transform(
+    transform: ImageTransform,
+    path: pathlib.Path,
+    data: bytes | None,
+    /,
+) -> tuple[str, bytes]:
+    # runs in the executor, reading the file there so it is not sent to the worker and back
+    if data is None:
+        data = path.read_bytes()
+    return transform(path.name, data)
+
+
+async def transform_images(
+    images: list[pathlib.Path],
+    transform: ImageTransform,
+    /,
+    *,
+    contents: Mapping[pathlib.Path, bytes] | None = None,
+    executor: Executor | None = None,
+) -> tuple[list[pathlib.Path], dict[pathlib.Path, bytes]]:
+    """|coro|
+
+    Runs a transform over chapter images concurrently, ready to pass to
+    :meth:`ChapterUpload.upload_images <hondana.ChapterUpload.upload_images>`.
+
+    The transformed images are kept in memory, under paths beside the original files.
+
+    Parameters
+    ----------
+    images: List[:class:`pathlib.Path`]
+        The images to transform.
+    transform: :class:`ImageTransform`
+        The transform to run.
+    contents: Optional[Mapping[:class:`pathlib.Path`, :class:`bytes`]]
+        The contents of some or all of the images, if they were already read.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        The executor to run the transform in.
+        If ``None``, one from :func:`~hondana.utils.default_transform_executor` is used for this call.
+
+    Raises
+    ------
+    ValueError
+        Two images were given the same file name by the transform.
+
+    Returns
+    -------
+    Tuple[List[:class:`pathlib.Path`], Dict[:class:`pathlib.Path`, :class:`bytes`]]
+        The transformed image paths, in the order of ``images``, and their contents.
+    """
+    contents = contents or {}
+    owned = executor is None
+    executor = executor or default_transform_executor()
+    loop = asyncio.get_running_loop()
+    try:
+        results = await asyncio.gather(
+            *(loop.run_in_executor(executor, _run_transform, transform, item, contents.get(item)) for item in images),
+        )
+    finally:
+        if owned:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    paths: list[pathlib.Path] = []
+    transformed: dict[pathlib.Path, bytes] = {}
+    names: set[str] = set()
+    for item, (name, data) in zip(images, results, strict=True):
+        if name in names:
+            msg = f"The transform gave more than one image the file name {name!r}."
+            raise ValueError(msg)
+        names.add(name)
+
+        path = item.with_name(name)
+        paths.append(path)
+        transformed[path] = data
+
+    LOGGER.debug("Transformed %d images to %d bytes.", len(images), sum(map(len, transformed.values())))
+    return paths, transformed
@@ -0,0 +1,328 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from .chapter import _prepare_images  # pyright: ignore[reportPrivateUsage] # shared with `ChapterUpload.upload_images`
+from .errors import UploadIncomplete
+from .utils import default_transform_executor
+
+if TYPE_CHECKING:
+    import datetime
+    import pathlib
+    from collections.abc import AsyncGenerator, Callable, Iterable
+    from concurrent.futures import Executor
+    from os import PathLike
+
+    from .chapter import Chapter
+    from .client import Client
+    from .manga import Manga
+    from .transforms import ImageTransform
+    from .types_.common import LanguageCode
+
+__all__ = (
+    "ChapterUploadSpec",
+    "UploadQueue",
+)
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class ChapterUploadSpec:
+    """A chapter to upload through an :class:`UploadQueue`.
+
+    The parameters match those of :meth:`Client.upload_chapter <hondana.Client.upload_chapter>`.
+
+    Parameters
+    ----------
+    manga: Union[:class:`~hondana.Manga`, :class:`str`]
+        The manga to upload the chapter for.
+    chapter: :class:`str`
+        The chapter number.
+    images: List[:class:`pathlib.Path`]
+        The page images.
+    translated_language: :class:`~hondana.types_.common.LanguageCode`
+        The language the chapter is translated in.
+    scanlator_groups: List[:class:`str`]
+        The scanlator group IDs to attribute the chapter to.
+    accept_tos: :class:`bool`
+        Whether you accept the `MangaDex Terms of Service <https://mangadex.org/compliance>`_ by uploading this chapter.
+    volume: Optional[:class:`str`]
+        The volume of the chapter.
+    title: Optional[:class:`str`]
+        The chapter's title.
+    chapter_to_edit: Optional[Union[:class:`~hondana.Chapter`, :class:`str`]]
+        The chapter to edit, if editing one.
+    version: Optional[:class:`int`]
+        The version of the chapter being edited.
+    external_url: Optional[:class:`str`]
+        The external URL of the chapter.
+    publish_at: Optional[:class:`datetime.datetime`]
+        When to publish the chapter.
+    sorting_key: Optional[Callable[[:class:`pathlib.Path`], Any]]
+        The key to sort the images by, see :meth:`ChapterUpload.upload_images <hondana.ChapterUpload.upload_images>`.
+    state_path: Optional[Union[:class:`os.PathLike`, :class:`str`]]
+        A file to persist the upload session's state to, see :class:`~hondana.ChapterUpload`.
+    """
+
+    __slots__ = (
+        "accept_tos",
+        "chapter",
+        "chapter_to_edit",
+        "external_url",
+        "images",
+        "manga",
+        "publish_at",
+        "scanlator_groups",
+        "sorting_key",
+        "state_path",
+        "title",
+        "translated_language",
+        "version",
+        "volume",
+    )
+
+    def __init__(
+        self,
+        manga: Manga | str,
+        /,
+        *,
+        chapter: str,
+        images: list[pathlib.Path],
+        translated_language: LanguageCode,
+        scanlator_groups: list[str],
+        accept_tos: bool,
+        volume: str | None = None,
+        title: str | None = None,
+        chapter_to_edit: Chapter | str | None = None,
+        version: int | None = None,
+        external_url: str | None = None,
+        publish_at: datetime.datetime | None = None,
+        sorting_key: Callable[[pathlib.Path], Any] | None = None,
+        state_path: PathLike[str] | str | None = None,
+    ) -> None:
+        self.manga: Manga | str = manga
+        self.chapter: str = chapter
+        self.images: list[pathlib.Path] = images
+        self.translated_language: LanguageCode = translated_language
+        self.scanlator_groups: list[str] = scanlator_groups
+        self.accept_tos: bool = accept_tos
+        self.volume: str | None = volume
+        self.title: str | None = title
+        self.chapter_to_edit: Chapter | str | None = chapter_to_edit
+        self.version: int | None = version
+        self.external_url: str | None = external_url
+        self.publish_at: datetime.datetime | None = publish_at
+        self.sorting_key: Callable[[pathlib.Path], Any] | None = sorting_key
+        self.state_path: PathLike[str] | str | None = state_path
+
+    def __repr__(self) -> str:
+        return f"<ChapterUploadSpec chapter={self.chapter!r} images={len(self.images)}>"
+
+
+def _read_images(images: list[pathlib.Path], /) -> dict[pathlib.Path, bytes]:
+    # runs in a worker thread
+    return {image: image.read_bytes() for image in images}
+
+
+class UploadQueue:
+    """Uploads many chapters one after another, preparing the next chapters while the current one uploads.
+
+    MangaDex allows one open upload session per user, so the chapters are uploaded strictly in turn.
+    Meanwhile the images of the next ``prepare_ahead`` chapters are sorted,
+    validated (see :meth:`ChapterUpload.validate_images <hondana.ChapterUpload.validate_images>`),
+    read into memory and optionally transformed, so each upload can start as soon as the previous chapter is committed.
+
+    .. code-block:: python3
+
+        queue = UploadQueue(client, prepare_ahead=2)
+        for number, images in enumerate(volume, start=1):
+            queue.add(ChapterUploadSpec(manga, chapter=str(number), images=images, ...))
+
+        async for chapter in queue.run():
+            print(f"Uploaded {chapter}")
+
+    Parameters
+    ----------
+    client: :class:`~hondana.Client`
+        The authenticated client to upload with.
+    specs: Iterable[:class:`ChapterUploadSpec`]
+        The chapters to upload, in order. More can be added with :meth:`add`.
+    prepare_ahead: :class:`int`
+        How many chapters past the one uploading to prepare at once. Defaults to ``1``.
+    transform: Optional[:class:`~hondana.ImageTransform`]
+        A transform to run over every chapter's images while preparing them, e.g. :class:`~hondana.PillowTransform`.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        The executor to run ``transform`` in.
+        If ``None``, one from :func:`~hondana.utils.default_transform_executor` is used while the queue runs.
+    """
+
+    __slots__ = (
+        "_client",
+        "_specs",
+        "executor",
+        "prepare_ahead",
+        "transform",
+    )
+
+    def __init__(
+        self,
+        client: Client,
+        /,
+        specs: Iterable[ChapterUploadSpec] = (),
+        *,
+        prepare_ahead: int = 1,
+        transform: ImageTransform | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        self._client: Client = client
+        self._specs: list[ChapterUploadSpec] = list(specs)
+        self.prepare_ahead: int = max(prepare_ahead, 0)
+        self.transform: ImageTransform | None = transform
+        self.executor: Executor | None = executor
+
+    def __repr__(self) -> str:
+        return f"<UploadQueue chapters={len(self._specs)} prepare_ahead={self.prepare_ahead}>"
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def add(self, spec: ChapterUploadSpec, /) -> None:
+        """Adds a chapter to the end of the queue.
+
+        Parameters
+        ----------
+        spec: :class:`ChapterUploadSpec`
+            The chapter to upload.
+        """
+        self._specs.append(spec)
+
+    async def _prepare(
+        self,
+        spec: ChapterUploadSpec,
+        /,
+        *,
+        executor: Executor | None,
+    ) -> tuple[list[pathlib.Path], dict[pathlib.Path, bytes]]:
+        # the files are read by the executor's workers when transformed
+        images, contents = await _prepare_images(
+            spec.images,
+            validate=True,
+            sort=True,
+            sorting_key=spec.sorting_key,
+            contents=None,
+            transform=self.transform,
+            executor=executor,
+        )
+        if contents is None:
+            return images, await asyncio.to_thread(_read_images, images)
+        return images, dict(contents)
+
+    async def run(self) -> AsyncGenerator[Chapter, None]:
+        """Uploads the queued chapters in order, yielding each chapter once it is committed.
+
+        Each chapter is removed from the queue once it is committed, so if the run fails the queue still holds
+        the failed chapter and those after it, and can be run again.
+
+        Raises
+        ------
+        UploadValidationError
+            A chapter's images failed validation. The chapters before it have been uploaded.
+        UploadIncomplete
+            Some of a chapter's images could not be uploaded, so it was not committed.
+            The chapters before it have been uploaded.
+
+        Yields
+        ------
+        :class:`~hondana.Chapter`
+            Each uploaded chapter.
+        """
+        specs = self._specs.copy()
+        executor = self.executor
+        if self.transform is not None and executor is None:
+            executor = default_transform_executor()
+        prepared: dict[int, asyncio.Task[tuple[list[pathlib.Path], dict[pathlib.Path, bytes]]]] = {}
+
+        scheduled = 0
+
+        def prepare_until(last: int, /) -> None:
+            nonlocal scheduled
+            while scheduled <= min(last, len(specs) - 1):
+                prepared[scheduled] = asyncio.create_task(self._prepare(specs[scheduled], executor=executor))
+                scheduled += 1
+
+        try:
+            for index, spec in enumerate(specs):
+                prepare_until(index + self.prepare_ahead)
+                images, contents = await prepared.pop(index)
+                LOGGER.info("Uploading chapter %s (%d of %d).", spec.chapter, index + 1, len(specs))
+
+                async with self._client.upload_session(
+                    spec.manga,
+                    chapter=spec.chapter,
+                    chapter_to_edit=spec.chapter_to_edit,
+                    volume=spec.volume,
+                    title=spec.title,
+                    translated_language=spec.translated_language,
+                    scanlator_groups=spec.scanlator_groups,
+                    external_url=spec.external_url,
+                    publish_at=spec.publish_at,
+                    version=spec.version,
+                    accept_tos=spec.accept_tos,
+                    state_path=spec.state_path,
+                ) as session:
+                    result = await session.upload_images(images, sort=False, validate=False, contents=contents)
+                    if result.has_failures:
+                        # as with `Client.upload_chapter`, a chapter is never committed with pages missing
+                        if spec.state_path is None:
+                            await session.abandon()
+                        raise UploadIncomplete(result)
+                    chapter = await session.commit()
+
+                del contents
+                self._specs = [item for item in self._specs if item is not spec]
+                yield chapter
+        finally:
+            for task in prepared.values():
+                task.cancel()
+            # wait for the preparations to finish, retrieving their exceptions, so none outlive the run
+            await asyncio.gather(*prepared.values(), return_exceptions=True)
+            if executor is not None and executor is not self.executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def upload_all(self) -> list[Chapter]:
+        """|coro|
+
+        Uploads the queued chapters in order, see :meth:`run`.
+
+        Returns
+        -------
+        List[:class:`~hondana.Chapter`]
+            The uploaded chapters.
+        """
+        return [chapter async for chapter in self.run()]
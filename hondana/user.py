@@ -195,9 +195,8 @@ class User:
 
         ids = [r["id"] for r in self._group_relationships]
 
-        data = await self._http.scanlation_group_list(
-            limit=100,
-            offset=0,
+        data = await self._http.fetch_by_ids(
+            self._http.scanlation_group_list,
             ids=ids,
             name=None,
             focused_language=None,
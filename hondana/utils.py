@@ -27,11 +27,15 @@ from __future__ import annotations
 import datetime
 import json
 import logging
+import math
 import pathlib
 import re
+import struct
+import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import wraps
-from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, TypedDict, TypeVar, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, TypeVar, overload
 from urllib.parse import quote as _uriquote
 
 import multidict
@@ -58,7 +62,8 @@ else:
 from .errors import AuthenticationRequired
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Sequence
+    from collections.abc import Callable, Hashable, Iterable, Mapping, MutableMapping, Sequence
+    from concurrent.futures import Executor
     from typing import Concatenate, TypeAlias
 
     import aiohttp
@@ -91,14 +96,22 @@ __all__ = (
     "MANGA_TAGS",
     "MISSING",
     "AuthorArtistTag",
+    "CompiledQuery",
+    "InternTable",
     "RelationshipResolver",
     "Route",
     "as_chunks",
+    "as_sized_chunks",
+    "as_url_chunks",
     "cached_slot_property",
     "clean_isoformat",
+    "decode_json",
+    "default_decode_executor",
+    "default_transform_executor",
     "delta_to_iso",
     "deprecated",
     "from_json",
+    "get_image_dimensions",
     "get_image_mime_type",
     "iso_to_delta",
     "json_or_text",
@@ -110,6 +123,22 @@ __all__ = (
 
 _PROJECT_DIR = pathlib.Path(__file__)
 MAX_DEPTH: int = 10_000
+# the most list query values sent per request, and the longest their encoded ``key[]=value`` pairs may get
+MAX_QUERY_VALUES: int = 100
+MAX_QUERY_LENGTH: int = 6_000
+# how many compiled queries each client keeps for reuse
+MAX_COMPILED_QUERIES: int = 256
+# JSON bodies at least this large are decoded in a client's ``decode_executor``, if it has one
+DECODE_THRESHOLD: int = 256 * 1024
+# image bodies are streamed to disk in chunks of this many bytes
+IMAGE_CHUNK_SIZE: int = 64 * 1024
+# the limits MangaDex puts on uploaded images, per file and per upload request
+MAX_UPLOAD_FILE_SIZE: int = 20 * 1024 * 1024
+MAX_UPLOAD_REQUEST_SIZE: int = 150 * 1024 * 1024
+MAX_UPLOAD_FILES_PER_REQUEST: int = 10
+MAX_IMAGE_DIMENSION: int = 10_000
+# upload requests are filled up to this many bytes, well under the limit so large batches do not time out
+UPLOAD_REQUEST_TARGET_SIZE: int = 32 * 1024 * 1024
 MANGADEX_URL_REGEX = re.compile(
     r"(?:http[s]?:\/\/)?mangadex\.org\/(?P<type>title|chapter|author|tag)\/(?P<ID>[a-z0-9]{8}\-[a-z0-9]{4}\-[a-z0-9]{4}\-[a-z0-9]{4}\-[a-z0-9]{12})\/?(?P<title>.*)",
 )
@@ -302,6 +331,55 @@ def deprecated(alternate: str | None = None, /) -> Callable[[Callable[B, T]], Ca
     return decorator
 
 
+def _order_value(value: Any, /) -> tuple[float, str]:
+    # numbers, and numeric strings such as chapter numbers, sort by value; anything else sorts after them as text
+    if isinstance(value, int | float):
+        return (float(value), "")
+    try:
+        return (float(value), str(value))
+    except (TypeError, ValueError):
+        return (math.inf, str(value))
+
+
+def order_by_attributes(items: list[dict[str, Any]], order: Mapping[str, str], /) -> list[dict[str, Any]]:
+    """Sorts API items by their attributes, as an ``order[...]`` query would have sorted them.
+
+    Items without a value for a field keep their relative order after the others.
+
+    Parameters
+    ----------
+    items: List[Dict[:class:`str`, Any]]
+        The items, e.g. the ``data`` of a list response.
+    order: Mapping[:class:`str`, :class:`str`]
+        The fields to sort by, in priority order, mapped to ``"asc"`` or ``"desc"``.
+
+    Raises
+    ------
+    ValueError
+        A field is not a plain attribute of every item (e.g. ``relevance`` or localised titles), so it can't be sorted by.
+
+    Returns
+    -------
+    List[Dict[:class:`str`, Any]]
+        The sorted items.
+    """
+    ret = list(items)
+    # sorts are stable, so sorting by the least significant field first gives the combined order
+    for field, direction in reversed(list(order.items())):
+        if not all(
+            field in item.get("attributes", {}) and not isinstance(item["attributes"][field], dict | list) for item in ret
+        ):
+            msg = f"Can't order by {field!r} here, as it is not a plain attribute of every item."
+            raise ValueError(msg)
+
+        present = [item for item in ret if item["attributes"][field] is not None]
+        missing = [item for item in ret if item["attributes"][field] is None]
+        present.sort(key=lambda item: _order_value(item["attributes"][field]), reverse=direction == "desc")
+        ret = present + missing
+
+    return ret
+
+
 def calculate_limits(limit: int, offset: int, /, *, max_limit: int = 100) -> tuple[int, int]:
     """A helper function that will calculate the offset and limit parameters for API endpoints.
 
@@ -359,6 +437,68 @@ async def json_or_text(response: aiohttp.ClientResponse, /) -> dict[str, Any] |
     return text
 
 
+def _share_strings(value: Any, table: dict[str, str], /) -> Any:
+    if isinstance(value, str):
+        return table.setdefault(value, value)
+    if isinstance(value, dict):
+        mapping: dict[str, Any] = value  # pyright: ignore[reportUnknownVariableType] # this is a raw payload
+        for key, item in mapping.items():
+            mapping[key] = _share_strings(item, table)
+    elif isinstance(value, list):
+        items: list[Any] = value  # pyright: ignore[reportUnknownVariableType] # this is a raw payload
+        items[:] = [_share_strings(item, table) for item in items]
+    return value  # pyright: ignore[reportUnknownVariableType] # this is a raw payload
+
+
+def decode_json(data: bytes | str, /) -> Any:
+    """Decodes a JSON payload, sharing the instances of repeated string values.
+
+    This is what a client's ``decode_executor`` runs when it is not a thread pool. Sharing the strings means
+    the pickled result of a :class:`~concurrent.futures.ProcessPoolExecutor` only carries each distinct value once.
+
+    Returns
+    -------
+    Any
+        The decoded payload.
+    """
+    return _share_strings(_from_json(data), {})
+
+
+def default_decode_executor(max_workers: int | None = None, /) -> Executor:
+    """Creates an executor suitable for a client's ``decode_executor``.
+
+    This is a :class:`~concurrent.futures.ThreadPoolExecutor`. On free-threaded builds running without the GIL,
+    large bodies are decoded in parallel with the event loop. Otherwise the JSON parser holds the GIL for the whole
+    decode, so the loop still waits for it, and the pool only keeps the rest of the request handling off the loop.
+
+    A :class:`~concurrent.futures.ProcessPoolExecutor` decodes in parallel on any build, but the loop then has to
+    unpickle the result. ``python -m hondana bench decode_inline decode_threaded decode_process`` compares the
+    event loop stalls and latencies of the three on a given machine.
+
+    Returns
+    -------
+    :class:`concurrent.futures.Executor`
+        The executor, which the caller is responsible for shutting down.
+    """
+    return ThreadPoolExecutor(max_workers)
+
+
+def default_transform_executor(max_workers: int | None = None, /) -> Executor:
+    """Creates an executor suitable for running an :class:`~hondana.ImageTransform`.
+
+    This is a :class:`~concurrent.futures.ThreadPoolExecutor` on free-threaded builds running without the GIL,
+    and a :class:`~concurrent.futures.ProcessPoolExecutor` otherwise.
+
+    Returns
+    -------
+    :class:`concurrent.futures.Executor`
+        The executor, which the caller is responsible for shutting down.
+    """
+    if not getattr(sys, "_is_gil_enabled", lambda: True)():
+        return ThreadPoolExecutor(max_workers)
+    return ProcessPoolExecutor(max_workers)
+
+
 def php_query_builder(obj: MANGADEX_QUERY_PARAM_TYPE, /) -> multidict.MultiDict[str | int]:
     """
     A helper function that builds a MangaDex (PHP) query string from a mapping.
@@ -393,6 +533,117 @@ def php_query_builder(obj: MANGADEX_QUERY_PARAM_TYPE, /) -> multidict.MultiDict[
     return fmt
 
 
+_PAGINATION_PARAMS: frozenset[str] = frozenset({"limit", "offset"})
+
+
+def _freeze_param(value: str | int | bool | list[Any] | dict[str, str] | None, /) -> Hashable:  # noqa: FBT001 # not a flag
+    # mirrors :func:`php_query_builder`, so values that build the same query also share a key
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(value.items())
+    return value
+
+
+class CompiledQuery:
+    """A MangaDex query with its static parameters built once, so that only ``limit`` and ``offset`` change between pages.
+
+    Compiled queries are hashable and compare equal when they build the same query string,
+    so :attr:`key` can be used (alongside the route) to key cached responses.
+
+    Parameters
+    ----------
+    params: Mapping[:class:`str`, Optional[Union[:class:`str`, :class:`int`, :class:`bool`, List[:class:`str`], Dict[:class:`str`, :class:`str`]]]]
+        The query parameters, as passed to :func:`php_query_builder`.
+
+    Attributes
+    ----------
+    static: Tuple[Tuple[:class:`str`, Union[:class:`str`, :class:`int`]], ...]
+        The built query parameters, other than ``limit`` and ``offset``.
+    limit: Optional[:class:`int`]
+        The page size of this query, if any.
+    offset: Optional[:class:`int`]
+        The pagination offset of this query, if any.
+    """  # noqa: E501 # required for formatting
+
+    __slots__ = (
+        "_built",
+        "limit",
+        "offset",
+        "static",
+    )
+
+    def __init__(self, params: MANGADEX_QUERY_PARAM_TYPE, /) -> None:
+        self._built: multidict.MultiDict[str | int] = php_query_builder(
+            {key: value for key, value in params.items() if key not in _PAGINATION_PARAMS},
+        )
+        self.static: tuple[tuple[str, str | int], ...] = tuple(self._built.items())
+        self.limit: int | None = params.get("limit")  # pyright: ignore[reportAttributeAccessIssue] # pagination is always an int
+        self.offset: int | None = params.get("offset")  # pyright: ignore[reportAttributeAccessIssue] # pagination is always an int
+
+    def __repr__(self) -> str:
+        return f"<CompiledQuery params={len(self.static)} limit={self.limit} offset={self.offset}>"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CompiledQuery) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    @staticmethod
+    def params_key(params: MANGADEX_QUERY_PARAM_TYPE, /) -> Hashable:
+        """Returns a hashable key for the static part of ``params``, without building it.
+
+        Returns
+        -------
+        Hashable
+        """
+        return tuple((key, _freeze_param(value)) for key, value in params.items() if key not in _PAGINATION_PARAMS)
+
+    @property
+    def key(self) -> tuple[tuple[tuple[str, str | int], ...], int | None, int | None]:
+        """The hashable identity of this query, including the pagination.
+
+        Returns
+        -------
+        Tuple[Tuple[Tuple[:class:`str`, Union[:class:`str`, :class:`int`]], ...], Optional[:class:`int`], Optional[:class:`int`]]
+        """  # noqa: E501 # required for formatting
+        return self.static, self.limit, self.offset
+
+    def with_page(self, *, limit: int | None, offset: int | None) -> CompiledQuery:
+        """Returns a copy of this query for another page, sharing the built static parameters.
+
+        Returns
+        -------
+        :class:`CompiledQuery`
+        """
+        ret = CompiledQuery.__new__(CompiledQuery)
+        ret._built = self._built  # noqa: SLF001 # same class
+        ret.static = self.static
+        ret.limit = limit
+        ret.offset = offset
+        return ret
+
+    def to_multidict(self) -> multidict.MultiDict[str | int]:
+        """Builds the full query, for passing as a request's ``params``.
+
+        Returns
+        -------
+        :class:`multidict.MultiDict`
+        """
+        # copying the built parameters is much cheaper than building a new MultiDict from them
+        fmt = self._built.copy()
+        if self.limit is not None:
+            fmt.add("limit", self.limit)
+        if self.offset is not None:
+            fmt.add("offset", self.offset)
+        return fmt
+
+
 def get_image_mime_type(data: bytes, /) -> str:
     """Returns the image type from the first few bytes.
 
@@ -408,6 +659,8 @@ def get_image_mime_type(data: bytes, /) -> str:
     """
     if data.startswith(b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a"):
         return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
     if data[:3] == b"\xff\xd8\xff" or data[6:10] in (b"JFIF", b"Exif"):
         return "image/jpeg"
     if data.startswith((b"\x47\x49\x46\x38\x37\x61", b"\x47\x49\x46\x38\x39\x61")):
@@ -417,6 +670,59 @@ def get_image_mime_type(data: bytes, /) -> str:
     raise ValueError(msg)
 
 
+# JPEG start of frame markers, which hold the image dimensions
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def get_image_dimensions(data: bytes, /) -> tuple[int, int]:
+    """Returns the width and height of an image from its header.
+
+    ``data`` only needs to hold the start of the image, up to (for JPEGs) its start of frame segment.
+
+    Raises
+    ------
+    ValueError
+        Unsupported image type used, or the dimensions are not within ``data``.
+
+    Returns
+    -------
+    Tuple[:class:`int`, :class:`int`]
+        The width and height of the image.
+    """
+    mime_type = get_image_mime_type(data)
+
+    if mime_type == "image/png" and len(data) >= 24:
+        # the IHDR chunk always comes first
+        return struct.unpack(">II", data[16:24])
+    if mime_type == "image/gif" and len(data) >= 10:
+        return struct.unpack("<HH", data[6:10])
+    if mime_type == "image/webp":
+        chunk = data[12:16]
+        if chunk == b"VP8 " and len(data) >= 30:
+            width, height = struct.unpack("<HH", data[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L" and len(data) >= 25:
+            bits = int.from_bytes(data[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b"VP8X" and len(data) >= 30:
+            return int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+    if mime_type == "image/jpeg":
+        index = 2
+        while index + 9 <= len(data) and data[index] == 0xFF:
+            marker = data[index + 1]
+            if marker == 0xFF:
+                # padding
+                index += 1
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                height, width = struct.unpack(">HH", data[index + 5 : index + 9])
+                return width, height
+            index += 2 + int.from_bytes(data[index + 2 : index + 4], "big")
+
+    msg = "Could not read the image dimensions."
+    raise ValueError(msg)
+
+
 def to_snake_case(string: str, /) -> str:
     """Quick function to return snake_case from camelCase.
 
@@ -469,6 +775,89 @@ def as_chunks(iterator: Iterable[T], /, max_size: int) -> Iterable[list[T]]:
         yield ret
 
 
+def as_url_chunks(
+    values: Iterable[str],
+    /,
+    key: str,
+    *,
+    max_size: int = MAX_QUERY_VALUES,
+    max_length: int = MAX_QUERY_LENGTH,
+) -> Iterable[list[str]]:
+    """Chunks list query values so that each chunk fits within a safe URL length.
+
+    Parameters
+    ----------
+    values: Iterable[:class:`str`]
+        The query values, e.g. IDs. Duplicates are kept.
+    key: :class:`str`
+        The query key the values are sent under, e.g. ``"ids"`` for ``ids[]=...``.
+    max_size: :class:`int`
+        The most values per chunk. Defaults to 100.
+    max_length: :class:`int`
+        The longest the encoded ``key[]=value&...`` pairs of a chunk may be. Defaults to 6,000.
+
+    Yields
+    ------
+        List[:class:`str`]
+            The chunked values, in their original order.
+    """
+    prefix = len(_uriquote(f"{key}[]", safe="")) + 2  # the ``=`` and ``&``
+    ret: list[str] = []
+    length = 0
+    for value in values:
+        size = prefix + len(_uriquote(value, safe=""))
+        if ret and (len(ret) == max_size or length + size > max_length):
+            yield ret
+            ret = []
+            length = 0
+        ret.append(value)
+        length += size
+    if ret:
+        yield ret
+
+
+def as_sized_chunks(
+    items: Iterable[T],
+    /,
+    weight: Callable[[T], int],
+    *,
+    max_size: int,
+    max_weight: int,
+) -> Iterable[list[T]]:
+    """Chunks items so that each chunk holds at most ``max_size`` items, weighing at most ``max_weight`` in total.
+
+    An item which weighs more than ``max_weight`` on its own is put in a chunk by itself.
+
+    Parameters
+    ----------
+    items: Iterable[T]
+        The items to chunk.
+    weight: Callable[[T], :class:`int`]
+        Returns the weight of an item, e.g. its size in bytes.
+    max_size: :class:`int`
+        The most items per chunk.
+    max_weight: :class:`int`
+        The most the items of a chunk may weigh in total.
+
+    Yields
+    ------
+        List[T]
+            The chunked items, in their original order.
+    """
+    ret: list[T] = []
+    total = 0
+    for item in items:
+        size = weight(item)
+        if ret and (len(ret) == max_size or total + size > max_weight):
+            yield ret
+            ret = []
+            total = 0
+        ret.append(item)
+        total += size
+    if ret:
+        yield ret
+
+
 def delta_to_iso(delta: datetime.timedelta, /) -> str:
     """A helper method to dump a timedelta to an ISO 8601 timedelta string.
 
@@ -534,6 +923,91 @@ def iso_to_delta(iso: str, /) -> datetime.timedelta:
     return datetime.timedelta(**times)
 
 
+# relationship types whose IDs repeat across many entities, the only ones worth interning
+_SHARED_RELATIONSHIP_TYPES: frozenset[str] = frozenset(
+    ("artist", "author", "creator", "leader", "member", "scanlation_group", "tag", "user"),
+)
+
+
+class InternTable:
+    """A table of shared string (and payload) instances, used to de-duplicate the values repeated across large result sets.
+
+    Language codes, relationship types, tag and group IDs and enum values repeat thousands of times in a large feed,
+    with every decoded payload holding its own copy. Passing these values through a single table means each distinct
+    value is only held once for the lifetime of the table.
+
+    .. note::
+        Unlike :func:`sys.intern` the table can be cleared, which releases all the held values.
+    """
+
+    __slots__ = (
+        "_shared",
+        "_strings",
+    )
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._shared: dict[Hashable, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"<InternTable strings={len(self._strings)} shared={len(self._shared)}>"
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __call__(self, value: str, /) -> str:
+        """Returns the shared instance of ``value``, storing it if this is the first time it has been seen.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        return self._strings.setdefault(value, value)
+
+    def update(self, mapping: MutableMapping[str, Any], /, *keys: str) -> None:
+        """Replaces the string (or list of string) values at ``keys`` in ``mapping`` with their shared instances.
+
+        Missing keys and non-string values are ignored.
+        """
+        strings = self._strings
+        for key in keys:
+            value = mapping.get(key)
+            if isinstance(value, str):
+                mapping[key] = strings.setdefault(value, value)
+            elif isinstance(value, list):
+                mapping[key] = [strings.setdefault(item, item) if isinstance(item, str) else item for item in value]  # pyright: ignore[reportUnknownVariableType] # we don't care about the inner types
+
+    def relationships(self, relationships: Iterable[MutableMapping[str, Any]], /) -> None:
+        """Interns the ``type`` of each relationship payload in place.
+
+        The ``id`` is only interned for the types that are shared between many entities, such as authors and groups,
+        as the IDs of e.g. a manga's cover are unique to it and would only grow the table.
+        """
+        strings = self._strings
+        for item in relationships:
+            type_ = item["type"]
+            item["type"] = strings.setdefault(type_, type_)
+            if type_ in _SHARED_RELATIONSHIP_TYPES:
+                id_ = item["id"]
+                item["id"] = strings.setdefault(id_, id_)
+
+    def shared(self, key: Hashable, value: T, /) -> T:
+        """Returns the first object stored under ``key``, or stores and returns ``value``.
+
+        This is used for whole payloads that are identical for a given key, such as a tag at a given version.
+
+        Returns
+        -------
+        T
+        """
+        return self._shared.setdefault(key, value)
+
+    def clear(self) -> None:
+        """Releases every value held by this table."""
+        self._strings.clear()
+        self._shared.clear()
+
+
 RelType = Literal[
     "artist",
     "author",
@@ -556,17 +1030,28 @@ class RelationshipResolver(Generic[T]):
         The relationships we wish to handle/filter.
     relationship_type: :class:`str`
         The type of relationship we want to filter by.
+    intern_table: Optional[:class:`InternTable`]
+        The table to intern resolved relationships with, if any. See :meth:`InternTable.relationships`.
     """
 
     __slots__ = (
+        "_intern_table",
         "_type",
         "limit",
         "relationships",
     )
 
-    def __init__(self, relationships: list[RelationshipResponse], relationship_type: RelType, /) -> None:
+    def __init__(
+        self,
+        relationships: list[RelationshipResponse],
+        relationship_type: RelType,
+        /,
+        *,
+        intern_table: InternTable | None = None,
+    ) -> None:
         self.relationships: list[RelationshipResponse] = relationships
         self._type: RelType = relationship_type
+        self._intern_table: InternTable | None = intern_table
 
     @overload
     def resolve(self, *, with_fallback: Literal[False], remove_empty: bool = ...) -> list[T]: ...
@@ -609,6 +1094,9 @@ class RelationshipResolver(Generic[T]):
                     continue
                 ret.append(relationship)  # pyright: ignore[reportArgumentType] # can't type narrow here
 
+        if self._intern_table is not None:
+            self._intern_table.relationships(item for item in ret if item is not None)  # pyright: ignore[reportArgumentType] # these are relationship payloads
+
         if not ret and with_fallback:
             ret.append(None)
         return ret
@@ -675,7 +1163,7 @@ def clean_isoformat(dt: datetime.datetime, /) -> str:
     return dt.isoformat(timespec="seconds")
 
 
-_PATH_WITH_EXTRA = re.compile(r"(?P<num>\d+)(\-?(?P<extra>\w*))?\.(?P<ext>png|jpg|gif)")
+_PATH_WITH_EXTRA = re.compile(r"(?P<num>\d+)(\-?(?P<extra>\w*))?\.(?P<ext>png|jpe?g|gif|webp)")
 
 
 def upload_file_sort(key: SupportsRichComparison) -> tuple[int, str]:
@@ -686,6 +1174,17 @@ def upload_file_sort(key: SupportsRichComparison) -> tuple[int, str]:
     raise ValueError(msg)
 
 
+def compact_relationships(relationships: Iterable[T], /) -> list[T]:
+    """Reduces relationship payloads to ``id`` and ``type`` stubs, dropping any expanded attributes.
+
+    Returns
+    -------
+    List[T]
+        The compacted relationship payloads.
+    """
+    return [{"id": item["id"], "type": item["type"]} for item in relationships]  # pyright: ignore[reportIndexIssue,reportUnknownVariableType,reportReturnType] # these are always relationship payloads
+
+
 def to_multidict(incoming: Sequence[dict[str, T_co]]) -> MultiDict[T_co]:
     ret = MultiDict[T_co]()
     for item in incoming:
@@ -696,18 +1195,26 @@ def to_multidict(incoming: Sequence[dict[str, T_co]]) -> MultiDict[T_co]:
 
 
 _tags_path: pathlib.Path = _PROJECT_DIR.parent / "extras" / "tags.json"
-with _tags_path.open("r", encoding="utf-8") as _tags_fp:
-    MANGA_TAGS: dict[str, str] = _from_json(_tags_fp.read())
 
 
-class _ReportReasons(TypedDict):
-    manga: dict[str, str]
-    chapter: dict[str, str]
-    scanlation_group: dict[str, str]
-    author: dict[str, str]
-    user: dict[str, str]
+# these are loaded on first access via the module `__getattr__` below, so importing hondana doesn't parse them
+if TYPE_CHECKING:
+    MANGA_TAGS: dict[str, str]
+
+_LAZY_JSON_ATTRIBUTES: dict[str, pathlib.Path] = {
+    "MANGA_TAGS": _tags_path,
+}
+
+
+def __getattr__(name: str) -> Any:
+    path = _LAZY_JSON_ATTRIBUTES.get(name)
+    if path is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
 
+    with path.open("r", encoding="utf-8") as fp:
+        value = _from_json(fp.read())
 
-_report_reason_path = _PROJECT_DIR.parent / "extras" / "report_reasons.json"
-with _report_reason_path.open("r") as _reports_fp:
-    _REPORT_REASONS: _ReportReasons = _from_json(_reports_fp.read())
+    # cache it as a real module global so subsequent lookups skip this function
+    globals()[name] = value
+    return value
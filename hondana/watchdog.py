@@ -0,0 +1,285 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from types import TracebackType
+    from typing import Self
+
+__all__ = (
+    "BlockingReport",
+    "LoopWatchdog",
+    "current_operation",
+    "operation",
+)
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+current_operation: ContextVar[str | None] = ContextVar("hondana_operation", default=None)
+# mirrors ``current_operation`` per task, so the watchdog thread can see which operation a blocked task is in
+_task_operations: weakref.WeakKeyDictionary[asyncio.Task[Any], str] = weakref.WeakKeyDictionary()
+
+
+def _current_task() -> asyncio.Task[Any] | None:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+@contextmanager
+def operation(name: str, /) -> Generator[None, None, None]:
+    """A context manager that marks the code within it as the hondana operation ``name``.
+
+    Blocking slices of the event loop detected by a :class:`LoopWatchdog` while the operation
+    is running are attributed to it. Operations nest, the innermost one wins.
+
+    Parameters
+    ----------
+    name: :class:`str`
+        The name of the operation, e.g. ``"GET /manga"``.
+    """
+    token = current_operation.set(name)
+    task = _current_task()
+    previous = None
+    if task is not None:
+        previous = _task_operations.get(task)
+        _task_operations[task] = name
+
+    try:
+        yield
+    finally:
+        current_operation.reset(token)
+        if task is not None:
+            if previous is None:
+                _task_operations.pop(task, None)
+            else:
+                _task_operations[task] = previous
+
+
+class BlockingReport:
+    """The blocking slices a :class:`LoopWatchdog` attributed to one operation.
+
+    Attributes
+    ----------
+    operation: Optional[:class:`str`]
+        The hondana operation that was running, ``None`` if the loop was blocked outside of one.
+    count: :class:`int`
+        How many blocking slices were detected.
+    total: :class:`float`
+        The total time, in seconds, the loop was blocked for.
+    worst: :class:`float`
+        The longest single blocking slice, in seconds.
+    """
+
+    __slots__ = (
+        "count",
+        "operation",
+        "total",
+        "worst",
+    )
+
+    def __init__(self, operation: str | None, /) -> None:
+        self.operation: str | None = operation
+        self.count: int = 0
+        self.total: float = 0.0
+        self.worst: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<BlockingReport operation={self.operation!r} count={self.count} worst={self.worst:.3f}>"
+
+
+class LoopWatchdog:
+    """An opt-in monitor for the lag of the running event loop.
+
+    A background thread pings the loop every ``interval`` seconds. When a ping is not answered
+    within ``threshold`` seconds the loop is considered blocked, and the slice is attributed to the
+    hondana operation (see :func:`operation`) of the task that is running at that moment.
+
+    The library marks HTTP requests (as ``"VERB /path"``), page writes in :meth:`Chapter.download`,
+    image reads in :meth:`ChapterUpload.upload_images` and the file write in :meth:`Client.update_tags`.
+
+    This class can be used as an async context manager, which starts and stops it.
+
+    Parameters
+    ----------
+    threshold: :class:`float`
+        The lag, in seconds, above which the loop counts as blocked. Defaults to ``0.1``.
+    interval: :class:`float`
+        How often, in seconds, to ping the loop. Defaults to ``0.05``.
+    on_block: Optional[Callable[[Optional[:class:`str`], :class:`float`], Any]]
+        A callable called on the event loop with the operation and length of each blocking slice,
+        once the loop has recovered. Use this to forward the measurements to your metrics.
+    """
+
+    __slots__ = (
+        "_loop",
+        "_reports",
+        "_stopped",
+        "_thread",
+        "interval",
+        "on_block",
+        "threshold",
+    )
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.1,
+        interval: float = 0.05,
+        on_block: Callable[[str | None, float], Any] | None = None,
+    ) -> None:
+        self.threshold: float = threshold
+        self.interval: float = interval
+        self.on_block: Callable[[str | None, float], Any] | None = on_block
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped: threading.Event = threading.Event()
+        self._reports: dict[str | None, BlockingReport] = {}
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """Whether the watchdog is currently monitoring a loop.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop.
+
+        Raises
+        ------
+        RuntimeError
+            The watchdog is already running, or there is no running event loop.
+        """
+        if self.running:
+            msg = "This watchdog is already running."
+            raise RuntimeError(msg)
+
+        self._loop = asyncio.get_running_loop()
+        # each thread gets its own event, so one left over from a previous run can't be revived by this one
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._watch, args=(self._stopped,), name="hondana-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop monitoring the event loop. The collected reports are kept.
+
+        This waits at most ``threshold + interval`` seconds for the watchdog thread to exit,
+        so it never waits on a ping the blocked loop can't answer.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(self.threshold + self.interval)
+            self._thread = None
+
+    def reset(self) -> None:
+        """Discard the collected reports."""
+        self._reports.clear()
+
+    def report(self, limit: int | None = None) -> list[BlockingReport]:
+        """The operations that blocked the loop, worst offenders first.
+
+        Parameters
+        ----------
+        limit: Optional[:class:`int`]
+            How many reports to return at most. Defaults to all of them.
+
+        Returns
+        -------
+        List[:class:`BlockingReport`]
+        """
+        reports = sorted(self._reports.values(), key=lambda report: (report.worst, report.total), reverse=True)
+        return reports[:limit]
+
+    def _record(self, operation: str | None, lag: float, /) -> None:
+        report = self._reports.get(operation)
+        if report is None:
+            report = self._reports[operation] = BlockingReport(operation)
+
+        report.count += 1
+        report.total += lag
+        report.worst = max(report.worst, lag)
+
+        LOGGER.warning("The event loop was blocked for %.3fs during: %s", lag, operation)
+        if self.on_block is not None:
+            self.on_block(operation, lag)
+
+    def _watch(self, stopped: threading.Event, /) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+
+        while not stopped.wait(self.interval):
+            answered = threading.Event()
+            sent = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(answered.set)
+            except RuntimeError:
+                # the loop has been closed under us
+                return
+
+            if answered.wait(self.threshold):
+                continue
+
+            # the loop is blocked right now, so the task it is running is the one blocking it
+            task = asyncio.current_task(loop)
+            operation = _task_operations.get(task) if task is not None else None
+
+            while not answered.wait(self.interval):
+                # ``stop`` may be the call blocking the loop, in which case the ping is never answered
+                if stopped.is_set() or loop.is_closed():
+                    return
+
+            lag = time.perf_counter() - sent
+            try:
+                loop.call_soon_threadsafe(self._record, operation, lag)
+            except RuntimeError:
+                return
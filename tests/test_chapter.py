@@ -24,18 +24,29 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import json
 import pathlib
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
-from hondana.chapter import Chapter
+import pytest
+
+from hondana.chapter import Chapter, ChapterUpload
+from hondana.client import Client
+from hondana.errors import MangaDexServerError, NotFound, UploadIncomplete, UploadValidationError
+from hondana.http import HTTPClient
+from hondana.store import PageStore
+from hondana.transforms import ImageTransform
+from hondana.uploads import ChapterUploadSpec, UploadQueue
 from hondana.utils import RelationshipResolver, to_snake_case
 
 if TYPE_CHECKING:
-    from hondana.http import HTTPClient
-    from hondana.types_.chapter import GetSingleChapterResponse
+    from hondana.types_.chapter import GetAtHomeResponse, GetSingleChapterResponse
     from hondana.types_.manga import MangaResponse
     from hondana.types_.scanlator_group import ScanlationGroupResponse
     from hondana.types_.user import UserResponse
@@ -53,6 +64,98 @@ def clone_chapter() -> Chapter:
     return Chapter(HTTP, t["data"])
 
 
+class FakeAtHomeHTTP:
+    """Serves an @Home node of ``pages`` pages, where each page's content is its file name."""
+
+    def __init__(self, pages: int) -> None:
+        self.pages = [f"{number}.png" for number in range(pages)]
+        self.requested: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_at_home_url(self, _: str, /, *, ssl: bool) -> GetAtHomeResponse:  # noqa: ARG002 # matching the real signature
+        return {
+            "result": "ok",
+            "baseUrl": "https://example.org",
+            "chapter": {"hash": "hash", "data": list(self.pages), "dataSaver": list(self.pages)},
+        }
+
+    async def request(self, route: Any) -> tuple[bytes, Any]:
+        name: str = route.url.name
+        self.requested.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return name.encode(), SimpleNamespace(status=200)
+
+
+class FakeUploadAPI:
+    """Serves an upload session, failing each file in ``failures`` that many times."""
+
+    def __init__(self, failures: dict[str, int], *, failed_requests: int = 0) -> None:
+        self.failures = failures
+        self.failed_requests = failed_requests
+        self.abandoned = False
+        self.session_id: str | None = None
+        self.sent: list[list[str]] = []
+        self.page_order: list[str] = []
+        self.sessions = 0
+
+    async def request(self, route: Any, *, data: Any = None, json: Any = None, **__: Any) -> Any:
+        path: str = route.url.path
+        if route.verb == "GET" and path == "/upload":
+            if self.session_id is None:
+                raise NotFound(SimpleNamespace(headers={"x-request-id": "test"}), errors=[])  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+            return {"data": {"id": self.session_id}}
+        if path.startswith("/upload/begin"):
+            assert self.session_id is None, "only one upload session can be open"
+            self.sessions += 1
+            self.session_id = "session"
+            return {"data": {"id": self.session_id}}
+        if path.endswith("/commit"):
+            self.page_order = json["pageOrder"]
+            self.session_id = None
+            return deepcopy(PAYLOAD)
+        if route.verb == "DELETE":
+            self.abandoned = True
+            self.session_id = None
+            return None
+        if self.failed_requests > 0:
+            self.failed_requests -= 1
+            raise MangaDexServerError(SimpleNamespace(status=503), status_code=503)  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+
+        names: list[str] = [field[0]["name"] for field in data._fields]
+        self.sent.append(names)
+        pages: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        for name in names:
+            if self.failures.get(name, 0) > 0:
+                self.failures[name] -= 1
+                errors.append({"id": "error", "status": 400, "title": "failed", "detail": name})
+            else:
+                pages.append({"id": f"page-{name}", "attributes": {"originalFileName": name}})
+        return {"result": "ok", "data": pages, "errors": errors}
+
+
+class ToWebP(ImageTransform):
+    def __call__(self, name: str, data: bytes, /) -> tuple[str, bytes]:
+        return str(pathlib.PurePath(name).with_suffix(".webp")), data
+
+
+class Resize(ImageTransform):
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+    def __call__(self, name: str, data: bytes, /) -> tuple[str, bytes]:  # noqa: ARG002 # matching the real signature
+        return name, png(800, 1200, size=self.size)
+
+
+def png(width: int, height: int, size: int = 64) -> bytes:
+    header = b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", width, height)
+    return header + bytes(max(size - len(header), 0))
+
+
 class TestChapter:
     def test_id(self) -> None:
         chapter = clone_chapter()
@@ -125,3 +228,373 @@ class TestChapter:
         assert chapter.created_at == datetime.datetime.fromisoformat(PAYLOAD["data"]["attributes"]["createdAt"])
         assert chapter.published_at == datetime.datetime.fromisoformat(PAYLOAD["data"]["attributes"]["publishAt"])
         assert chapter.updated_at == datetime.datetime.fromisoformat(PAYLOAD["data"]["attributes"]["updatedAt"])
+
+    def test_to_payload(self) -> None:
+        chapter = clone_chapter()
+        payload = chapter.to_payload()
+
+        assert payload["id"] == PAYLOAD["data"]["id"]
+        assert payload["attributes"] == PAYLOAD["data"]["attributes"]
+        assert Chapter(HTTP, payload).to_payload() == chapter.to_payload()
+
+    def test_compact_models(self) -> None:
+        http: HTTPClient = SimpleNamespace(compact_models=True)  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+        chapter = Chapter(http, deepcopy(PAYLOAD)["data"])
+        full = clone_chapter()
+
+        assert chapter._data is None  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert chapter._attributes is None  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert chapter.manga is None
+        assert chapter.manga_id == full.manga_id
+        assert chapter.to_payload()["attributes"] == full.to_payload()["attributes"]
+        assert all(set(item) == {"id", "type"} for item in chapter.to_payload().get("relationships", []))
+
+    @pytest.mark.asyncio
+    async def test_download_concurrency_and_resume(self, tmp_path: pathlib.Path) -> None:
+        fake = FakeAtHomeHTTP(6)
+        chapter = Chapter(fake, deepcopy(PAYLOAD)["data"])  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+
+        (tmp_path / "2.png").write_bytes(b"already downloaded")
+        written: list[tuple[str, int]] = []
+
+        await chapter.download(
+            tmp_path,
+            concurrency=3,
+            resume=True,
+            on_page=lambda path, size: written.append((path.name, size)),
+        )
+
+        assert fake.requested == ["0.png", "2.png", "3.png", "4.png", "5.png"]
+        assert fake.max_in_flight == 3
+        assert [name for name, _ in written] == ["1.png", "3.png", "4.png", "5.png", "6.png"]
+        assert (tmp_path / "2.png").read_bytes() == b"already downloaded"
+        assert (tmp_path / "6.png").read_bytes() == b"5.png"
+        assert not list(tmp_path.glob("*.part"))
+
+    @pytest.mark.asyncio
+    async def test_download_bytes_order(self) -> None:
+        fake = FakeAtHomeHTTP(5)
+        chapter = Chapter(fake, deepcopy(PAYLOAD)["data"])  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+
+        pages = [page async for page in chapter.download_bytes(start_page=1, end_page=4, concurrency=2)]
+        assert pages == [b"1.png", b"2.png", b"3.png"]
+
+    @pytest.mark.asyncio
+    async def test_download_to_store(self, tmp_path: pathlib.Path) -> None:
+        fake = FakeAtHomeHTTP(3)
+        chapter = Chapter(fake, deepcopy(PAYLOAD)["data"])  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+
+        async with PageStore(tmp_path) as store:
+            await store.put("hash", "1.png", b"1.png")
+            keys = await chapter.download_to_store(store, concurrency=2)
+
+            assert keys == ["hash/0.png", "hash/1.png", "hash/2.png"]
+            assert fake.requested == ["0.png", "2.png"]
+            assert await store.chapter_pages(chapter.id) == keys
+            with await store.open(keys[2]) as page:
+                assert page[:] == b"2.png"
+
+    @pytest.mark.asyncio
+    async def test_validate_images(self, tmp_path: pathlib.Path) -> None:
+        (tmp_path / "other").mkdir()
+        files = {
+            "2.png": png(800, 1200),
+            "1-extra.png": png(800, 1200),
+            "3.png": b"not an image",
+            "4.png": png(800, 20_000),
+            "5.png": png(800, 1200, size=2048),
+            "cover.png": png(800, 1200),
+            "other/2.png": png(800, 1200),
+        }
+        for name, data in files.items():
+            (tmp_path / name).write_bytes(data)
+
+        good = [tmp_path / "2.png", tmp_path / "1-extra.png"]
+        reports = await ChapterUpload.validate_images(good)
+        assert [(report.mime_type, report.width, report.height) for report in reports] == [("image/png", 800, 1200)] * 2
+
+        with pytest.raises(UploadValidationError) as info:
+            await ChapterUpload.validate_images([tmp_path / name for name in files], max_file_size=1024)
+
+        problems = {report.path.relative_to(tmp_path).as_posix(): report.problems for report in info.value.reports}
+        assert set(problems) == {"3.png", "4.png", "5.png", "cover.png", "other/2.png"}
+        assert "is not a PNG, JPEG, GIF or WebP image" in problems["3.png"]
+        assert "over the 10000px limit" in problems["4.png"][0]
+        assert "over the 1024 byte limit" in problems["5.png"][0]
+        assert "cannot be sorted" in problems["cover.png"][0]
+        assert "same file name" in problems["other/2.png"][0]
+
+        # a custom sorting key decides what is sortable
+        await ChapterUpload.validate_images([tmp_path / "cover.png"], sorting_key=lambda path: path.name)
+
+    @pytest.mark.asyncio
+    async def test_upload_retries_failed_images(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = FakeUploadAPI({"2.png": 1})
+        monkeypatch.setattr(HTTPClient, "request", api.request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        images = [tmp_path / f"{number}.png" for number in range(1, 4)]
+        for image in images:
+            image.write_bytes(png(800, 1200))
+
+        async with client.upload_session(
+            "manga", chapter="1", translated_language="en", scanlator_groups=[], accept_tos=True
+        ) as session:
+            result = await session.upload_images(images, retry_delay=0)
+
+            assert api.sent == [["1.png", "2.png", "3.png"], ["2.png"]]
+            assert not result.has_failures
+            assert not result.errored_files
+
+        assert api.page_order == ["page-1.png", "page-2.png", "page-3.png"]
+
+    @pytest.mark.asyncio
+    async def test_upload_batches_by_size(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = FakeUploadAPI({})
+        monkeypatch.setattr(HTTPClient, "request", api.request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        sizes = [400, 400, 900, *[100] * 12]
+        images = [tmp_path / f"{number}.png" for number in range(1, len(sizes) + 1)]
+        for image, size in zip(images, sizes, strict=True):
+            image.write_bytes(png(800, 1200, size=size))
+
+        async with client.upload_session(
+            "manga", chapter="1", translated_language="en", scanlator_groups=[], accept_tos=True
+        ) as session:
+            await session.upload_images(images, request_size=1000)
+
+        assert [len(batch) for batch in api.sent] == [2, 2, 10, 1]
+
+    @pytest.mark.asyncio
+    async def test_upload_transform(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = FakeUploadAPI({})
+        monkeypatch.setattr(HTTPClient, "request", api.request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        images = [tmp_path / f"{number}.png" for number in range(1, 4)]
+        for image in images:
+            image.write_bytes(png(800, 1200))
+
+        async with client.upload_session(
+            "manga", chapter="1", translated_language="en", scanlator_groups=[], accept_tos=True
+        ) as session:
+            with ThreadPoolExecutor() as executor:
+                await session.upload_images(images, transform=ToWebP(), executor=executor)
+
+        assert api.sent == [["1.webp", "2.webp", "3.webp"]]
+        assert api.page_order == ["page-1.webp", "page-2.webp", "page-3.webp"]
+
+    @pytest.mark.asyncio
+    async def test_upload_transform_validation(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = FakeUploadAPI({})
+        monkeypatch.setattr(HTTPClient, "request", api.request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        oversized = 21 * 1024 * 1024
+        large = tmp_path / "1.png"
+        large.write_bytes(png(800, 1200, size=oversized))
+        small = tmp_path / "2.png"
+        small.write_bytes(png(800, 1200))
+
+        async with client.upload_session(
+            "manga", chapter="1", translated_language="en", scanlator_groups=[], accept_tos=True
+        ) as session:
+            with ThreadPoolExecutor() as executor:
+                # the transform's output is checked, not the original file
+                await session.upload_images([large], transform=Resize(64), executor=executor)
+                with pytest.raises(UploadValidationError) as info:
+                    await session.upload_images([small], transform=Resize(oversized), executor=executor)
+
+        assert [report.path.name for report in info.value.reports] == ["2.png"]
+        assert "byte limit" in info.value.reports[0].problems[0]
+        assert api.sent == [["1.png"]]
+
+    @pytest.mark.asyncio
+    async def test_upload_failed_requests(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = FakeUploadAPI({}, failed_requests=2)
+        monkeypatch.setattr(HTTPClient, "request", api.request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        images = [tmp_path / f"{number}.png" for number in range(1, 3)]
+        for image in images:
+            image.write_bytes(png(800, 1200))
+
+        # every batch raises, rather than returning per file errors
+        session = await client.upload_session(
+            "manga", chapter="1", translated_language="en", scanlator_groups=[], accept_tos=True
+        ).__aenter__()
+        result = await session.upload_images(images, retries=1, retry_delay=0)
+        assert result.has_failures
+        assert result.errored_files == {"1.png", "2.png"}
+        assert {error["status"] for error in result.errors} == {503}
+        await session.abandon()
+
+        async def no_sleep(_: float) -> None:
+            return None
+
+        monkeypatch.setattr("hondana.chapter.asyncio.sleep", no_sleep)
+        api.failed_requests = 4
+        with pytest.raises(UploadIncomplete) as info:
+            await client.upload_chapter(
+                "manga", chapter="1", translated_language="en", scanlator_groups=[], accept_tos=True, images=images
+            )
+
+        assert info.value.files == {"1.png", "2.png"}
+        assert api.abandoned
+        assert api.page_order == []
+
+    @pytest.mark.asyncio
+    async def test_upload_resumes_from_state(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = FakeUploadAPI({"3.png": 1})
+        monkeypatch.setattr(HTTPClient, "request", api.request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        state = tmp_path / "state.json"
+        images = [tmp_path / f"{number}.png" for number in range(1, 4)]
+        for image in images:
+            image.write_bytes(png(800, 1200))
+
+        def upload(chapter: str = "1") -> ChapterUpload:
+            return client.upload_session(
+                "manga",
+                chapter=chapter,
+                translated_language="en",
+                scanlator_groups=[],
+                accept_tos=True,
+                state_path=state,
+            )
+
+        # the first process stops before committing, with one image not uploaded
+        first = await upload().__aenter__()
+        result = await first.upload_images(images, retries=0)
+        assert result.errored_files == {"3.png"}
+        assert json.loads(state.read_text())["pages"] == {"1.png": "page-1.png", "2.png": "page-2.png"}
+
+        # the state of chapter 1 is never resumed by another chapter's upload, and is kept for chapter 1
+        with pytest.raises(ValueError, match="another upload"):
+            await upload("2").__aenter__()
+        assert state.exists()
+
+        async with upload() as second:
+            assert second.upload_session_id == "session"
+            await second.upload_images(images)
+
+        assert api.sent == [["1.png", "2.png", "3.png"], ["3.png"]]
+        assert api.page_order == ["page-1.png", "page-2.png", "page-3.png"]
+        assert not state.exists()
+
+    @pytest.mark.asyncio
+    async def test_upload_queue(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = FakeUploadAPI({})
+        monkeypatch.setattr(HTTPClient, "request", api.request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        def spec(number: int, *pages: str) -> ChapterUploadSpec:
+            directory = tmp_path / str(number)
+            directory.mkdir()
+            for page in pages:
+                (directory / page).write_bytes(png(800, 1200) if page != "bad.png" else b"not an image")
+            images = [directory / page for page in pages]
+            return ChapterUploadSpec(
+                "manga", chapter=str(number), images=images, translated_language="en", scanlator_groups=[], accept_tos=True
+            )
+
+        queue = UploadQueue(client, [spec(1, "2.png", "1.png"), spec(2, "1.png")], prepare_ahead=2)
+        queue.add(spec(3, "1.png", "bad.png"))
+        uploaded: list[list[list[str]]] = []
+
+        # stop after the first chapter, while the next chapters are still being prepared
+        runner = queue.run()
+        await anext(runner)
+        await runner.aclose()
+
+        # every preparation has finished, and only the committed chapter left the queue
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        assert len(queue) == 2
+
+        async def run() -> None:
+            async for _ in queue.run():
+                uploaded.append(api.sent.copy())  # noqa: PERF401 # snapshots what was sent as each chapter is yielded
+
+        with pytest.raises(UploadValidationError):
+            await run()
+
+        assert uploaded == [[["1.png", "2.png"], ["1.png"]]]
+        assert api.sessions == 2
+        assert api.session_id is None
+        # only committed chapters leave the queue
+        assert len(queue) == 1
+
+    @pytest.mark.asyncio
+    async def test_upload_queue_incomplete(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        api = FakeUploadAPI({}, failed_requests=4)
+        monkeypatch.setattr(HTTPClient, "request", api.request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        async def no_sleep(_: float) -> None:
+            return None
+
+        monkeypatch.setattr("hondana.chapter.asyncio.sleep", no_sleep)
+        images = [tmp_path / f"{number}.png" for number in range(1, 3)]
+        for image in images:
+            image.write_bytes(png(800, 1200))
+
+        queue = UploadQueue(
+            client,
+            [
+                ChapterUploadSpec(
+                    "manga", chapter="1", images=images, translated_language="en", scanlator_groups=[], accept_tos=True
+                )
+            ],
+        )
+        with pytest.raises(UploadIncomplete):
+            await queue.upload_all()
+
+        assert api.abandoned
+        assert api.page_order == []
+        assert len(queue) == 1
+
+    @pytest.mark.asyncio
+    async def test_chapter_list_deep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        epoch = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+        # three chapters per second, with one second holding more chapters than a page
+        seconds = [index // 3 for index in range(600)] + [200] * 250 + [index // 3 + 201 for index in range(300)]
+        items: list[dict[str, Any]] = []
+        for index, second in enumerate(seconds):
+            item = deepcopy(PAYLOAD["data"])
+            item["id"] = f"{index:08d}-0000-0000-0000-000000000000"
+            item["attributes"]["createdAt"] = (epoch + datetime.timedelta(seconds=second)).isoformat()
+            items.append(item)  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+
+        async def chapter_list(
+            _: HTTPClient, *, limit: int, offset: int, created_at_since: datetime.datetime | None, **__: Any
+        ) -> dict[str, Any]:
+            # the API refuses to page past its offset cap, which is lowered here
+            assert offset + limit <= 300
+            matching = [
+                item
+                for item in items
+                if created_at_since is None
+                or datetime.datetime.fromisoformat(item["attributes"]["createdAt"]) >= created_at_since
+            ]
+            page = deepcopy(matching[offset : offset + limit])
+            return {"result": "ok", "data": page, "limit": limit, "offset": offset, "total": len(matching)}
+
+        monkeypatch.setattr(HTTPClient, "chapter_list", chapter_list)
+
+        feed = await Client().chapter_list(limit=None, deep=True)
+
+        assert [chapter.id for chapter in feed.chapters] == [item["id"] for item in items]
+        assert feed.total == len(items)
+
+        with pytest.raises(TypeError):
+            await Client().chapter_list(limit=10, deep=True)
@@ -24,8 +24,11 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import csv
+import io
 import json
 import pathlib
+from array import array
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 from hondana.author import Author
@@ -257,3 +260,46 @@ class TestCollection:
         assert collection.total == payload["total"]
         assert collection.offset == payload["offset"]
         assert len(collection.items) == len(payload["data"])
+
+    def test_chapter_feed_columns(self) -> None:
+        path = PATH / "chapter_feed.json"
+        payload: GetMultiChapterResponse = json.load(path.open())
+        collection = clone_collection("chapter_feed")
+
+        columns = collection.to_columns()
+        raw_columns = ChapterFeed.columns_from_payloads(payload["data"])
+
+        assert columns["id"] == [item["id"] for item in payload["data"]]
+        assert list(columns["pages"]) == [item["attributes"]["pages"] for item in payload["data"]]
+        assert isinstance(columns["created_at"], array)
+        assert columns["created_at"][0] == collection.chapters[0].created_at.timestamp()
+        assert columns["manga_id"][0] == collection.chapters[0].manga_id
+        assert columns["id"] == raw_columns["id"]
+        assert columns["scanlator_group_ids"] == raw_columns["scanlator_group_ids"]
+
+    def test_manga_collection_columns(self) -> None:
+        path = PATH / "manga.json"
+        payload: MangaSearchResponse = json.load(path.open())
+        collection = clone_collection("manga")
+
+        columns = collection.to_columns()
+        raw_columns = MangaCollection.columns_from_payloads(payload["data"])
+
+        assert columns["id"] == [item["id"] for item in payload["data"]]
+        assert columns["tag_ids"][0] == tuple(tag.id for tag in collection.manga[0].tags)
+        assert columns["author_ids"] == raw_columns["author_ids"]
+        assert columns["cover_id"] == raw_columns["cover_id"]
+
+    def test_write_columns(self) -> None:
+        collection = clone_collection("chapter_feed")
+
+        csv_fp = io.StringIO()
+        assert collection.write_columns(csv_fp) == len(collection.chapters)
+        csv_fp.seek(0)
+        rows = list(csv.DictReader(csv_fp))
+        assert rows[0]["id"] == collection.chapters[0].id
+
+        ndjson_fp = io.StringIO()
+        assert collection.write_columns(ndjson_fp, format="ndjson") == len(collection.chapters)
+        first = json.loads(ndjson_fp.getvalue().splitlines()[0])
+        assert first["pages"] == collection.chapters[0].pages
@@ -28,13 +28,19 @@ import datetime
 import json
 import pathlib
 from copy import deepcopy
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from hondana.cover import Cover
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hondana.client import Client
+from hondana.cover import Cover, CoverCache
+from hondana.http import HTTPClient
 from hondana.utils import RelationshipResolver, to_snake_case
 
 if TYPE_CHECKING:
-    from hondana.http import HTTPClient
     from hondana.types_.cover import GetSingleCoverResponse
     from hondana.types_.user import UserResponse
 
@@ -83,3 +89,104 @@ class TestCover:
 
         assert cover.created_at == datetime.datetime.fromisoformat(PAYLOAD["data"]["attributes"]["createdAt"])
         assert cover.updated_at == datetime.datetime.fromisoformat(PAYLOAD["data"]["attributes"]["updatedAt"])
+
+
+class TestCoverCache:
+    @pytest.mark.asyncio
+    async def test_fetch_and_revalidate(self, tmp_path: pathlib.Path) -> None:
+        hits: list[str | None] = []
+
+        async def image(request: web.Request) -> web.Response:
+            hits.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.Response(body=b"image" * 100_000, content_type="image/jpeg", headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/cover.jpg", image)
+        http = HTTPClient()
+        cache = CoverCache(tmp_path)
+
+        async with TestServer(app) as server:
+            url = str(server.make_url("/cover.jpg"))
+            try:
+                assert await cache.fetch(http, url, "cover.jpg", 256) == b"image" * 100_000
+                assert cache.path_for("cover.jpg", 256) == tmp_path / "co" / "cover.jpg.256.jpg"
+                assert cache.get("cover.jpg", 256) == b"image" * 100_000
+                assert cache.get("cover.jpg") is None
+
+                # served from disk, filenames are immutable
+                assert await cache.fetch(http, url, "cover.jpg", 256) == b"image" * 100_000
+                assert hits == [None]
+
+                cache.max_age = datetime.timedelta(0)
+                assert await cache.fetch(http, url, "cover.jpg", 256) == b"image" * 100_000
+                assert hits == [None, '"v1"']
+            finally:
+                await http.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_lost_and_failed(self, tmp_path: pathlib.Path) -> None:
+        hits: list[str | None] = []
+        cache = CoverCache(tmp_path, max_age=datetime.timedelta(0))
+        path = cache.path_for("cover.jpg")
+
+        async def image(request: web.Request) -> web.StreamResponse:
+            hits.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                # the stored copy disappears between the lookup and the response
+                path.unlink()
+                return web.Response(status=304)
+            return web.Response(body=b"image", content_type="image/jpeg", headers={"ETag": '"v1"'})
+
+        async def broken(request: web.Request) -> web.StreamResponse:
+            response = web.StreamResponse(headers={"Content-Length": "1000"})
+            await response.prepare(request)
+            await response.write(b"image")
+            assert request.transport is not None
+            request.transport.close()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/cover.jpg", image)
+        app.router.add_get("/broken.jpg", broken)
+        http = HTTPClient()
+
+        async with TestServer(app) as server:
+            try:
+                url = str(server.make_url("/cover.jpg"))
+                assert await cache.fetch(http, url, "cover.jpg") == b"image"
+                assert await cache.fetch(http, url, "cover.jpg") == b"image"
+                assert hits == [None, '"v1"', None]
+                assert path.read_bytes() == b"image"
+
+                with pytest.raises(aiohttp.ClientPayloadError):
+                    await cache.fetch(http, str(server.make_url("/broken.jpg")), "broken.jpg")
+                assert list(cache.path_for("broken.jpg").parent.iterdir()) == []
+            finally:
+                await http.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_covers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        requested: list[str] = []
+
+        async def fetch_image(_: HTTPClient, url: str, /, **__: Any) -> tuple[bytes, None]:
+            requested.append(url)
+            return url.encode(), None
+
+        monkeypatch.setattr(HTTPClient, "fetch_image", fetch_image)
+
+        with_parent = clone_cover()
+        payload = deepcopy(PAYLOAD["data"])
+        payload["id"] = "no-parent"
+        payload["relationships"] = []
+        without_parent = Cover(HTTP, payload)
+
+        duplicate = Cover(HTTP, deepcopy(PAYLOAD["data"]))
+        duplicate.id = "duplicate"
+
+        images = await Client().fetch_covers([with_parent, without_parent, duplicate], concurrency=2)
+
+        assert list(images) == [with_parent.id, duplicate.id]
+        # the duplicate shares the same image, which is only fetched once
+        assert requested == [with_parent.url(256)]
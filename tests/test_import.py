@@ -0,0 +1,77 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import hondana
+
+
+def _imported_modules(code: str, /) -> set[str]:
+    proc = subprocess.run(  # noqa: S603 # trusted input
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return {line.rsplit("|", 1)[-1].strip() for line in proc.stderr.splitlines() if line.startswith("import time:")}
+
+
+class TestImport:
+    def test_lazy_exports_match_all(self) -> None:
+        for module, names in hondana._LAZY_EXPORTS.items():  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+            if module == "utils":
+                continue
+            assert set(names) == set(importlib.import_module(f"hondana.{module}").__all__)
+
+    def test_lazy_attributes(self) -> None:
+        for name in hondana.__all__:
+            assert getattr(hondana, name) is not None
+
+        assert hondana.Client.__module__ == "hondana.client"
+        assert hondana.MANGA_TAGS["Comedy"] == "4d32cc48-9f00-4cca-9b5a-a839f0764984"
+        assert "Client" in dir(hondana)
+
+        try:
+            hondana.NotARealName  # pyright: ignore[reportAttributeAccessIssue] # noqa: B018 # this is the point of the test
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("Unknown attribute failed to fail.")
+
+    def test_import_is_lazy(self) -> None:
+        modules = _imported_modules("import hondana")
+
+        assert "hondana" in modules
+        assert "aiohttp" not in modules
+        assert "hondana.client" not in modules
+        assert "hondana.utils" not in modules
+
+    def test_local_caches_are_lazy(self) -> None:
+        code = "import hondana.client, hondana.utils as u; import sys; sys.exit('MANGA_TAGS' in vars(u))"
+        proc = subprocess.run([sys.executable, "-c", code], check=False)  # noqa: S603 # trusted input
+        assert proc.returncode == 0
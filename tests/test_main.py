@@ -0,0 +1,110 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from hondana import _bench
+from hondana.__main__ import Throughput, parse_target
+from hondana.utils import AuthRoute, Route
+
+ID = "a96676e5-8ae2-425e-b549-7f15dd34a6d8"
+
+
+class TestDownloadCommand:
+    @pytest.mark.parametrize(
+        "target, output",
+        [
+            (f"https://mangadex.org/title/{ID}/komi-san-wa-komyushou-desu", ("manga", ID)),
+            (f"mangadex.org/chapter/{ID}", ("chapter", ID)),
+            (ID, (None, ID)),
+            (f" {ID.upper()} ", (None, ID)),
+        ],
+    )
+    def test_parse_target(self, target: str, output: tuple[str | None, str]) -> None:
+        assert parse_target(target) == output
+
+    @pytest.mark.parametrize("target", ["komi-san", f"https://mangadex.org/author/{ID}"])
+    def test_parse_bad_target(self, target: str) -> None:
+        with pytest.raises(ValueError, match="is not a MangaDex ID"):
+            parse_target(target)
+
+    def test_throughput(self) -> None:
+        progress = Throughput()
+        progress.started -= 2
+        progress._last_render = float("inf")  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        progress(pathlib.Path("1.png"), 1_000_000)
+        progress(pathlib.Path("2.png"), 3_000_000)
+
+        assert progress.pages == 2
+        assert progress.bytes == 4_000_000
+        assert progress.format().startswith("2 pages, 4.00 MB in 2.0s (1.00 pages/s, 2.00 MB/s)")
+
+
+class TestBenchCommand:
+    def test_lazy_import(self) -> None:
+        code = "import sys, hondana.__main__; print('hondana._bench' in sys.modules, 'aiohttp.web' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True).stdout  # noqa: S603 # fixed input
+
+        assert output.split() == ["False", "False"]
+
+    def test_list(self) -> None:
+        command = [sys.executable, "-m", "hondana", "bench", "--list"]
+        output = subprocess.run(command, capture_output=True, check=True, text=True).stdout  # noqa: S603 # fixed input
+
+        assert output.split() == list(_bench.SCENARIOS)
+
+    def test_percentiles(self) -> None:
+        result = _bench.ScenarioResult("test")
+        result.latencies = [i / 1000 for i in range(1, 101)]
+        result.items = 100
+
+        assert result.percentile(50) == pytest.approx(0.0505)
+        assert result.percentile(99) == pytest.approx(0.09901)
+        assert result.to_dict()["operations"] == 100
+
+    @pytest.mark.asyncio
+    async def test_run_all_scenarios(self) -> None:
+        bases = (Route.API_BASE_URL, AuthRoute.API_BASE_URL)
+        results = await _bench.run(list(_bench.SCENARIOS), iterations=2, pages=3, page_size=1024)
+
+        assert [result.name for result in results] == list(_bench.SCENARIOS)
+        assert all(len(result.latencies) == 2 and result.items for result in results)
+        assert bases == (Route.API_BASE_URL, AuthRoute.API_BASE_URL)
+
+        by_name = {result.name: result for result in results}
+        assert by_name["chapter_download"].items == 6
+        assert by_name["chapter_download"].bytes == 6 * 1024
+        assert by_name["decode_inline"].items == by_name["decode_threaded"].items == by_name["decode_process"].items == 2000
+        assert by_name["decode_inline"].max_stall > 0
+
+        data = json.loads(_bench.results_to_json(results, iterations=2))
+        assert [scenario["name"] for scenario in data["scenarios"]] == list(_bench.SCENARIOS)
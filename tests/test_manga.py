@@ -28,14 +28,21 @@ import datetime
 import json
 import pathlib
 from copy import deepcopy
-from typing import TYPE_CHECKING, Literal, overload
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Literal, overload
 
-from hondana.enums import MangaRelationType
+import pytest
+
+from hondana.client import Client
+from hondana.collections import MangaCollection
+from hondana.enums import MangaRelationType, Order, ReadingStatus
+from hondana.http import HTTPClient
 from hondana.manga import Manga, MangaRating, MangaRelation, MangaStatistics
-from hondana.utils import RelationshipResolver, to_snake_case
+from hondana.query import MangaListOrderQuery
+from hondana.tags import TagRegistry
+from hondana.utils import InternTable, RelationshipResolver, to_snake_case
 
 if TYPE_CHECKING:
-    from hondana.http import HTTPClient
     from hondana.types_.artist import ArtistResponse
     from hondana.types_.author import AuthorResponse
     from hondana.types_.cover import CoverResponse
@@ -242,6 +249,35 @@ class TestMangaStatistics:
         key = next(iter(STATISTICS_PAYLOAD["statistics"]))
         assert manga.bayesian == STATISTICS_PAYLOAD["statistics"][key]["rating"]["bayesian"]
 
+    @pytest.mark.asyncio
+    async def test_bulk(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        stats = next(iter(STATISTICS_PAYLOAD["statistics"].values()))
+        requested: list[list[str]] = []
+
+        async def request(_: HTTPClient, route: Any, *, params: dict[str, Any], **__: Any) -> dict[str, Any]:
+            assert route.url.path == "/statistics/manga"
+            requested.append(params["manga"])
+            return {"result": "ok", "statistics": {manga_id: deepcopy(stats) for manga_id in params["manga"]}}
+
+        monkeypatch.setattr(HTTPClient, "request", request)
+        ids = [f"{index:08d}-0000-0000-0000-000000000000" for index in range(250)]
+
+        result = await Client().get_manga_statistics_bulk([*ids, ids[0]])
+
+        assert [len(chunk) for chunk in requested] == [100, 100, 50]
+        assert list(result) == ids
+        assert result[ids[-1]].parent_id == ids[-1]
+
+        http = HTTPClient()
+        manga = [Manga(http, deepcopy(PAYLOAD)["data"]) for _ in range(2)]
+        collection = MangaCollection(http, {"result": "ok", "data": [], "limit": 2, "offset": 0, "total": 2}, manga)  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+
+        fetched = await collection.fetch_statistics()
+
+        assert list(fetched) == [PAYLOAD["data"]["id"]]
+        assert manga[0].stats is not None
+        assert manga[0].stats.follows == stats["follows"]
+
 
 class TestMangaRating:
     def test_id(self) -> None:
@@ -254,3 +290,117 @@ class TestMangaRating:
 
         key = next(iter(RATING_PAYLOAD["ratings"]))
         assert manga.rating == RATING_PAYLOAD["ratings"][key]["rating"]
+
+    def test_to_payload(self) -> None:
+        manga = clone_manga("manga")
+        payload = manga.to_payload()
+
+        assert payload["id"] == PAYLOAD["data"]["id"]
+        assert payload["attributes"] == PAYLOAD["data"]["attributes"]
+        assert Manga(HTTP, payload).to_payload() == manga.to_payload()
+
+    def test_compact_models(self) -> None:
+        http: HTTPClient = SimpleNamespace(compact_models=True)  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+        manga = Manga(http, deepcopy(PAYLOAD)["data"])
+        full = clone_manga("manga")
+
+        assert manga._data is None  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert manga._attributes is None  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert manga.authors is None
+        assert manga.cover is None
+        assert manga._tags == []  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert all(tag is TagRegistry.default().get(tag.id) for tag in manga.tags)
+        assert manga.to_payload()["attributes"] == full.to_payload()["attributes"]
+        assert [item["id"] for item in manga._author_relationships] == [item["id"] for item in full._author_relationships]  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+    def test_intern_strings(self) -> None:
+        table = InternTable()
+        http: HTTPClient = SimpleNamespace(intern_table=table)  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+        first = Manga(http, deepcopy(PAYLOAD)["data"])
+        second = Manga(http, deepcopy(PAYLOAD)["data"])
+
+        assert first.original_language is second.original_language
+        # values unique to one entity are not held by the table
+        assert first.id not in table._strings  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert first._cover_relationship is not None  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert first._cover_relationship["id"] not in table._strings  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert first._author_relationships[0]["id"] is second._author_relationships[0]["id"]  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert first._tags[0] is second._tags[0]  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert first.tags == second.tags
+
+    @pytest.mark.asyncio
+    async def test_library_state(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        rating = next(iter(RATING_PAYLOAD["ratings"].values()))
+        ids = [f"{index:08d}-0000-0000-0000-000000000000" for index in range(150)]
+        requested: list[str] = []
+
+        async def request(_: HTTPClient, route: Any, *, params: dict[str, Any] | None = None, **__: Any) -> dict[str, Any]:
+            requested.append(route.url.path)
+            if route.url.path == "/manga/status":
+                return {"result": "ok", "statuses": {ids[0]: "reading", "not-requested": "dropped"}}
+            assert params is not None
+            if route.url.path == "/manga/read":
+                # MangaDex sends an empty mapping as an empty list
+                return {"result": "ok", "data": {ids[1]: ["a", "b"]} if ids[1] in params["ids"] else []}
+            return {"result": "ok", "ratings": {id_: deepcopy(rating) for id_ in params["manga"] if id_ == ids[120]}}
+
+        monkeypatch.setattr(HTTPClient, "request", request)
+        client = Client()
+        client._http._authenticated = True  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        state = await client.get_library_state(ids)
+
+        assert sorted(requested) == ["/manga/read", "/manga/read", "/manga/status", "/rating", "/rating"]
+        assert list(state) == ids
+        assert state[ids[0]].status is ReadingStatus.reading
+        assert state[ids[1]].status is None
+        assert state[ids[1]].read_chapters == {"a", "b"}
+        rated = state[ids[120]].rating
+        assert rated is not None
+        assert rated.rating == rating["rating"]
+        assert state[ids[2]].rating is None
+        assert not state[ids[2]].read_chapters
+
+    @pytest.mark.asyncio
+    async def test_manga_list_chunked_ids(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ids = [f"{index:08d}-0000-0000-0000-000000000000" for index in range(250)]
+        requested: list[int] = []
+
+        async def request(_: HTTPClient, route: Any, *, params: dict[str, Any], **__: Any) -> dict[str, Any]:
+            assert route.url.path == "/manga"
+            requested.append(len(params["ids"]))
+            data: list[dict[str, Any]] = []
+            # results come back in the API's order, and unknown IDs are missing
+            for id_ in reversed(params["ids"]):
+                if id_ == ids[7]:
+                    continue
+                item: dict[str, Any] = deepcopy(PAYLOAD["data"])  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+                item["id"] = id_
+                item["attributes"]["year"] = int(id_[:8]) % 10
+                data.append(item)
+            return {"result": "ok", "response": "collection", "data": data, "limit": 100, "offset": 0, "total": len(data)}
+
+        monkeypatch.setattr(HTTPClient, "request", request)
+        found = [id_ for id_ in ids if id_ != ids[7]]
+
+        collection = await Client().manga_list(ids=ids, limit=None)
+        assert sorted(requested) == [50, 100, 100]
+        assert [item.id for item in collection.manga] == found
+        assert collection.total == 249
+
+        # limit, offset and order apply to the merged results as they would to one request
+        collection = await Client().manga_list(ids=ids, limit=10, offset=5)
+        assert [item.id for item in collection.manga] == found[5:15]
+        assert collection.total == 249
+
+        order = MangaListOrderQuery(year=Order.descending)
+        collection = await Client().manga_list(ids=ids, limit=3, order=order)
+        assert [item.id for item in collection.manga] == [ids[9], ids[19], ids[29]]
+
+        # relevance can only be ordered by the API
+        with pytest.raises(ValueError, match="relevance"):
+            await Client().manga_list(ids=ids, order=MangaListOrderQuery(relevance=Order.descending))
+
+        requested.clear()
+        await Client().manga_list(ids=ids[:5])
+        assert requested == [5]
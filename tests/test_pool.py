@@ -0,0 +1,102 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import aiohttp
+import pytest
+
+from hondana.http import HTTPClient
+from hondana.pool import ClientCredentials, ClientPool
+
+if TYPE_CHECKING:
+    from hondana.client import Client
+
+
+def credentials(*usernames: str) -> list[ClientCredentials]:
+    return [ClientCredentials(username, "password", "client_id", "client_secret") for username in usernames]
+
+
+def http_of(client: Client) -> HTTPClient:
+    return client._http  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+
+class TestClientPool:
+    def test_least_limited(self) -> None:
+        pool = ClientPool(credentials("a", "b", "c"))
+
+        # nothing is known yet, so the accounts are picked in turn
+        assert [http_of(pool.least_limited()).username for _ in range(4)] == ["a", "b", "c", "a"]
+
+        http_of(pool["a"]).ratelimits["/manga/read"] = (10, 100)
+        http_of(pool["b"]).ratelimits["/manga/read"] = (80, 100)
+        http_of(pool["c"]).ratelimits["/rating"] = (1, 100)
+
+        assert http_of(pool.least_limited("/manga/read")).username == "c"
+        assert http_of(pool.least_limited()).username == "b"
+        assert pool.headroom("a") == pytest.approx(0.1)
+        assert pool.headroom("c", "/manga/read") == 1.0
+
+    @pytest.mark.asyncio
+    async def test_run(self) -> None:
+        pool = ClientPool(credentials("a", "b"))
+        http_of(pool["a"]).ratelimits["/manga/read"] = (0, 100)
+
+        async def username(client: Client) -> str | None:
+            return http_of(client).username
+
+        assert await pool.run(username, bucket="/manga/read") == "b"
+        assert await pool.run(username, username="a") == "a"
+        assert http_of(pool.public).username is None
+
+    @pytest.mark.asyncio
+    async def test_shared_session(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        logged_in: list[str | None] = []
+
+        async def get_token(self: HTTPClient) -> None:
+            logged_in.append(self.username)
+
+        monkeypatch.setattr(HTTPClient, "get_token", get_token)
+
+        async with ClientPool(credentials("a", "b")) as pool:
+            sessions = {id(http_of(pool[name])._session) for name in pool}  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+            sessions.add(id(http_of(pool.public)._session))  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+            assert len(sessions) == 1
+            assert set(logged_in) == {"a", "b"}
+
+            # the public client fetches images (e.g. covers) over its own session
+            image_session = aiohttp.ClientSession()
+            http_of(pool.public)._image_session = image_session  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        assert image_session.closed
+        assert http_of(pool.public)._image_session is None  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+    def test_bad_credentials(self) -> None:
+        with pytest.raises(ValueError, match="at least one"):
+            ClientPool([])
+
+        with pytest.raises(ValueError, match="more than once"):
+            ClientPool(credentials("a", "a"))
@@ -28,13 +28,15 @@ import datetime
 import json
 import pathlib
 from copy import deepcopy
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import pytest
+
+from hondana.http import HTTPClient
 from hondana.scanlator_group import ScanlatorGroup
 from hondana.utils import iso_to_delta, to_snake_case
 
 if TYPE_CHECKING:
-    from hondana.http import HTTPClient
     from hondana.types_.scanlator_group import GetSingleScanlationGroupResponse
 
 PATH: pathlib.Path = pathlib.Path(__file__).parent / "payloads" / "scanlator_group.json"
@@ -80,3 +82,20 @@ class TestScanlatorGroup:
 
         if group.publish_delay or PAYLOAD["data"]["attributes"]["publishDelay"]:
             assert group.publish_delay == iso_to_delta(PAYLOAD["data"]["attributes"]["publishDelay"])
+
+    @pytest.mark.asyncio
+    async def test_statistics_route(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        paths: list[str] = []
+
+        async def request(_: HTTPClient, route: Any, **__: Any) -> dict[str, Any]:
+            paths.append(route.url.path)
+            return {"result": "ok", "statistics": {PAYLOAD["data"]["id"]: {"comments": None}}}
+
+        monkeypatch.setattr(HTTPClient, "request", request)
+        http = HTTPClient()
+
+        await http.get_scanlation_group_statistics(PAYLOAD["data"]["id"], None)
+        stats = await http.get_statistics_bulk("group", [PAYLOAD["data"]["id"]])
+
+        assert paths == [f"/statistics/group/{PAYLOAD['data']['id']}", "/statistics/group"]
+        assert list(stats) == [PAYLOAD["data"]["id"]]
@@ -0,0 +1,382 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import hashlib
+import json
+import pathlib
+import sqlite3
+import uuid
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from hondana import client as client_module
+from hondana.client import Client
+from hondana.http import HTTPClient
+from hondana.query import MangaIncludes
+from hondana.store import EntityStore, FeedWatermark, JSONSyncStorage, PageStore, SQLiteSyncStorage
+from hondana.utils import Route
+
+if TYPE_CHECKING:
+    from hondana.store import SyncStorage
+    from hondana.types_.chapter import GetSingleChapterResponse
+    from hondana.types_.manga import GetMangaResponse
+
+PATH: pathlib.Path = pathlib.Path(__file__).parent / "payloads" / "manga.json"
+PAYLOAD: GetMangaResponse = json.load(PATH.open(encoding="utf-8"))
+CHAPTER_PATH: pathlib.Path = pathlib.Path(__file__).parent / "payloads" / "chapter.json"
+CHAPTER_PAYLOAD: GetSingleChapterResponse = json.load(CHAPTER_PATH.open(encoding="utf-8"))
+EPOCH = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+
+def versioned(version: int, title: str) -> dict[str, Any]:
+    payload: dict[str, Any] = deepcopy(PAYLOAD["data"])  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+    payload["attributes"]["version"] = version
+    payload["attributes"]["title"] = {"en": title}
+    return payload
+
+
+class TestEntityStore:
+    @pytest.mark.asyncio
+    async def test_upsert_and_get(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "cache" / "hondana.db"
+        async with EntityStore(path) as store:
+            assert await store.upsert([versioned(1, "first"), {"id": "not-an-entity"}]) == 1
+
+        # a fresh store on the same file sees the persisted payload
+        async with EntityStore(path) as store:
+            payload = await store.get("manga", PAYLOAD["data"]["id"])
+            assert payload is not None
+            assert payload["attributes"]["title"] == {"en": "first"}
+            assert await store.get("chapter", PAYLOAD["data"]["id"]) is None
+
+    @pytest.mark.asyncio
+    async def test_older_versions_are_ignored(self, tmp_path: pathlib.Path) -> None:
+        async with EntityStore(tmp_path / "hondana.db") as store:
+            await store.upsert([versioned(3, "newer")])
+            assert await store.upsert([versioned(2, "older")]) == 0
+
+            payload = await store.get("manga", PAYLOAD["data"]["id"])
+            assert payload is not None
+            assert payload["attributes"]["title"] == {"en": "newer"}
+
+            await store.upsert([versioned(4, "newest")])
+            payload = await store.get("manga", PAYLOAD["data"]["id"])
+            assert payload is not None
+            assert payload["attributes"]["title"] == {"en": "newest"}
+
+    @pytest.mark.asyncio
+    async def test_max_age(self, tmp_path: pathlib.Path) -> None:
+        async with EntityStore(tmp_path / "hondana.db", max_age=0.0) as store:
+            await store.upsert_response({"result": "ok", "data": [versioned(1, "first")]})
+
+            assert await store.get("manga", PAYLOAD["data"]["id"]) is None
+            assert await store.get("manga", PAYLOAD["data"]["id"], max_age=None) is not None
+
+    @pytest.mark.asyncio
+    async def test_client_served_from_store(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def no_network(*_: Any, **__: Any) -> Any:
+            msg = "the store should have been used"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(HTTPClient, "get_manga", no_network)
+
+        async with EntityStore(tmp_path / "hondana.db") as store:
+            await store.upsert_response(PAYLOAD)  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+            client = Client(store=store)
+
+            manga = await client.get_manga(PAYLOAD["data"]["id"])
+            assert manga.id == PAYLOAD["data"]["id"]
+            assert client.store is store
+
+            with pytest.raises(AssertionError):
+                await client.get_manga(PAYLOAD["data"]["id"], includes=MangaIncludes())
+
+    @pytest.mark.asyncio
+    async def test_requests_are_stored(
+        self,
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        async def request(_: HTTPClient, route: Route, **__: Any) -> Any:
+            return {"result": "ok", "data": versioned(2 if route.verb == "GET" else 3, route.verb)}
+
+        monkeypatch.setattr(HTTPClient, "_request", request)
+
+        async with EntityStore(tmp_path / "hondana.db") as store:
+            http = HTTPClient(store=store)
+            await http.request(Route("GET", "/manga/{manga_id}", manga_id="a"))
+            # writes return entities too, but only reads are stored
+            await http.request(Route("PUT", "/manga/{manga_id}", manga_id="a"))
+
+            payload = await store.get("manga", PAYLOAD["data"]["id"])
+            assert payload is not None
+            assert payload["attributes"]["title"] == {"en": "GET"}
+
+            async def locked(_: EntityStore, __: Any) -> int:
+                raise sqlite3.OperationalError("database is locked")
+
+            monkeypatch.setattr(EntityStore, "upsert_response", locked)
+            # the request succeeded, so a store failure is only logged
+            assert await http.request(Route("GET", "/manga/{manga_id}", manga_id="a"))
+            assert "Failed to store the response of GET /manga/{manga_id}." in caplog.text
+
+
+def chapter_at(index: int, seconds: int) -> dict[str, Any]:
+    payload: dict[str, Any] = deepcopy(CHAPTER_PAYLOAD["data"])  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+    payload["id"] = str(uuid.UUID(int=index))
+    payload["attributes"]["updatedAt"] = (EPOCH + datetime.timedelta(seconds=seconds)).isoformat()
+    return payload
+
+
+class TestPageStore:
+    @pytest.mark.asyncio
+    async def test_dedupe_and_remove(self, tmp_path: pathlib.Path) -> None:
+        async with PageStore(tmp_path) as store:
+            first = await store.put("hash-a", "1-abc.png", b"page one")
+            # a re-upload of the same image under another chapter
+            second = await store.put("hash-b", "1-abc.png", b"page one")
+            other = await store.put("hash-b", "2-def.png", b"page two")
+
+            assert first == "hash-a/1-abc.png"
+            assert len(list((tmp_path / "blobs").rglob("*"))) == 4  # two prefix directories, two blobs
+            assert await store.contains([first, "hash-a/missing.png"]) == {first}
+
+            await store.set_chapter("chapter-a", [first])
+            await store.set_chapter("chapter-b", [second, other])
+            assert await store.chapter_pages("chapter-b") == [second, other]
+            assert await store.chapter_pages("chapter-c") == []
+
+            with await store.open(other) as page:
+                assert page[:] == b"page two"
+
+            with pytest.raises(KeyError):
+                await store.open("hash-a/missing.png")
+
+            assert await store.remove_chapter("chapter-b") == 2
+            assert await store.contains([first, second, other]) == {first}
+            assert [path.name for path in (tmp_path / "blobs").rglob("*") if path.is_file()] == [
+                hashlib.sha256(b"page one").hexdigest(),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_set_chapter_releases_replaced_pages(self, tmp_path: pathlib.Path) -> None:
+        async with PageStore(tmp_path) as store:
+            old = await store.put("hash-a", "1-abc.png", b"old page")
+            shared = await store.put("hash-a", "2-def.png", b"shared page")
+            await store.set_chapter("chapter", [old, shared])
+            await store.set_chapter("other", [shared])
+
+            # the chapter was re-uploaded, so it has a new hash
+            new = await store.put("hash-b", "1-ghi.png", b"new page")
+            await store.set_chapter("chapter", [new])
+
+            assert await store.contains([old, shared, new]) == {shared, new}
+            assert sorted(path.name for path in (tmp_path / "blobs").rglob("*") if path.is_file()) == sorted(
+                hashlib.sha256(data).hexdigest() for data in (b"shared page", b"new page")
+            )
+
+
+class FakeFeed:
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self.items: list[dict[str, Any]] = items
+        self.requests: int = 0
+
+    async def __call__(
+        self,
+        _: str | None,
+        /,
+        *,
+        limit: int,
+        offset: int,
+        updated_at_since: datetime.datetime | None,
+        **__: Any,
+    ) -> dict[str, Any]:
+        self.requests += 1
+        items = sorted(
+            (
+                item
+                for item in self.items
+                if updated_at_since is None
+                or datetime.datetime.fromisoformat(item["attributes"]["updatedAt"]) >= updated_at_since
+            ),
+            key=lambda item: item["attributes"]["updatedAt"],
+        )
+        # models consume their payloads, so each response gets its own copy like a real one would
+        return {
+            "result": "ok",
+            "data": deepcopy(items[offset : offset + limit]),
+            "limit": limit,
+            "offset": offset,
+            "total": len(items),
+        }
+
+
+def storage_for(kind: str, tmp_path: pathlib.Path) -> SyncStorage:
+    if kind == "json":
+        return JSONSyncStorage(tmp_path / "sync.json")
+    return SQLiteSyncStorage(tmp_path / "sync.db")
+
+
+class TestSyncFeed:
+    @pytest.mark.parametrize("kind", ["json", "sqlite"])
+    @pytest.mark.asyncio
+    async def test_storage_roundtrip(self, kind: str, tmp_path: pathlib.Path) -> None:
+        storage = storage_for(kind, tmp_path)
+        assert await storage.load("feed") is None
+
+        watermark = FeedWatermark(EPOCH, {"a", "b"})
+        await storage.save("feed", watermark)
+        await storage.save("other", FeedWatermark())
+
+        assert await storage.load("feed") == watermark
+        assert await storage.load("other") == FeedWatermark()
+
+        if isinstance(storage, SQLiteSyncStorage):
+            await storage.close()
+
+    @pytest.mark.parametrize("kind", ["json", "sqlite"])
+    @pytest.mark.asyncio
+    async def test_only_new_chapters(self, kind: str, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        feed = FakeFeed([chapter_at(index, index // 2) for index in range(6)])
+        monkeypatch.setattr(HTTPClient, "manga_feed", feed)
+        storage = storage_for(kind, tmp_path)
+        client = Client()
+
+        first = await client.sync_feed("manga", storage=storage, manga_id="manga")
+        assert [chapter.id for chapter in first] == [str(uuid.UUID(int=index)) for index in range(6)]
+        assert await client.sync_feed("manga", storage=storage, manga_id="manga") == []
+
+        # one chapter on the boundary second, and one older chapter that was edited
+        feed.items.append(chapter_at(6, 2))
+        feed.items[0] = chapter_at(0, 10)
+
+        updated = await client.sync_feed("manga", storage=storage, manga_id="manga")
+        assert [chapter.id for chapter in updated] == [str(uuid.UUID(int=6)), str(uuid.UUID(int=0))]
+
+        watermark = await storage.load("manga")
+        assert watermark is not None
+        assert watermark.updated_at == EPOCH + datetime.timedelta(seconds=10)
+        assert watermark.boundary_ids == {str(uuid.UUID(int=0))}
+
+        if isinstance(storage, SQLiteSyncStorage):
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_windows_past_max_depth(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        feed = FakeFeed([chapter_at(index, index) for index in range(1_200)])
+        monkeypatch.setattr(HTTPClient, "manga_feed", feed)
+        monkeypatch.setattr(client_module, "MAX_DEPTH", 1_000)
+
+        chapters = await Client().sync_feed("manga", storage=JSONSyncStorage(tmp_path / "sync.json"), manga_id="manga")
+
+        assert len(chapters) == 1_200
+        assert feed.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_bad_arguments(self, tmp_path: pathlib.Path) -> None:
+        storage = JSONSyncStorage(tmp_path / "sync.json")
+        with pytest.raises(TypeError):
+            await Client().sync_feed("feed", storage=storage, manga_id="a", custom_list_id="b")
+
+
+class TestWatchFeed:
+    @pytest.mark.asyncio
+    async def test_adaptive_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        feed = FakeFeed([chapter_at(0, 0), chapter_at(1, 1)])
+        monkeypatch.setattr(HTTPClient, "manga_feed", feed)
+        client = Client()
+        delays: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            delays.append(delay)
+            if len(delays) == 2:
+                feed.items.append(chapter_at(2, 5))
+                # pretend the feed's ratelimit is nearly used up
+                client._http.ratelimits["/manga/{manga_id}/feed"] = (5, 100)  # pyright: ignore[reportPrivateUsage] # this is just for test purposes.
+            elif len(delays) == 3:
+                # an edit to an already yielded chapter is not yielded again
+                feed.items[0] = chapter_at(0, 20)
+                feed.items.append(chapter_at(3, 21))
+
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+
+        seen: list[str] = []
+        watcher = client.watch_feed(
+            manga_id="manga",
+            since=EPOCH - datetime.timedelta(seconds=1),
+            min_interval=1.0,
+            max_interval=8.0,
+        )
+        async for chapter in watcher:
+            seen.append(chapter.id)
+            if len(seen) == 4:
+                break
+        await watcher.aclose()
+
+        assert seen == [str(uuid.UUID(int=index)) for index in range(4)]
+        # new chapters, then idle backoff, then new chapters with a stretched delay for the low ratelimit
+        assert delays == [1.0, 2.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_memory_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        feed = FakeFeed([chapter_at(0, 0)])
+        monkeypatch.setattr(HTTPClient, "manga_feed", feed)
+        monkeypatch.setattr(client_module, "WATCH_MEMORY", 1)
+        polls = 0
+
+        async def sleep(_: float) -> None:
+            nonlocal polls
+            polls += 1
+            if polls == 1:
+                feed.items.append(chapter_at(1, 1))
+            elif polls == 2:
+                # chapter 0 has been forgotten, so its edit is yielded
+                feed.items[0] = chapter_at(0, 2)
+
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+
+        seen: list[str] = []
+        watcher = Client().watch_feed(manga_id="manga", since=EPOCH - datetime.timedelta(seconds=1))
+        async for chapter in watcher:
+            seen.append(chapter.id)
+            if len(seen) == 3:
+                break
+        await watcher.aclose()
+
+        assert seen == [str(uuid.UUID(int=index)) for index in (0, 1, 0)]
+
+    @pytest.mark.asyncio
+    async def test_bad_arguments(self) -> None:
+        with pytest.raises(TypeError):
+            Client().watch_feed(manga_id="a", custom_list_id="b")
+
+        with pytest.raises(ValueError, match="min_interval"):
+            await anext(Client().watch_chapters(min_interval=10.0, max_interval=1.0))
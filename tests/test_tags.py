@@ -31,7 +31,7 @@ from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
 from hondana.manga import Manga
-from hondana.tags import QueryTags, Tag
+from hondana.tags import QueryTags, Tag, TagRegistry
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -133,3 +133,88 @@ class TestQueryTags:
             pass
         else:
             raise AssertionError("Tags failed to fail.")
+
+    def test_query_tags_lookup(self) -> None:
+        tags = QueryTags("comedy", "SCI FI", "bl", "4d32cc48-9f00-4cca-9b5a-a839f0764984", mode="AND")
+        assert tags.tags == [
+            "4d32cc48-9f00-4cca-9b5a-a839f0764984",
+            "256c8bd9-4904-4360-bf4f-508a76d67183",
+            "5920b825-4181-4a17-beeb-9918b0ff7a30",
+            "4d32cc48-9f00-4cca-9b5a-a839f0764984",
+        ]
+
+
+class TestTagRegistry:
+    def test_from_tags(self) -> None:
+        tags = clone_tags()
+        registry = TagRegistry.from_tags(tags)
+
+        assert len(registry) == len(tags)
+        for tag in tags:
+            assert registry.get(tag.id) is tag
+            assert registry.get(tag.name.upper()) is tag
+            assert registry.name_of(tag.id) == tag.name
+            assert tag in registry.group(tag.group)
+
+        assert registry.resolve("not a tag") is None
+        assert "not a tag" not in registry
+
+    def test_aliases(self) -> None:
+        registry = TagRegistry(names={"Comedy": "4d32cc48-9f00-4cca-9b5a-a839f0764984"})
+        registry.add_alias("funny", "comedy")
+
+        assert registry.resolve("Funny") == "4d32cc48-9f00-4cca-9b5a-a839f0764984"
+        assert registry.get("funny") is None  # no full tag data
+
+        try:
+            registry.add_alias("scary", "Horror")
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("Alias for an unknown tag failed to fail.")
+
+    def test_replaced_versions(self) -> None:
+        old = deepcopy(PAYLOAD["data"]["attributes"]["tags"][0])
+        old["id"] = "scifi"
+        old["attributes"]["name"] = {"en": "Sci-Fi", "ja": "SF"}  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+        old["attributes"]["group"] = "genre"
+        old["attributes"]["version"] = 1
+        new = deepcopy(old)
+        new["attributes"]["name"] = {"en": "Science Fiction"}  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+        new["attributes"]["group"] = "theme"
+        new["attributes"]["version"] = 2
+
+        registry = TagRegistry(tags=[Tag(old)])
+        registry.add_alias("space", "sci-fi")
+        tag = registry.add(Tag(new))
+
+        assert registry.resolve("Science Fiction") == "scifi"
+        assert registry.resolve("Sci-Fi") is None
+        assert registry.resolve("SF") is None
+        assert registry.resolve("space") == "scifi"
+        assert registry.group("genre") == []
+        assert registry.group("theme") == [tag]
+
+    def test_non_latin_names(self) -> None:
+        horror = deepcopy(PAYLOAD["data"]["attributes"]["tags"][0])
+        horror["id"] = "horror"
+        horror["attributes"]["name"] = {"en": "Horror", "ja": "ホラー"}  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+        comedy = deepcopy(horror)
+        comedy["id"] = "comedy"
+        comedy["attributes"]["name"] = {"en": "Comedy", "ja": "コメディ", "ko": "!!!"}  # pyright: ignore[reportArgumentType] # this is just for test purposes.
+        registry = TagRegistry(tags=[Tag(horror), Tag(comedy)])
+
+        assert registry.resolve("ホラー") == "horror"
+        assert registry.resolve("コメディ ") == "comedy"
+        assert registry.resolve("Sci-Fi") is None
+        # names with nothing left once normalised are never registered or matched
+        for name in ("", "!!!", "ロマンス"):
+            assert registry.resolve(name) is None
+
+    def test_shared_manga_tags(self) -> None:
+        first = clone_tags()
+        second = clone_tags()
+
+        for a, b in zip(first, second, strict=True):
+            assert a is b
+            assert TagRegistry.default().get(a.id) is a
@@ -0,0 +1,77 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import io
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hondana.transforms import ImageTransform, PillowTransform, transform_images
+from hondana.utils import get_image_dimensions, upload_file_sort
+
+
+class Truncate(ImageTransform):
+    # defined at module level, so the default process pool can pickle it
+    def __call__(self, name: str, data: bytes, /) -> tuple[str, bytes]:
+        return str(pathlib.PurePath(name).with_suffix(".webp")), data[: len(data) // 2]
+
+
+class Rename(ImageTransform):
+    def __call__(self, name: str, data: bytes, /) -> tuple[str, bytes]:  # noqa: ARG002 # the name is not needed
+        return "1.png", data
+
+
+class TestTransforms:
+    @pytest.mark.asyncio
+    async def test_transform_images(self, tmp_path: pathlib.Path) -> None:
+        images = [tmp_path / "1.png", tmp_path / "2-extra.png", tmp_path / "3.jpg"]
+        for image in images[:2]:
+            image.write_bytes(bytes(100))
+
+        paths, contents = await transform_images(images, Truncate(), contents={images[2]: bytes(40)})
+
+        assert [path.name for path in paths] == ["1.webp", "2-extra.webp", "3.webp"]
+        assert sorted(paths, key=upload_file_sort) == paths
+        assert [len(contents[path]) for path in paths] == [50, 50, 20]
+        assert all(path.parent == tmp_path for path in paths)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_names(self, tmp_path: pathlib.Path) -> None:
+        images = [tmp_path / "1.png", tmp_path / "2.png"]
+        with ThreadPoolExecutor() as executor, pytest.raises(ValueError, match="more than one image"):
+            await transform_images(images, Rename(), contents=dict.fromkeys(images, b""), executor=executor)
+
+    def test_pillow_transform(self) -> None:
+        image_module = pytest.importorskip("PIL.Image")
+        buffer = io.BytesIO()
+        image_module.new("RGBA", (64, 32), (255, 0, 0, 255)).save(buffer, "PNG")
+
+        name, data = PillowTransform("webp", keep_smaller=False)("1-extra.png", buffer.getvalue())
+
+        assert name == "1-extra.webp"
+        assert get_image_dimensions(data) == (64, 32)
+        assert data[8:12] == b"WEBP"
@@ -27,20 +27,33 @@ from __future__ import annotations
 import datetime
 import pathlib
 import random
+import struct
 import zoneinfo
-from typing import TYPE_CHECKING, TypeVar
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import pytest
 from multidict import MultiDict
 
+from hondana.http import HTTPClient
 from hondana.utils import (
     MISSING,
+    CompiledQuery,
+    InternTable,
     RelationshipResolver,
     Route,
     as_chunks,
+    as_sized_chunks,
+    as_url_chunks,
     calculate_limits,
     clean_isoformat,
+    decode_json,
+    default_decode_executor,
     delta_to_iso,
+    from_json,
+    get_image_dimensions,
+    get_image_mime_type,
     iso_to_delta,
     php_query_builder,
     to_camel_case,
@@ -51,6 +64,7 @@ from hondana.utils import (
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from hondana.types_.relationship import RelationshipResponse
     from hondana.utils import MANGADEX_QUERY_PARAM_TYPE
 
 
@@ -124,6 +138,25 @@ class TestUtils:
     def test_as_chunks(self, source: Iterable[T], chunk_size: int, chunked: Iterable[Iterable[T]]) -> None:
         assert list(as_chunks(source, chunk_size)) == chunked
 
+    def test_as_sized_chunks(self) -> None:
+        sizes = [5, 5, 1, 1, 1, 12, 3, 3]
+        chunks = list(as_sized_chunks(sizes, lambda size: size, max_size=3, max_weight=10))
+        # each chunk is cut at the weight or the count, and an item over the weight is alone
+        assert chunks == [[5, 5], [1, 1, 1], [12], [3, 3]]
+
+    def test_as_url_chunks(self) -> None:
+        ids = [f"{index:08d}-0000-0000-0000-000000000000" for index in range(250)]
+
+        # limited by count
+        chunks = list(as_url_chunks(ids, "ids"))
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+        assert [item for chunk in chunks for item in chunk] == ids
+
+        # limited by the encoded ``ids%5B%5D=<id>&`` length of 47 characters
+        chunks = list(as_url_chunks(ids, "ids", max_length=47 * 30))
+        assert [len(chunk) for chunk in chunks] == [30] * 8 + [10]
+        assert [item for chunk in chunks for item in chunk] == ids
+
     @pytest.mark.parametrize(
         "limit, offset, max_limit, output",
         [
@@ -183,6 +216,33 @@ class TestUtils:
     ) -> None:
         assert php_query_builder(input_) == output
 
+    def test_compiled_query(self) -> None:
+        params: MANGADEX_QUERY_PARAM_TYPE = {"limit": 10, "offset": 0, "ids": ["a", "b"], "hasAvailableChapters": True}
+        compiled = CompiledQuery(params)
+
+        # the same parameters as building it directly, with the pagination moved to the end
+        assert sorted(compiled.to_multidict().items(), key=repr) == sorted(php_query_builder(params).items(), key=repr)
+        assert compiled.static == (("ids[]", "a"), ("ids[]", "b"), ("hasAvailableChapters", "true"))
+
+        second = compiled.with_page(limit=10, offset=10)
+        assert second.static is compiled.static
+        assert second != compiled
+        assert second.to_multidict().getone("offset") == 10
+        assert compiled.to_multidict().getone("offset") == 0
+        assert len({compiled, CompiledQuery(params), second}) == 2
+
+        # bools and their PHP strings build the same query, so they share a key
+        assert CompiledQuery.params_key({"value": True, "offset": 1}) == CompiledQuery.params_key({"value": "true"})
+
+    def test_compile_query_reuse(self) -> None:
+        http = HTTPClient()
+        first = http.compile_query({"limit": 100, "offset": 0, "includes": ["manga"]})
+        second = http.compile_query({"limit": 100, "offset": 100, "includes": ["manga"]})
+
+        assert first.static is second.static
+        assert (first.offset, second.offset) == (0, 100)
+        assert http.compile_query({"limit": 100, "offset": 0, "includes": ["user"]}).static is not first.static
+
     @pytest.mark.parametrize(
         "input_, output",
         [("some_value", "someValue"), ("some_other_value", "someOtherValue"), ("manga_or_chapter", "mangaOrChapter")],
@@ -285,3 +345,128 @@ class TestUtils:
     )
     def test_path_sorter(self, input_: list[pathlib.Path], output: list[pathlib.Path]) -> None:
         assert sorted(input_, key=upload_file_sort) == output
+
+    @pytest.mark.parametrize(
+        "data, mime_type",
+        [
+            (b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", 800, 1200), "image/png"),
+            (b"GIF89a" + struct.pack("<HH", 800, 1200), "image/gif"),
+            (
+                b"RIFF\x00\x00\x00\x00WEBPVP8X" + bytes(8) + (799).to_bytes(3, "little") + (1199).to_bytes(3, "little"),
+                "image/webp",
+            ),
+            (
+                b"RIFF\x00\x00\x00\x00WEBPVP8L" + bytes(5) + (799 | 1199 << 14).to_bytes(4, "little"),
+                "image/webp",
+            ),
+            (
+                b"\xff\xd8\xff\xe1" + struct.pack(">H", 6) + b"Exif" + b"\xff\xc0" + struct.pack(">HBHH", 17, 8, 1200, 800),
+                "image/jpeg",
+            ),
+        ],
+    )
+    def test_image_dimensions(self, data: bytes, mime_type: str) -> None:
+        assert get_image_mime_type(data) == mime_type
+        assert get_image_dimensions(data) == (800, 1200)
+
+    def test_image_dimensions_missing(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported"):
+            get_image_dimensions(b"not an image")
+        with pytest.raises(ValueError, match="dimensions"):
+            get_image_dimensions(b"\xff\xd8\xff\xe1\x10\x00")
+
+
+def _fresh(value: str, /) -> str:
+    # round-trip to get a distinct (non-interned) str instance
+    return value.encode().decode()
+
+
+class TestDecodeExecutor:
+    def test_decode_json_shares_strings(self) -> None:
+        payload = decode_json(b'{"data": [{"type": "manga", "lang": "en"}, {"type": "manga", "lang": "en"}]}')
+
+        first, second = payload["data"]
+        assert first == second
+        assert first["type"] is second["type"]
+        assert first["lang"] is second["lang"]
+
+    def test_process_pool_roundtrip(self) -> None:
+        with ProcessPoolExecutor(1) as executor:
+            payload = executor.submit(decode_json, b'{"data": [{"lang": "en"}, {"lang": "en"}]}').result()
+
+        # the shared strings survive pickling, so each distinct value is only sent and held once
+        assert payload["data"][0]["lang"] is payload["data"][1]["lang"]
+
+    def test_default_executor_is_threaded(self) -> None:
+        # a process pool's result is unpickled on the event loop, which costs about as much as decoding there
+        with default_decode_executor(1) as executor:
+            assert isinstance(executor, ThreadPoolExecutor)
+
+    @pytest.mark.asyncio
+    async def test_large_bodies_use_executor(self) -> None:
+        decoded: list[bytes] = []
+
+        class Executor(ThreadPoolExecutor):
+            def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Any:
+                # a thread shares its result with the loop, so the strings aren't shared for pickling
+                assert fn is from_json
+                decoded.append(args[0])
+                return super().submit(fn, *args, **kwargs)
+
+        def response(body: bytes) -> Any:
+            async def read() -> bytes:
+                return body
+
+            return SimpleNamespace(headers={"content-type": "application/json"}, read=read)
+
+        with Executor(1) as executor:
+            http = HTTPClient(decode_executor=executor, decode_threshold=32)
+            small = b'{"result": "ok"}'
+            large = b'{"result": "ok", "data": ["' + b"a" * 64 + b'"]}'
+
+            assert await http._decode(response(small)) == {"result": "ok"}  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+            assert await http._decode(response(large)) == {"result": "ok", "data": ["a" * 64]}  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+            assert await http._decode(response(b"not json" * 8)) == "not json" * 8  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+
+        assert decoded == [large, b"not json" * 8]
+
+
+class TestInternTable:
+    def test_intern(self) -> None:
+        table = InternTable()
+        first = _fresh("en")
+        second = _fresh("en")
+        assert first is not second
+
+        assert table(first) is first
+        assert table(second) is first
+        assert len(table) == 1
+
+        table.clear()
+        assert len(table) == 0
+
+    def test_update(self) -> None:
+        table = InternTable()
+        shared = table(_fresh("ja"))
+        mapping: dict[str, Any] = {"lang": _fresh("ja"), "langs": [_fresh("ja")], "num": 1}
+
+        table.update(mapping, "lang", "langs", "num", "missing")
+        assert mapping["lang"] is shared
+        assert mapping["langs"][0] is shared
+        assert mapping["num"] == 1
+
+    def test_relationship_resolver_interning(self) -> None:
+        table = InternTable()
+        relationships: list[RelationshipResponse] = [
+            {"id": _fresh("ab"), "type": "author"},  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+            {"id": _fresh("ab"), "type": "author"},  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+            {"id": _fresh("cd"), "type": "cover_art"},  # pyright: ignore[reportAssignmentType] # this is just for test purposes.
+        ]
+
+        resolved = RelationshipResolver[dict[str, str]](relationships, "author", intern_table=table).resolve()
+        assert resolved[0]["id"] is resolved[1]["id"]
+
+        # a cover's ID is unique to its manga, so only its type is interned
+        RelationshipResolver[dict[str, str]](relationships, "cover_art", intern_table=table).resolve()
+        assert "cd" not in table._strings  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
+        assert "cover_art" in table._strings  # pyright: ignore[reportPrivateUsage] # sorry, need this for test purposes
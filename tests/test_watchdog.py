@@ -0,0 +1,122 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-Present AbstractUmbra
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Self
+
+import pytest
+from yarl import URL
+
+from hondana.http import HTTPClient
+from hondana.utils import Route
+from hondana.watchdog import LoopWatchdog, current_operation, operation
+
+
+class TestWatchdog:
+    def test_operation_nesting(self) -> None:
+        assert current_operation.get() is None
+
+        with operation("outer"):
+            assert current_operation.get() == "outer"
+            with operation("inner"):
+                assert current_operation.get() == "inner"
+            assert current_operation.get() == "outer"
+
+        assert current_operation.get() is None
+
+    @pytest.mark.asyncio
+    async def test_blocking_is_attributed(self) -> None:
+        blocks: list[tuple[str | None, float]] = []
+
+        def on_block(name: str | None, lag: float) -> None:
+            blocks.append((name, lag))
+
+        async def blocking() -> None:
+            with operation("test.block"):
+                time.sleep(0.3)  # noqa: ASYNC251 # this is the point of the test
+
+        async with LoopWatchdog(threshold=0.1, interval=0.01, on_block=on_block) as watchdog:
+            await asyncio.sleep(0.05)
+            await asyncio.create_task(blocking())
+            await asyncio.sleep(0.05)
+
+        assert not watchdog.running
+        assert [name for name, _ in blocks] == ["test.block"]
+
+        (report,) = watchdog.report()
+        assert report.operation == "test.block"
+        assert report.count == 1
+        assert report.worst >= 0.25
+
+        watchdog.reset()
+        assert watchdog.report() == []
+
+    @pytest.mark.asyncio
+    async def test_stop_while_blocked(self) -> None:
+        watchdog = LoopWatchdog(threshold=0.1, interval=0.01)
+        watchdog.start()
+        await asyncio.sleep(0.2)
+        # the watchdog thread is waiting on a ping when the loop calls ``stop``
+        time.sleep(0.3)  # noqa: ASYNC251 # this is the point of the test
+
+        start = time.perf_counter()
+        watchdog.stop()
+
+        assert time.perf_counter() - start < 0.5
+        assert not watchdog.running
+
+    @pytest.mark.asyncio
+    async def test_request_sets_operation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        seen: list[str | None] = []
+
+        class FakeResponse:
+            status = 200
+            headers: dict[str, str] = {}  # noqa: RUF012 # a stand-in for the real response
+            content_type = "application/json"
+            url = URL("https://api.mangadex.org/manga")
+
+            async def __aenter__(self) -> Self:
+                seen.append(current_operation.get())
+                return self
+
+            async def __aexit__(self, *_: object) -> None:
+                pass
+
+        class FakeSession:
+            def request(self, *_: Any, **__: Any) -> FakeResponse:
+                return FakeResponse()
+
+        async def decode(_: HTTPClient, __: Any) -> dict[str, Any]:
+            return {"result": "ok"}
+
+        monkeypatch.setattr(HTTPClient, "_decode", decode)
+        http = HTTPClient()
+        http._session = FakeSession()  # pyright: ignore[reportAttributeAccessIssue,reportPrivateUsage] # sorry, need this for test purposes
+
+        assert await http.request(Route("GET", "/manga")) == {"result": "ok"}
+        assert seen == ["GET /manga"]
+        assert current_operation.get() is None